@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 from argparse import ArgumentParser
+from contextlib import ExitStack
+from pathlib import Path
 from typing import Any
 
 from pipescaler.common import CommandLineInterface
+from pipescaler.common.instrumentation import Instrumentation, measure
+from pipescaler.common.tracing import Tracer
 from pipescaler.image.cli import ImageCli
 
 __all__ = ["PipeScalerCli"]
@@ -25,8 +29,25 @@ class PipeScalerCli(CommandLineInterface):
         """
         super().add_arguments_to_argparser(parser)
 
+        parser.add_argument(
+            "--profile",
+            metavar="PATH",
+            required=False,
+            type=str,
+            help="save time and throughput of components to PATH, as CSV if PATH ends "
+            "in '.csv' and otherwise as JSON",
+        )
+        parser.add_argument(
+            "--trace",
+            metavar="PATH",
+            required=False,
+            type=str,
+            help="save trace of execution to PATH as Chrome trace event JSON, which "
+            "may be opened in Perfetto",
+        )
+
         subparsers = parser.add_subparsers(
-            dest="subcommand",
+            dest="command",
             help="subcommand",
             required=True,
         )
@@ -36,9 +57,24 @@ class PipeScalerCli(CommandLineInterface):
     @classmethod
     def _main(cls, **kwargs: Any):
         """Execute with provided keyword arguments."""
-        subcommand_name = kwargs.pop("subcommand")
+        profile = kwargs.pop("profile", None)
+        trace = kwargs.pop("trace", None)
+        subcommand_name = kwargs.pop("command")
         subcommand_cli_class = cls.subcommands()[subcommand_name]
-        subcommand_cli_class._main(**kwargs)
+        if profile is None and trace is None:
+            subcommand_cli_class._main(**kwargs)
+            return
+
+        with ExitStack() as stack:
+            if profile is not None:
+                if Path(profile).suffix.lower() == ".csv":
+                    stack.enter_context(Instrumentation(csv_path=profile))
+                else:
+                    stack.enter_context(Instrumentation(json_path=profile))
+            if trace is not None:
+                stack.enter_context(Tracer(trace))
+            with measure("cli", subcommand_cli_class.__name__):
+                subcommand_cli_class._main(**kwargs)
 
     @classmethod
     def subcommands(cls) -> dict[str, type[ImageCli]]:
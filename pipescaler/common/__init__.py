@@ -5,8 +5,8 @@
 This module should not import from other modules outside the standard library.
 
 Hierarchy within module:
-* csv / exception / file / logs / subprocess
-* command_line_interface / validation
+* csv / exception / file / instrumentation / lazy / logs / subprocess
+* command_line_interface / tracing / validation
 * argument_parsing / testing
 """
 
@@ -6,31 +6,70 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from errno import EOPNOTSUPP
+from hashlib import blake2b, file_digest
 from logging import getLogger
-from os import remove
+from os import W_OK, access, link, remove, symlink
 from pathlib import Path
-from shutil import move, rmtree
+from shutil import copyfile, move, rmtree
 from tempfile import NamedTemporaryFile, mkdtemp
+from typing import Literal, get_args
 
 __all__ = [
+    "LinkStrategy",
+    "get_file_digest",
     "get_temp_directory_path",
     "get_temp_file_path",
+    "link_file",
     "rename_preexisting_output_path",
 ]
 
 logger = getLogger(__name__)
 
+type LinkStrategy = Literal["copy", "hardlink", "reflink", "symlink"]
+"""Strategies with which a file may be linked to another path."""
+
+
+def get_file_digest(path: Path) -> str:
+    """Get digest of a file's contents.
+
+    Arguments:
+        path: Path to file
+    Returns:
+        Hexadecimal BLAKE2b digest of file's contents
+    """
+    with open(path, "rb") as infile:
+        return file_digest(infile, lambda: blake2b(digest_size=16)).hexdigest()
+
+
+def _get_in_memory_temp_dir_path() -> Path | None:
+    """Get path to a directory on a memory-backed filesystem, if available.
+
+    Returns:
+        Path to /dev/shm if it is a writable directory, otherwise None
+    """
+    path = Path("/dev/shm")
+    if path.is_dir() and access(path, W_OK):
+        return path
+    return None
+
 
 @contextmanager
-def get_temp_directory_path() -> Generator[Path]:
+def get_temp_directory_path(*, in_memory: bool = False) -> Generator[Path]:
     """Provide path to a temporary directory and remove it once no longer needed.
 
+    Arguments:
+        in_memory: Whether to create directory on a memory-backed filesystem, if
+          available, rather than in the default location for temporary files
     Returns:
         Path to temporary directory
     """
     temp_directory_path = None
     try:
-        temp_directory_path = Path(mkdtemp()).resolve()
+        temp_dir = None
+        if in_memory:
+            temp_dir = _get_in_memory_temp_dir_path()
+        temp_directory_path = Path(mkdtemp(dir=temp_dir)).resolve()
         yield temp_directory_path
     finally:
         if temp_directory_path:
@@ -38,17 +77,24 @@ def get_temp_directory_path() -> Generator[Path]:
 
 
 @contextmanager
-def get_temp_file_path(suffix: str | None = None) -> Generator[Path]:
+def get_temp_file_path(
+    suffix: str | None = None, *, in_memory: bool = False
+) -> Generator[Path]:
     """Provide path to a temporary file and remove it once no longer needed.
 
     Arguments:
         suffix: Suffix of named temporary file
+        in_memory: Whether to place file on a memory-backed filesystem, if available,
+          rather than in the default location for temporary files
     Returns:
         Path to temporary file
     """
     temp_file_path = None
     try:
-        temp_file = NamedTemporaryFile(delete=False, suffix=suffix)
+        temp_dir = None
+        if in_memory:
+            temp_dir = _get_in_memory_temp_dir_path()
+        temp_file = NamedTemporaryFile(delete=False, suffix=suffix, dir=temp_dir)
         temp_file.close()
         temp_file_path = Path(temp_file.name)
         remove(temp_file_path)
@@ -64,6 +110,56 @@ def get_temp_file_path(suffix: str | None = None) -> Generator[Path]:
                 )
 
 
+def link_file(
+    source_path: Path, output_path: Path, strategy: LinkStrategy = "copy"
+) -> LinkStrategy:
+    """Link or copy a file to an output path, replacing any existing file.
+
+    Hardlinks share storage with the source file, such that writing to either file in
+    place changes both; reflinks share storage only until either file is written;
+    symlinks refer to the absolute path of the source file. If the strategy is not
+    supported by the platform or filesystem, for example because the source and output
+    paths are on different filesystems, the file is copied instead.
+
+    Arguments:
+        source_path: Path to source file
+        output_path: Path to which to link or copy source file
+        strategy: Strategy with which to link file
+    Returns:
+        Strategy with which file was actually linked
+    Raises:
+        ValueError: If strategy is not supported
+    """
+    if strategy not in get_args(LinkStrategy.__value__):
+        raise ValueError(
+            f"Link strategy '{strategy}' is not one of "
+            f"{get_args(LinkStrategy.__value__)}"
+        )
+    if output_path.exists() or output_path.is_symlink():
+        remove(output_path)
+
+    try:
+        if strategy == "hardlink":
+            link(source_path, output_path)
+            return strategy
+        if strategy == "reflink":
+            _reflink_file(source_path, output_path)
+            return strategy
+        if strategy == "symlink":
+            symlink(source_path.resolve(), output_path)
+            return strategy
+    except OSError as exc:
+        logger.debug(
+            f"Unable to {strategy} '{source_path}' to '{output_path}' ('{exc}'); "
+            f"copying instead"
+        )
+        if output_path.exists() or output_path.is_symlink():
+            remove(output_path)
+
+    copyfile(source_path, output_path)
+    return "copy"
+
+
 def rename_preexisting_output_path(output_path: Path):
     """Check if a proposed output file exists, and if so rename the existing file.
 
@@ -80,3 +176,21 @@ def rename_preexisting_output_path(output_path: Path):
                 move(output_path, backup_path)
                 break
             backup_i += 1
+
+
+def _reflink_file(source_path: Path, output_path: Path):
+    """Reflink a file using the FICLONE ioctl.
+
+    Arguments:
+        source_path: Path to source file
+        output_path: Path to which to reflink source file
+    Raises:
+        OSError: If reflinks are not supported by the platform or filesystem
+    """
+    try:
+        from fcntl import FICLONE, ioctl  # noqa: PLC0415
+    except ImportError as exc:
+        raise OSError(EOPNOTSUPP, "Reflinks are not supported on platform") from exc
+
+    with open(source_path, "rb") as infile, open(output_path, "wb") as outfile:
+        ioctl(outfile.fileno(), FICLONE, infile.fileno())
@@ -0,0 +1,399 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Instrumentation of the time and throughput of components of a program."""
+
+from __future__ import annotations
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import wraps
+from logging import info
+from os import getpid
+from pathlib import Path
+from threading import Lock, get_ident, local
+from time import perf_counter, thread_time
+from types import TracebackType
+from typing import Any, Self
+
+__all__ = [
+    "Instrumentation",
+    "Measurement",
+    "Recorder",
+    "instrumented",
+    "measure",
+]
+
+_recorders: list[Recorder] = []
+"""Active recorders, to which measurements are recorded."""
+_calls = local()
+"""Per-thread state of instrumented calls in progress."""
+
+
+class Measurement:
+    """Measurement of a single call of a component."""
+
+    def __init__(
+        self,
+        category: str,
+        component: str,
+        checkpoint: str | None = None,
+        subject: str | None = None,
+    ):
+        """Initialize.
+
+        Arguments:
+            category: Category of component, such as 'segment' or 'runner'
+            component: Name of component
+            checkpoint: Name of checkpoint with which call is associated, if any
+            subject: Description of object on which call acts, if any
+        """
+        self.category = category
+        """Category of component"""
+        self.component = component
+        """Name of component"""
+        self.checkpoint = checkpoint
+        """Name of checkpoint with which call is associated"""
+        self.subject = subject
+        """Description of object on which call acts"""
+        self.start = 0.0
+        """Performance counter at start of call, in seconds"""
+        self.wall_time = 0.0
+        """Wall time of call, in seconds"""
+        self.cpu_time = 0.0
+        """CPU time of calling thread during call, in seconds"""
+        self.n_bytes = 0
+        """Number of bytes read or written by call"""
+        self.n_pixels = 0
+        """Number of pixels decoded, encoded, or produced by call"""
+        self.thread_id = get_ident()
+        """Identifier of thread in which call was made"""
+        self.process_id = getpid()
+        """Identifier of process in which call was made"""
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"category={self.category!r}, "
+            f"component={self.component!r}, "
+            f"checkpoint={self.checkpoint!r}, "
+            f"subject={self.subject!r})"
+        )
+
+
+class Recorder(ABC):
+    """Abstract base class for recorders of measurements.
+
+    While active, as a context manager, measurements of instrumented components are
+    passed to the recorder as they complete, from whichever thread made them.
+    """
+
+    def __enter__(self) -> Self:
+        """Start recording."""
+        _recorders.append(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        """Stop recording and close."""
+        _recorders.remove(self)
+        self.close()
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"<{self.__class__.__name__}>"
+
+    @abstractmethod
+    def close(self):
+        """Finish recording, such as by saving recorded measurements."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def record(self, measurement: Measurement):
+        """Record a measurement.
+
+        Arguments:
+            measurement: Measurement to record
+        """
+        raise NotImplementedError()
+
+
+class Instrumentation(Recorder):
+    """Registry of the time and throughput of components of a program.
+
+    While active, as a context manager, calls of instrumented components are recorded
+    and aggregated by category, component, and checkpoint; on exit, a summary table is
+    logged and optionally saved as JSON and/or CSV. Times of calls include those of
+    instrumented calls nested within them. While no registry is active, instrumented
+    components incur only the cost of checking whether one is.
+    """
+
+    fields = (
+        "category",
+        "component",
+        "checkpoint",
+        "calls",
+        "wall_time",
+        "cpu_time",
+        "n_bytes",
+        "n_pixels",
+    )
+    """Fields of each row of summary."""
+
+    def __init__(
+        self,
+        json_path: Path | str | None = None,
+        csv_path: Path | str | None = None,
+    ):
+        """Initialize.
+
+        Arguments:
+            json_path: Path to which to save summary as JSON on exit, if any
+            csv_path: Path to which to save summary as CSV on exit, if any
+        """
+        self.json_path: Path | None = None
+        """Path to which to save summary as JSON on exit"""
+        if json_path is not None:
+            self.json_path = Path(json_path)
+        self.csv_path: Path | None = None
+        """Path to which to save summary as CSV on exit"""
+        if csv_path is not None:
+            self.csv_path = Path(csv_path)
+        self.totals: dict[tuple[str, str, str], dict[str, Any]] = {}
+        """Totals by category, component, and checkpoint"""
+
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"json_path={self.json_path!r}, "
+            f"csv_path={self.csv_path!r})"
+        )
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Totals by category, component, and checkpoint, by decreasing wall time."""
+        with self._lock:
+            rows = [dict(row) for row in self.totals.values()]
+        return sorted(rows, key=lambda row: row["wall_time"], reverse=True)
+
+    def close(self):
+        """Log summary, and save it if configured."""
+        info(f"{self}: summary\n{self.get_summary()}")
+        if self.json_path is not None:
+            self.save_json(self.json_path)
+        if self.csv_path is not None:
+            self.save_csv(self.csv_path)
+
+    def get_summary(self) -> str:
+        """Get summary of totals as a table.
+
+        Returns:
+            Summary table
+        """
+        headers = (
+            "Category",
+            "Component",
+            "Checkpoint",
+            "Calls",
+            "Wall (s)",
+            "CPU (s)",
+            "MB",
+            "Megapixels",
+        )
+        table = [headers]
+        table.extend(
+            (
+                row["category"],
+                row["component"],
+                row["checkpoint"],
+                str(row["calls"]),
+                f"{row['wall_time']:.3f}",
+                f"{row['cpu_time']:.3f}",
+                f"{row['n_bytes'] / 1e6:.2f}",
+                f"{row['n_pixels'] / 1e6:.2f}",
+            )
+            for row in self.rows
+        )
+        widths = [max(len(line[i]) for line in table) for i in range(len(headers))]
+        lines = []
+        for line in table:
+            cells = []
+            for i, cell in enumerate(line):
+                if i < 3:
+                    cells.append(cell.ljust(widths[i]))
+                else:
+                    cells.append(cell.rjust(widths[i]))
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def record(self, measurement: Measurement):
+        """Record a measurement.
+
+        Arguments:
+            measurement: Measurement to record
+        """
+        checkpoint = measurement.checkpoint or ""
+        key = (measurement.category, measurement.component, checkpoint)
+        with self._lock:
+            row = self.totals.get(key)
+            if row is None:
+                row = {
+                    "category": measurement.category,
+                    "component": measurement.component,
+                    "checkpoint": checkpoint,
+                    "calls": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "n_bytes": 0,
+                    "n_pixels": 0,
+                }
+                self.totals[key] = row
+            row["calls"] += 1
+            row["wall_time"] += measurement.wall_time
+            row["cpu_time"] += measurement.cpu_time
+            row["n_bytes"] += measurement.n_bytes
+            row["n_pixels"] += measurement.n_pixels
+
+    def save_csv(self, path: Path | str):
+        """Save totals as CSV.
+
+        Arguments:
+            path: Path to which to save totals
+        """
+        with open(path, "w", encoding="utf-8", newline="") as outfile:
+            writer = csv.DictWriter(outfile, fieldnames=self.fields)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        info(f"{self}: summary saved to '{path}'")
+
+    def save_json(self, path: Path | str):
+        """Save totals as JSON.
+
+        Arguments:
+            path: Path to which to save totals
+        """
+        with open(path, "w", encoding="utf-8") as outfile:
+            json.dump(self.rows, outfile, indent=2)
+        info(f"{self}: summary saved to '{path}'")
+
+
+@contextmanager
+def measure(
+    category: str,
+    component: str,
+    checkpoint: str | None = None,
+    subject: object | None = None,
+) -> Generator[Measurement | None]:
+    """Measure a block of code, if instrumentation is active.
+
+    Measurements made within the block are associated with its checkpoint, unless
+    they specify their own.
+
+    Arguments:
+        category: Category of component, such as 'segment' or 'runner'
+        component: Name of component
+        checkpoint: Name of checkpoint with which block is associated; if None, that
+          of the enclosing block, if any
+        subject: Object on which block acts, if any, described by its string
+          representation only if instrumentation is active
+    Returns:
+        Measurement, to which the block may add bytes and pixels, if instrumentation is
+        active, otherwise None
+    """
+    if not _recorders:
+        yield None
+        return
+
+    outer_checkpoint = getattr(_calls, "checkpoint", None)
+    if checkpoint is None:
+        checkpoint = outer_checkpoint
+    measurement = Measurement(category, component, checkpoint)
+    if subject is not None:
+        measurement.subject = str(subject)
+    _calls.checkpoint = checkpoint
+    measurement.start = perf_counter()
+    cpu_start = thread_time()
+    try:
+        yield measurement
+    finally:
+        measurement.wall_time = perf_counter() - measurement.start
+        measurement.cpu_time = thread_time() - cpu_start
+        _calls.checkpoint = outer_checkpoint
+        for recorder in _recorders:
+            recorder.record(measurement)
+
+
+def instrumented[F: Callable[..., Any]](
+    category: str,
+    counter: str | None = None,
+) -> Callable[[F], F]:
+    """Get decorator that measures calls of a method, if instrumentation is active.
+
+    Calls are attributed to the class of the object whose method is called, and are
+    described as acting on the first positional argument of the call or, if there is
+    none, on its return value. If the method calls the same method of a parent class,
+    only the outermost call is measured.
+
+    Arguments:
+        category: Category of component, such as 'segment' or 'runner'
+        counter: Name of method of object, accepting positional arguments and return
+          value of call and returning number of bytes and pixels processed by call
+    Returns:
+        Decorator that measures calls of a method
+    """
+
+    def decorator(method: F) -> F:
+        """Wrap method to measure its calls.
+
+        Arguments:
+            method: Method to wrap
+        Returns:
+            Wrapped method
+        """
+        if getattr(method, "__instrumented__", False):
+            return method
+
+        @wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            """Call method, measuring call if instrumentation is active."""
+            if not _recorders:
+                return method(self, *args, **kwargs)
+
+            stack = getattr(_calls, "stack", None)
+            if stack is None:
+                stack = _calls.stack = []
+            call = (id(self), category)
+            if stack and stack[-1] == call:
+                return method(self, *args, **kwargs)
+
+            stack.append(call)
+            try:
+                with measure(category, type(self).__name__) as measurement:
+                    result = method(self, *args, **kwargs)
+                    if measurement is not None:
+                        if args:
+                            measurement.subject = str(args[0])
+                        elif result is not None:
+                            measurement.subject = str(result)
+                        if counter is not None:
+                            measurement.n_bytes, measurement.n_pixels = getattr(
+                                self, counter
+                            )(args, result)
+            finally:
+                stack.pop()
+            return result
+
+        wrapper.__instrumented__ = True  # ty: ignore[unresolved-attribute]
+        return wrapper  # ty: ignore[invalid-return-type]
+
+    return decorator
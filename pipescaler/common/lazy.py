@@ -0,0 +1,49 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Lazy importing of the public names of packages."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib import import_module
+from sys import modules as loaded_modules
+from typing import Any
+
+__all__ = ["lazy_getattr"]
+
+
+def lazy_getattr(package_name: str, modules: dict[str, str]) -> Callable[[str], Any]:
+    """Get module-level __getattr__ that imports a package's names on first access.
+
+    Importing a package with such a __getattr__ does not import its modules; each is
+    imported only when one of its names is first accessed, after which the name is
+    stored in the package so that later accesses do not call __getattr__. This allows
+    packages whose modules import expensive dependencies to be imported cheaply.
+
+    Arguments:
+        package_name: Name of package
+        modules: Names of modules, relative to package, by name they provide
+    Returns:
+        Module-level __getattr__ for package
+    """
+
+    def get_attribute(name: str) -> Any:
+        """Import a name from its module within package.
+
+        Arguments:
+            name: Name to import
+        Returns:
+            Imported object
+        Raises:
+            AttributeError: If name is not provided by any module within package
+        """
+        module_name = modules.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module '{package_name}' has no attribute '{name}'", name=name
+            )
+        value = getattr(import_module(f".{module_name}", package_name), name)
+        setattr(loaded_modules[package_name], name, value)
+        return value
+
+    return get_attribute
@@ -81,6 +81,58 @@ def run_command(
     return exitcode, stdout_str, stderr_str
 
 
+def run_command_piped(
+    command: list[str],
+    input_bytes: bytes,
+    timeout: int = 600,
+    acceptable_exitcodes: Iterable[int] | None = None,
+) -> tuple[int, bytes, str]:
+    """Run a provided command, writing input to its stdin and reading its stdout.
+
+    Arguments:
+        command: command to run as a list of arguments
+        input_bytes: bytes to write to command's standard input
+        timeout: maximum time to await command's completion
+        acceptable_exitcodes: acceptable exit codes
+    Returns:
+        exitcode, standard output as bytes, and standard error
+    Raises:
+        ValueError: If exitcode is not one of acceptable_exitcodes
+        TimeoutExpired: If command does not complete before timeout
+    """
+    if acceptable_exitcodes is None:
+        acceptable_exitcodes = [0]
+
+    with Popen(command, stdin=PIPE, stdout=PIPE, stderr=PIPE) as child:
+        try:
+            stdout, stderr = child.communicate(input=input_bytes, timeout=timeout)
+        except TimeoutExpired as exception:
+            child.kill()
+            stdout, stderr = child.communicate()
+            raise TimeoutExpired(
+                command,
+                timeout,
+                output=stdout,
+                stderr=_decode_output(stderr),
+            ) from exception
+
+        stderr_str = _decode_output(stderr)
+
+        exitcode = child.returncode
+
+        if exitcode not in acceptable_exitcodes:
+            command_str = " ".join(command)
+            raise ValueError(
+                f"subprocess for command:\n"
+                f"{command_str}\n\n"
+                f"failed with exit code {exitcode};\n\n"
+                f"STDERR:\n"
+                f"{stderr_str}"
+            )
+
+    return exitcode, stdout, stderr_str
+
+
 def run_command_live(
     command: list[str],
     timeout: int | None = 43200,
@@ -190,4 +242,5 @@ def run_command_live(
 __all__ = [
     "run_command",
     "run_command_live",
+    "run_command_piped",
 ]
@@ -0,0 +1,110 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tracing of the execution of components of a program as Chrome trace events."""
+
+from __future__ import annotations
+
+import json
+from logging import info
+from pathlib import Path
+from threading import Lock, current_thread
+from time import perf_counter
+from typing import Any, Self
+
+from .instrumentation import Measurement, Recorder
+
+__all__ = ["Tracer"]
+
+
+class Tracer(Recorder):
+    """Tracer of the execution of components of a program as Chrome trace events.
+
+    While active, as a context manager, each call of an instrumented component is
+    recorded as a span, carrying the identifiers of the process and thread in which it
+    was made and the object on which it acted; on exit, spans are saved as trace event
+    JSON, which may be opened in Perfetto or chrome://tracing. While no tracer is
+    active, instrumented components incur only the cost of checking whether one is.
+    """
+
+    def __init__(self, path: Path | str):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            path: Path to which to save trace on exit
+        """
+        self.path = Path(path)
+        """Path to which to save trace on exit"""
+        self.events: list[dict[str, Any]] = []
+        """Trace events recorded"""
+        self.thread_names: dict[tuple[int, int], str] = {}
+        """Names of threads by process and thread identifiers"""
+        self.origin = perf_counter()
+        """Performance counter at start of trace, in seconds"""
+
+        self._lock = Lock()
+
+    def __enter__(self) -> Self:
+        """Start recording."""
+        self.origin = perf_counter()
+        return super().__enter__()
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def close(self):
+        """Save trace."""
+        self.save(self.path)
+
+    def record(self, measurement: Measurement):
+        """Record a measurement as a span.
+
+        Arguments:
+            measurement: Measurement to record
+        """
+        args: dict[str, Any] = {}
+        if measurement.subject is not None:
+            args["subject"] = measurement.subject
+        if measurement.checkpoint is not None:
+            args["checkpoint"] = measurement.checkpoint
+        if measurement.n_bytes:
+            args["n_bytes"] = measurement.n_bytes
+        if measurement.n_pixels:
+            args["n_pixels"] = measurement.n_pixels
+        event = {
+            "name": measurement.component,
+            "cat": measurement.category,
+            "ph": "X",
+            "ts": (measurement.start - self.origin) * 1e6,
+            "dur": measurement.wall_time * 1e6,
+            "pid": measurement.process_id,
+            "tid": measurement.thread_id,
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+            thread_key = (measurement.process_id, measurement.thread_id)
+            if thread_key not in self.thread_names:
+                self.thread_names[thread_key] = current_thread().name
+
+    def save(self, path: Path | str):
+        """Save trace as trace event JSON.
+
+        Arguments:
+            path: Path to which to save trace
+        """
+        with self._lock:
+            events = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": process_id,
+                    "tid": thread_id,
+                    "args": {"name": name},
+                }
+                for (process_id, thread_id), name in self.thread_names.items()
+            ]
+            events.extend(sorted(self.events, key=lambda event: event["ts"]))
+        with open(path, "w", encoding="utf-8") as outfile:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, outfile)
+        info(f"{self}: trace saved to '{path}'")
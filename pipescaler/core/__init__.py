@@ -5,19 +5,24 @@
 This module may import from: common
 
 Hierarchy within module:
-* runner / sorting / utility
+* runner_cache / sorting / utility
+* runner
 * cli / typing
-* pipelines
+* pipelines / runner_pool
 """
 
 from __future__ import annotations
 
 from .runner import Runner
+from .runner_cache import RunnerCache
+from .runner_pool import RunnerPool
 from .typing import RunnerLike
 from .utility import Utility
 
 __all__ = [
     "Runner",
+    "RunnerCache",
+    "RunnerPool",
     "RunnerLike",
     "Utility",
 ]
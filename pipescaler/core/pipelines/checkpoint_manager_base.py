@@ -4,14 +4,20 @@
 
 from __future__ import annotations
 
+import json
 from abc import ABC
+from collections import Counter, defaultdict
 from collections.abc import Sequence
-from logging import warning
+from filecmp import cmp
+from logging import info, warning
 from pathlib import Path
 from platform import system
+from types import TracebackType
+from typing import Self
 
 from pipescaler.common.exception import UnsupportedPlatformError
-from pipescaler.common.validation import val_output_dir_path
+from pipescaler.common.file import LinkStrategy, link_file
+from pipescaler.common.validation import val_literal, val_output_dir_path
 
 from .pipe_object import PipeObject
 
@@ -19,38 +25,193 @@ __all__ = ["CheckpointManagerBase"]
 
 
 class CheckpointManagerBase(ABC):
-    """Abstract base class for checkpoint managers."""
+    """Abstract base class for checkpoint managers.
+
+    Outcomes of attempts to load each checkpoint are counted, as are the time spent
+    computing and bytes written to each checkpoint that was not loaded. Times are
+    saved to a file within the checkpoint directory, so that the time saved by
+    loading checkpoints may be estimated from earlier runs.
+
+    Used as a context manager, or when closed directly, a report is logged and times
+    are saved at the end of a run.
+    """
 
     SUPPORTED_MTIME_SYSTEMS = frozenset(("Darwin", "Linux", "Windows"))
     """Operating systems supported for mtime-based checkpoint validation."""
 
-    def __init__(self, dir_path: Path | str, *, validate_input_mtime: bool = False):
+    def __init__(
+        self,
+        dir_path: Path | str,
+        *,
+        validate_input_mtime: bool = False,
+        link_strategy: LinkStrategy = "copy",
+    ):
         """Initialize.
 
         Arguments:
             dir_path: Path to directory in which to store checkpoints
             validate_input_mtime: Whether to require checkpoint mtimes to be newer than
               or equal to input mtimes before loading from checkpoint
+            link_strategy: Strategy with which to link checkpoint files to other
+              checkpoints; falls back to copying if unsupported
         """
         self.dir_path = val_output_dir_path(dir_path)
         """Path to directory in which to store checkpoints."""
         self.validate_input_mtime = validate_input_mtime
         """Whether checkpoint validity is based on mtime and existence."""
+        self.link_strategy = val_literal(link_strategy, LinkStrategy)
+        """Strategy with which to link checkpoint files to other checkpoints."""
         self.observed_checkpoints: set[tuple[str, str]] = set()
         """Observed checkpoints as tuples of image and checkpoint names."""
+        self.counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        """Counts by checkpoint name of checkpoints 'loaded', 'computed', 'stale',
+        and 'missing', and of 'bytes' written."""
+        self.times: defaultdict[str, float] = defaultdict(float)
+        """Time in seconds spent computing checkpoints by checkpoint name."""
+        self.timings_path = self.dir_path / ".timings.json"
+        """Path to file of times spent computing checkpoints in earlier runs."""
+        self.historical_timings = self.load_timings()
+        """Number and total time in seconds of checkpoints computed in earlier runs,
+        by checkpoint name."""
+
+    def __enter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        """Exit context, closing manager."""
+        self.close()
 
     def __repr__(self) -> str:
         """Representation."""
         return (
             f"{self.__class__.__name__}("
             f"dir_path={self.dir_path!r}, "
-            f"validate_input_mtime={self.validate_input_mtime!r})"
+            f"validate_input_mtime={self.validate_input_mtime!r}, "
+            f"link_strategy={self.link_strategy!r})"
         )
 
     def __str__(self) -> str:
         """String representation."""
         return f"<{self.__class__.__name__}>"
 
+    def checkpoints_available(
+        self, inputs: Sequence[PipeObject], cpt_paths: Sequence[Path]
+    ) -> bool:
+        """Assess whether checkpoints exist and are current, counting the outcome.
+
+        Each checkpoint is counted as 'missing' if any checkpoint does not exist,
+        otherwise as 'stale' if any is not current, otherwise as 'loaded'.
+
+        Arguments:
+            inputs: Input objects whose source files determine checkpoint freshness
+            cpt_paths: Paths to checkpoints to assess
+        Returns:
+            Whether all checkpoints exist and should be treated as current
+        """
+        if not all(p.exists() for p in cpt_paths):
+            outcome = "missing"
+        elif not self.checkpoints_current(inputs, cpt_paths):
+            outcome = "stale"
+        else:
+            outcome = "loaded"
+        for cpt in dict.fromkeys(p.name for p in cpt_paths):
+            self.counts[cpt][outcome] += 1
+        return outcome == "loaded"
+
+    def close(self):
+        """Finish run, logging report and saving times spent computing checkpoints."""
+        info(f"{self}: report\n{self.get_report()}")
+        self.save_timings()
+
+    def get_report(self) -> str:
+        """Get report of checkpoints loaded, computed, and written, as a table.
+
+        Returns:
+            Report, including time saved by loading checkpoints, estimated from the
+            mean time spent computing each checkpoint in this and earlier runs
+        """
+        headers = (
+            "Checkpoint",
+            "Loaded",
+            "Computed",
+            "Stale",
+            "Missing",
+            "Written (MB)",
+            "Saved (s)",
+        )
+        totals = Counter()
+        table = [headers]
+        for cpt in sorted(self.counts):
+            counts = self.counts[cpt]
+            time_saved = self.get_time_saved(cpt)
+            totals.update(counts)
+            totals["time_saved"] += time_saved
+            table.append(
+                (
+                    cpt,
+                    str(counts["loaded"]),
+                    str(counts["computed"]),
+                    str(counts["stale"]),
+                    str(counts["missing"]),
+                    f"{counts['bytes'] / 1e6:.2f}",
+                    f"{time_saved:.1f}",
+                )
+            )
+        table.append(
+            (
+                "Total",
+                str(totals["loaded"]),
+                str(totals["computed"]),
+                str(totals["stale"]),
+                str(totals["missing"]),
+                f"{totals['bytes'] / 1e6:.2f}",
+                f"{totals['time_saved']:.1f}",
+            )
+        )
+
+        widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+        lines = []
+        for row in table:
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def get_time_saved(self, cpt: str) -> float:
+        """Estimate time saved by loading a checkpoint rather than computing it.
+
+        Arguments:
+            cpt: Checkpoint name
+        Returns:
+            Estimated time saved in seconds, or zero if the checkpoint has never been
+            computed
+        """
+        n_computed, total_time = self.historical_timings.get(cpt, (0, 0.0))
+        n_computed += self.counts[cpt]["computed"]
+        total_time += self.times[cpt]
+        if n_computed == 0:
+            return 0.0
+        return self.counts[cpt]["loaded"] * total_time / n_computed
+
+    def load_timings(self) -> dict[str, tuple[int, float]]:
+        """Load times spent computing checkpoints in earlier runs.
+
+        Returns:
+            Number and total time in seconds of checkpoints computed in earlier runs,
+            by checkpoint name
+        """
+        if not self.timings_path.exists():
+            return {}
+        with open(self.timings_path, encoding="utf-8") as infile:
+            timings = json.load(infile)
+        return {cpt: (int(n), float(seconds)) for cpt, (n, seconds) in timings.items()}
+
     def observe(self, location_name: str, cpt: str):
         """Log observation of a checkpoint.
 
@@ -70,6 +231,77 @@ class CheckpointManagerBase(ABC):
             location_name = location_name.rstrip(".")
         self.observed_checkpoints.add((location_name, cpt))
 
+    def record_computed(self, cpt: str, seconds: float, cpt_path: Path | None = None):
+        """Count a checkpoint as computed.
+
+        Arguments:
+            cpt: Checkpoint name
+            seconds: Time in seconds spent computing checkpoint
+            cpt_path: Path to which checkpoint was written, if any
+        """
+        self.counts[cpt]["computed"] += 1
+        self.times[cpt] += seconds
+        if cpt_path is not None and cpt_path.exists():
+            self.counts[cpt]["bytes"] += cpt_path.stat().st_size
+
+    def save_duplicate(self, input_obj: PipeObject, cpts: Sequence[str] | None = None):
+        """Save checkpoints of a duplicate object from those of its duplicated object.
+
+        Each checkpoint of the duplicated object is linked to the corresponding
+        checkpoint of the duplicate object, and observed.
+
+        Arguments:
+            input_obj: Duplicate object
+            cpts: Names of checkpoints to save; if None, all checkpoints observed for
+              the duplicated object
+        """
+        if input_obj.duplicate_of is None:
+            raise ValueError(f"{input_obj} is not a duplicate of another object.")
+        duplicated_location_name = input_obj.duplicate_of.location_name.rstrip(".")
+        duplicate_location_name = input_obj.location_name.rstrip(".")
+        if cpts is None:
+            cpts = sorted(
+                c
+                for ln, c in self.observed_checkpoints
+                if ln == duplicated_location_name
+            )
+        for c in cpts:
+            duplicated_path = self.dir_path / duplicated_location_name / c
+            duplicate_path = self.dir_path / duplicate_location_name / c
+            if not duplicated_path.exists():
+                continue
+            if duplicate_path.exists() and cmp(
+                duplicated_path, duplicate_path, shallow=False
+            ):
+                info(f"{self}: '{input_obj.location_name}' checkpoint '{c}' unchanged")
+            else:
+                if not duplicate_path.parent.exists():
+                    duplicate_path.parent.mkdir(parents=True)
+                    info(f"{self}: directory '{duplicate_path.parent}' created")
+                link_file(duplicated_path, duplicate_path, self.link_strategy)
+                info(
+                    f"{self}: '{input_obj.location_name}' checkpoint '{c}' linked "
+                    f"from '{input_obj.duplicate_of.location_name}'"
+                )
+            self.observe(input_obj.location_name, c)
+
+    def save_timings(self):
+        """Save times spent computing checkpoints in this and earlier runs.
+
+        Times are saved alongside those loaded from earlier runs on initialization, so
+        that saving more than once within a run does not count times twice.
+        """
+        timings = dict(self.historical_timings)
+        for cpt, time in self.times.items():
+            n_computed, total_time = timings.get(cpt, (0, 0.0))
+            timings[cpt] = (
+                n_computed + self.counts[cpt]["computed"],
+                total_time + time,
+            )
+        with open(self.timings_path, "w", encoding="utf-8") as outfile:
+            json.dump(timings, outfile, indent=2, sort_keys=True)
+        info(f"{self}: checkpoint timings saved to '{self.timings_path}'")
+
     def checkpoints_current(
         self, inputs: Sequence[PipeObject], cpt_paths: Sequence[Path]
     ) -> bool:
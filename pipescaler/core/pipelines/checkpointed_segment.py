@@ -8,6 +8,7 @@ from abc import ABC
 from collections.abc import Sequence
 
 from .checkpoint_manager_base import CheckpointManagerBase
+from .pipe_object import PipeObject
 from .segment import Segment
 from .typing import SegmentLike
 
@@ -65,3 +66,20 @@ class CheckpointedSegment(Segment, ABC):
             f"cpts={self.cpts!r}, "
             f"internal_cpts={self.internal_cpts!r})"
         )
+
+    def pass_duplicates(self, *input_objs: PipeObject) -> tuple[PipeObject, ...]:
+        """Pass input objects that duplicate earlier objects through unprocessed.
+
+        Checkpoints of the duplicated objects, including internal checkpoints, are
+        linked to those of the input objects.
+
+        Arguments:
+            input_objs: Input objects, each a duplicate of an earlier object
+        Returns:
+            Input objects, as passed through by wrapped segment if it is a Segment
+        """
+        for i in input_objs:
+            self.cp_manager.save_duplicate(i, [*self.cpts, *self.internal_cpts])
+        if isinstance(self.segment, Segment):
+            return self.segment.pass_duplicates(*input_objs)
+        return input_objs
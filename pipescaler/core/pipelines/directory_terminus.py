@@ -9,7 +9,8 @@ from logging import info
 from os import remove, rmdir
 from pathlib import Path
 
-from pipescaler.common.validation import val_output_dir_path
+from pipescaler.common.file import LinkStrategy
+from pipescaler.common.validation import val_literal, val_output_dir_path
 
 from .pipe_object import PipeObject
 from .terminus import Terminus
@@ -20,18 +21,25 @@ __all__ = ["DirectoryTerminus"]
 class DirectoryTerminus[T: PipeObject](Terminus[T], ABC):
     """Abstract base class for termini that write objects to an output directory."""
 
-    def __init__(self, dir_path: Path | str):
+    def __init__(self, dir_path: Path | str, *, link_strategy: LinkStrategy = "copy"):
         """Validate and store configuration and initialize.
 
         Arguments:
             dir_path: Path to directory to which to copy images
+            link_strategy: Strategy with which to link files of objects that have
+              paths into output directory; falls back to copying if unsupported
         """
         self.dir_path = val_output_dir_path(dir_path)
+        self.link_strategy = val_literal(link_strategy, LinkStrategy)
         self.observed_files: set[str] = set()
 
     def __repr__(self) -> str:
         """Representation."""
-        return f"{self.__class__.__name__}(dir_path={self.dir_path!r})"
+        return (
+            f"{self.__class__.__name__}("
+            f"dir_path={self.dir_path!r}, "
+            f"link_strategy={self.link_strategy!r})"
+        )
 
     def purge_unrecognized_files(self, dir_path: Path | None = None):
         """Remove unrecognized files and subdirectories in output directory."""
@@ -7,15 +7,19 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Self, cast
+from typing import Any, Self, cast
 
+from pipescaler.common.instrumentation import instrumented
 from pipescaler.common.validation import val_input_path
 
 __all__ = ["PipeObject"]
 
 
 class PipeObject(ABC):
-    """Abstract base class for object within pipelines."""
+    """Abstract base class for object within pipelines.
+
+    Saves of subclasses are measured while instrumentation is active.
+    """
 
     def __init__(
         self,
@@ -24,6 +28,7 @@ class PipeObject(ABC):
         name: str | None = None,
         parents: Self | Sequence[Self] | None = None,
         location_path: Path | None = None,
+        duplicate_of: Self | None = None,
     ):
         """Initialize.
 
@@ -34,6 +39,9 @@ class PipeObject(ABC):
               one of these must be available
             parents: Parent object(s) from which this object is descended
             location_path: Path relative to parent directory
+            duplicate_of: Object whose contents this object duplicates, if applicable;
+              segments pass duplicates through without processing them, and termini
+              fulfil them from the output of the duplicated object
         """
         self._path = None
         if path:
@@ -72,6 +80,14 @@ class PipeObject(ABC):
         else:
             self._location = None
 
+        self._duplicate_of = duplicate_of
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument saves of subclass."""
+        super().__init_subclass__(**kwargs)
+        if "save" in cls.__dict__:
+            cls.save = instrumented("save", "count_saved")(cls.__dict__["save"])
+
     def __repr__(self) -> str:
         """Representation."""
         return (
@@ -79,13 +95,19 @@ class PipeObject(ABC):
             f"path={self.path!r}, "
             f"name={self.name!r}, "
             f"parents={self.parents!r}, "
-            f"location_path={self.location!r})"
+            f"location_path={self.location!r}, "
+            f"duplicate_of={self.duplicate_of!r})"
         )
 
     def __str__(self) -> str:
         """String representation."""
         return f"<{self.__class__.__name__} '{self.location_name}'>"
 
+    @property
+    def duplicate_of(self) -> Self | None:
+        """Object whose contents this object duplicates, if applicable."""
+        return self._duplicate_of
+
     @property
     def location_name(self) -> str:
         """Location relative to root directory and name."""
@@ -121,6 +143,19 @@ class PipeObject(ABC):
         else:
             self._path = None
 
+    def count_saved(self, args: tuple[Any, ...], result: None) -> tuple[int, int]:
+        """Count bytes and pixels saved by a call of save.
+
+        Arguments:
+            args: Positional arguments of call
+            result: Return value of call
+        Returns:
+            Number of bytes and pixels saved
+        """
+        if self.path is None:
+            return 0, 0
+        return self.path.stat().st_size, 0
+
     @abstractmethod
     def save(self, path: Path | str):
         """Save object to file and set path.
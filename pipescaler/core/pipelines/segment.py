@@ -5,6 +5,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from pipescaler.common.instrumentation import instrumented
 
 from .pipe_object import PipeObject
 
@@ -12,7 +17,24 @@ __all__ = ["Segment"]
 
 
 class Segment[T: PipeObject](ABC):
-    """Abstract base class for pipeline segments."""
+    """Abstract base class for pipeline segments.
+
+    Calls of subclasses are measured while instrumentation is active.
+
+    Calls of subclasses whose input objects are all duplicates of earlier objects are
+    not processed; the input objects are instead passed through by pass_duplicates, so
+    that a terminus may fulfil them from the output of the objects they duplicate.
+    Since such objects have not been processed, calls whose input objects include both
+    duplicates and objects that are not duplicates are rejected.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument calls of subclass and pass duplicates through them."""
+        super().__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__:
+            cls.__call__ = cls.skipping_duplicates(
+                instrumented("segment")(cls.__dict__["__call__"])
+            )
 
     @abstractmethod
     def __call__(self, *input_objs: T) -> tuple[T, ...]:
@@ -32,3 +54,47 @@ class Segment[T: PipeObject](ABC):
     def __str__(self) -> str:
         """String representation."""
         return f"<{self.__class__.__name__}>"
+
+    def pass_duplicates(self, *input_objs: T) -> tuple[T, ...]:
+        """Pass input objects that duplicate earlier objects through unprocessed.
+
+        Arguments:
+            input_objs: Input objects, each a duplicate of an earlier object
+        Returns:
+            Input objects, unmodified, in place of output objects
+        """
+        return input_objs
+
+    @staticmethod
+    def skipping_duplicates[F: Callable[..., Any]](method: F) -> F:
+        """Wrap call of segment to pass input objects that are duplicates through.
+
+        Arguments:
+            method: Call of segment to wrap
+        Returns:
+            Wrapped call of segment
+        """
+        if getattr(method, "__skips_duplicates__", False):
+            return method
+
+        @wraps(method)
+        def wrapper(self: Segment, *input_objs: PipeObject, **kwargs: Any) -> Any:
+            """Call segment, unless all input objects are duplicates.
+
+            Raises:
+                ValueError: If some but not all input objects are duplicates
+            """
+            duplicates = [i for i in input_objs if i.duplicate_of is not None]
+            if duplicates and len(duplicates) == len(input_objs):
+                return self.pass_duplicates(*input_objs)
+            if duplicates:
+                raise ValueError(
+                    f"{self}: inputs {[i.location_name for i in duplicates]} are "
+                    "duplicates of earlier objects and were passed through earlier "
+                    "segments unprocessed, and may not be combined with inputs that "
+                    "were processed."
+                )
+            return method(self, *input_objs, **kwargs)
+
+        wrapper.__skips_duplicates__ = True  # ty: ignore[unresolved-attribute]
+        return wrapper  # ty: ignore[invalid-return-type]
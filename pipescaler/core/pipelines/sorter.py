@@ -6,7 +6,12 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import wraps
 from inspect import cleandoc
+from typing import Any
+
+from pipescaler.common.instrumentation import instrumented
 
 from .pipe_object import PipeObject
 
@@ -14,7 +19,23 @@ __all__ = ["Sorter"]
 
 
 class Sorter[T: PipeObject](ABC):
-    """Abstract base class for sorters."""
+    """Abstract base class for sorters.
+
+    Calls of subclasses are measured while instrumentation is active.
+
+    Objects that are duplicates of earlier objects are sorted to the same outlet as
+    the objects they duplicate, since they are passed through segments unprocessed
+    and their contents may therefore differ from those of the objects they duplicate
+    at this point in the pipeline.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument calls of subclass and sort duplicates with their originals."""
+        super().__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__:
+            cls.__call__ = cls.sorting_duplicates(
+                instrumented("sorter")(cls.__dict__["__call__"])
+            )
 
     @abstractmethod
     def __call__(self, obj: T) -> str | None:
@@ -40,6 +61,38 @@ class Sorter[T: PipeObject](ABC):
         """Outlets to which images may be sorted."""
         raise NotImplementedError()
 
+    @staticmethod
+    def sorting_duplicates[F: Callable[..., Any]](method: F) -> F:
+        """Wrap call of sorter to sort duplicates to the outlets of their originals.
+
+        Outlets of objects that are not duplicates are recorded by location name; an
+        object that is a duplicate is sorted to the outlet recorded for the object it
+        duplicates, or sorted normally if none is recorded.
+
+        Arguments:
+            method: Call of sorter to wrap
+        Returns:
+            Wrapped call of sorter
+        """
+        if getattr(method, "__sorts_duplicates__", False):
+            return method
+
+        @wraps(method)
+        def wrapper(self: Sorter, obj: PipeObject, **kwargs: Any) -> str | None:
+            """Call sorter, unless object is a duplicate of an object already sorted."""
+            outlets = self.__dict__.setdefault("_outlets_by_location_name", {})
+            if obj.duplicate_of is not None:
+                location_name = obj.duplicate_of.location_name
+                if location_name in outlets:
+                    return outlets[location_name]
+                return method(self, obj, **kwargs)
+            outlet = method(self, obj, **kwargs)
+            outlets[obj.location_name] = outlet
+            return outlet
+
+        wrapper.__sorts_duplicates__ = True  # ty: ignore[unresolved-attribute]
+        return wrapper  # ty: ignore[invalid-return-type]
+
     @classmethod
     def help_markdown(cls) -> str:
         """Short description of this class in markdown, with links."""
@@ -7,6 +7,9 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from inspect import cleandoc
+from typing import Any
+
+from pipescaler.common.instrumentation import instrumented
 
 from .pipe_object import PipeObject
 
@@ -14,7 +17,16 @@ __all__ = ["Source"]
 
 
 class Source[T: PipeObject](ABC):
-    """Abstract base class for pipeline sources."""
+    """Abstract base class for pipeline sources.
+
+    Objects yielded by subclasses are measured while instrumentation is active.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument iteration of subclass."""
+        super().__init_subclass__(**kwargs)
+        if "__next__" in cls.__dict__:
+            cls.__next__ = instrumented("source")(cls.__dict__["__next__"])
 
     def __iter__(self) -> Source:
         """Iterator for objects."""
@@ -7,6 +7,9 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from inspect import cleandoc
+from typing import Any
+
+from pipescaler.common.instrumentation import instrumented
 
 from .pipe_object import PipeObject
 
@@ -14,7 +17,10 @@ __all__ = ["Terminus"]
 
 
 class Terminus[T: PipeObject](ABC):
-    """Abstract base class for pipeline termini."""
+    """Abstract base class for pipeline termini.
+
+    Calls of subclasses are measured while instrumentation is active.
+    """
 
     @abstractmethod
     def __call__(self, input_obj: T):
@@ -25,6 +31,12 @@ class Terminus[T: PipeObject](ABC):
         """
         raise NotImplementedError()
 
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument calls of subclass."""
+        super().__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__:
+            cls.__call__ = instrumented("terminus")(cls.__dict__["__call__"])
+
     def __repr__(self) -> str:
         """Representation."""
         return f"{self.__class__.__name__}()"
@@ -5,41 +5,81 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from hashlib import blake2b
 from inspect import cleandoc
 from logging import debug
 from pathlib import Path
 from shlex import split
+from typing import Any
 
-from pipescaler.common.subprocess import run_command
+from pipescaler.common.file import get_file_digest
+from pipescaler.common.instrumentation import instrumented
+from pipescaler.common.subprocess import run_command, run_command_piped
 from pipescaler.common.validation import val_executable, val_int
 
+from .runner_cache import RunnerCache
+
 __all__ = ["Runner"]
 
 
 class Runner(ABC):
-    """Abstract base class for executable runners."""
+    """Abstract base class for executable runners.
+
+    Runs are measured while instrumentation is active.
+    """
 
-    def __init__(self, timeout: int = 600):
+    def __init__(self, timeout: int = 600, cache: RunnerCache | None = None):
         """Validate and store configuration and initialize.
 
         Arguments:
             timeout: Timeout for external tool invocation
+            cache: Cache of outputs, from which outputs of inputs already processed
+              with the same command and executable are loaded rather than re-run
         """
         self.timeout = val_int(timeout, min_value=0)
+        self.cache = cache
         self._executable_path: Path | None = None
 
     def __call__(self, input_path: Path | str, output_path: Path | str):
         """Run executable on input file, yielding output file.
 
+        If a cache is configured, the output is loaded from the cache if available,
+        and otherwise stored in it after running.
+
         Arguments:
             input_path: Input file path
             output_path: Output file path
         """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        if self.cache is None or not input_path.is_file():
+            self.run(input_path, output_path)
+            return
+
+        key = self.get_cache_key(
+            self.command_template, get_file_digest(input_path), output_path.suffix
+        )
+        if self.cache.load(key, output_path):
+            debug(f"{self}: '{output_path}' loaded from cache")
+            return
         self.run(input_path, output_path)
+        self.cache.save(key, output_path)
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Instrument runs of subclass."""
+        super().__init_subclass__(**kwargs)
+        if "run" in cls.__dict__:
+            cls.run = instrumented("runner", "count_run")(cls.__dict__["run"])
+        if "run_piped" in cls.__dict__:
+            cls.run_piped = instrumented("runner", "count_run_piped")(
+                cls.__dict__["run_piped"]
+            )
 
     def __repr__(self) -> str:
         """Representation."""
-        return f"{self.__class__.__name__}(timeout={self.timeout!r})"
+        return (
+            f"{self.__class__.__name__}(timeout={self.timeout!r}, cache={self.cache!r})"
+        )
 
     @property
     @abstractmethod
@@ -61,6 +101,91 @@ class Runner(ABC):
             )
         return self._executable_path
 
+    @property
+    def piped_command(self) -> str | None:
+        """Command reading input from standard input and writing output to stdout.
+
+        None if executable does not support reading input from standard input and
+        writing output to standard output.
+        """
+        return None
+
+    def call_piped(self, input_bytes: bytes) -> bytes:
+        """Run executable on input bytes via stdin, yielding output bytes via stdout.
+
+        If a cache is configured, the output is loaded from the cache if available,
+        and otherwise stored in it after running.
+
+        Arguments:
+            input_bytes: Contents of input file
+        Returns:
+            Contents of output file
+        """
+        command = self.piped_command
+        if self.cache is None or command is None:
+            return self.run_piped(input_bytes)
+
+        key = self.get_cache_key(
+            command, blake2b(input_bytes, digest_size=16).hexdigest(), ""
+        )
+        output_bytes = self.cache.load_bytes(key)
+        if output_bytes is not None:
+            debug(f"{self}: output loaded from cache")
+            return output_bytes
+        output_bytes = self.run_piped(input_bytes)
+        self.cache.save_bytes(key, output_bytes)
+        return output_bytes
+
+    def count_run(self, args: tuple[Any, ...], result: None) -> tuple[int, int]:
+        """Count bytes and pixels processed by a call of run.
+
+        Arguments:
+            args: Positional arguments of call
+            result: Return value of call
+        Returns:
+            Number of bytes of input and output files, and of pixels, which is zero
+        """
+        n_bytes = 0
+        for path in args[:2]:
+            if Path(path).is_file():
+                n_bytes += Path(path).stat().st_size
+        return n_bytes, 0
+
+    def count_run_piped(self, args: tuple[Any, ...], result: bytes) -> tuple[int, int]:
+        """Count bytes and pixels processed by a call of run_piped.
+
+        Arguments:
+            args: Positional arguments of call
+            result: Return value of call
+        Returns:
+            Number of bytes of input and output, and of pixels, which is zero
+        """
+        return len(args[0]) + len(result), 0
+
+    def get_cache_key(self, command: str, input_digest: str, output_suffix: str) -> str:
+        """Get key of output in cache.
+
+        The executable is identified by its path, which is included in the command,
+        and by its size and modification time.
+
+        Arguments:
+            command: Command or command template with which executable is run
+            input_digest: Digest of contents of input file
+            output_suffix: Suffix of output file
+        Returns:
+            Key of output in cache
+        """
+        executable_stat = self.executable_path.stat()
+        return RunnerCache.get_key(
+            self.__class__.__name__,
+            command,
+            str(executable_stat.st_size),
+            str(executable_stat.st_mtime_ns),
+            input_digest,
+            suffix=output_suffix,
+        )
+
+    @instrumented("runner", "count_run")
     def run(self, input_path: Path | str, output_path: Path | str):
         """Run executable on input file, yielding output file.
 
@@ -74,6 +199,26 @@ class Runner(ABC):
         debug(f"{self}: {command}")
         run_command(split(command), timeout=self.timeout)
 
+    @instrumented("runner", "count_run_piped")
+    def run_piped(self, input_bytes: bytes) -> bytes:
+        """Run executable on input bytes via stdin, yielding output bytes via stdout.
+
+        Arguments:
+            input_bytes: Contents of input file
+        Returns:
+            Contents of output file
+        Raises:
+            NotImplementedError: If executable does not support piped input and output
+        """
+        command = self.piped_command
+        if command is None:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support piped input and output"
+            )
+        debug(f"{self}: {command}")
+        _, stdout, _ = run_command_piped(split(command), input_bytes, self.timeout)
+        return stdout
+
     @classmethod
     def help_markdown(cls) -> str:
         """Short description of this tool in markdown, with links."""
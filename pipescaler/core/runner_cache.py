@@ -0,0 +1,247 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""On-disk cache of the outputs of Runners."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import blake2b
+from logging import debug
+from os import close, remove, replace, utime
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+
+from pipescaler.common.file import LinkStrategy, link_file
+from pipescaler.common.validation import val_int, val_output_dir_path, val_str
+
+__all__ = ["RunnerCache"]
+
+
+class RunnerCache:
+    """On-disk cache of the outputs of Runners.
+
+    Each entry is a single output file, named by a digest of the components of its key;
+    Runners key entries on their class, their command, the identity of their
+    executable, the digest of their input, and the suffix of their output. Cache hits
+    are linked to the requested output path rather than re-running the Runner.
+
+    The total size of entries is capped; when exceeded, the least recently used entries
+    are removed. Recency is tracked by the modification time of each entry, so that it
+    persists between sessions. Entries are written to temporary files and moved into
+    place once complete, so that an interrupted write does not leave a truncated entry.
+
+    Entries may be linked to outputs using hardlinks, which are fastest but share
+    storage with the output, such that the output must not then be modified in place;
+    reflinks, which share storage only until either file is written, and are copied if
+    not supported by the filesystem; or copies.
+    """
+
+    def __init__(
+        self,
+        dir_path: Path | str,
+        max_size: int = 2**30,
+        *,
+        link_strategy: LinkStrategy = "reflink",
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            dir_path: Path to directory in which to store entries
+            max_size: Maximum total size of entries in bytes
+            link_strategy: Strategy with which to link entries to and from outputs
+        """
+        self.dir_path = val_output_dir_path(dir_path)
+        """Path to directory in which to store entries"""
+        self.max_size = val_int(max_size, min_value=0)
+        """Maximum total size of entries in bytes"""
+        self.link_strategy: LinkStrategy = val_str(
+            link_strategy, options=("copy", "hardlink", "reflink")
+        )
+        """Strategy with which to link entries to and from outputs"""
+        self.entries: OrderedDict[str, int] = OrderedDict()
+        """Sizes of entries by filename, from least to most recently used"""
+        self.size = 0
+        """Total size of entries in bytes"""
+        self.hits = 0
+        """Number of lookups that found an entry"""
+        self.misses = 0
+        """Number of lookups that did not find an entry"""
+
+        self._lock = Lock()
+        self.load_entries()
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"dir_path={self.dir_path!r}, "
+            f"max_size={self.max_size!r}, "
+            f"link_strategy={self.link_strategy!r})"
+        )
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"<{self.__class__.__name__}>"
+
+    def add(self, key: str, size: int):
+        """Record entry as most recently used, and evict entries if needed.
+
+        Arguments:
+            key: Key of entry
+            size: Size of entry in bytes
+        """
+        with self._lock:
+            self.size += size - self.entries.pop(key, 0)
+            self.entries[key] = size
+        debug(f"{self}: '{key}' saved")
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until total size is within maximum."""
+        with self._lock:
+            while self.size > self.max_size and self.entries:
+                filename, size = self.entries.popitem(last=False)
+                self.size -= size
+                entry_path = self.dir_path / filename
+                if entry_path.exists():
+                    remove(entry_path)
+                debug(f"{self}: '{filename}' evicted")
+
+    def load(self, key: str, output_path: Path) -> bool:
+        """Link entry to output path, if present.
+
+        Arguments:
+            key: Key of entry
+            output_path: Path to which to link entry
+        Returns:
+            Whether entry was present
+        """
+        entry_path = self.use(key)
+        if entry_path is None:
+            return False
+        try:
+            link_file(entry_path, output_path, self.link_strategy)
+        except FileNotFoundError:
+            # Entry was evicted by another thread
+            return False
+        return True
+
+    def load_bytes(self, key: str) -> bytes | None:
+        """Read contents of entry, if present.
+
+        Arguments:
+            key: Key of entry
+        Returns:
+            Contents of entry if present, otherwise None
+        """
+        entry_path = self.use(key)
+        if entry_path is None:
+            return None
+        try:
+            return entry_path.read_bytes()
+        except FileNotFoundError:
+            # Entry was evicted by another thread
+            return None
+
+    def load_entries(self):
+        """Load entries present in directory, ordered by modification time.
+
+        Temporary files of entries being written are skipped, and entries are then
+        evicted if their total size exceeds the maximum.
+        """
+        stats = [
+            (path.name, path.stat())
+            for path in self.dir_path.iterdir()
+            if not path.name.startswith(".")
+        ]
+        stats.sort(key=lambda name_and_stat: name_and_stat[1].st_mtime_ns)
+        with self._lock:
+            for filename, stat in stats:
+                self.entries[filename] = stat.st_size
+                self.size += stat.st_size
+        self.evict()
+
+    def save(self, key: str, output_path: Path):
+        """Store output file as entry.
+
+        Arguments:
+            key: Key of entry
+            output_path: Path to output file
+        """
+        if not output_path.exists():
+            return
+        size = self._write_entry(
+            key, lambda path: link_file(output_path, path, self.link_strategy)
+        )
+        self.add(key, size)
+
+    def save_bytes(self, key: str, output_bytes: bytes):
+        """Store output contents as entry.
+
+        Arguments:
+            key: Key of entry
+            output_bytes: Contents of output
+        """
+        self._write_entry(key, lambda path: path.write_bytes(output_bytes))
+        self.add(key, len(output_bytes))
+
+    def use(self, key: str) -> Path | None:
+        """Mark entry as most recently used and get its path, if present.
+
+        Arguments:
+            key: Key of entry
+        Returns:
+            Path to entry if present, otherwise None
+        """
+        entry_path = self.dir_path / key
+        with self._lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            try:
+                utime(entry_path)
+            except FileNotFoundError:
+                # Entry was removed by another session
+                self.size -= self.entries.pop(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        debug(f"{self}: '{key}' used")
+        return entry_path
+
+    def _write_entry(self, key: str, write: Callable[[Path], object]) -> int:
+        """Write entry to a temporary file, then move it into place.
+
+        Arguments:
+            key: Key of entry
+            write: Function that writes contents of entry to a path
+        Returns:
+            Size of entry in bytes
+        """
+        fd, partial_filename = mkstemp(prefix=f".{key}.", dir=self.dir_path)
+        close(fd)
+        partial_path = Path(partial_filename)
+        try:
+            write(partial_path)
+            size = partial_path.stat().st_size
+            replace(partial_path, self.dir_path / key)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        return size
+
+    @staticmethod
+    def get_key(*components: str, suffix: str = "") -> str:
+        """Get key of entry from its components.
+
+        Arguments:
+            components: Components of key
+            suffix: Suffix of entry's filename
+        Returns:
+            Key of entry, which is also its filename
+        """
+        digest = blake2b("\0".join(components).encode(), digest_size=16)
+        return f"{digest.hexdigest()}{suffix}"
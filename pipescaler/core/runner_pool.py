@@ -0,0 +1,120 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Pool in which to run a Runner on many files concurrently."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import debug
+from os import process_cpu_count
+from pathlib import Path
+from types import TracebackType
+
+from pipescaler.common.validation import val_int
+
+from .typing import RunnerLike
+
+__all__ = ["RunnerPool"]
+
+
+class RunnerPool:
+    """Pool in which to run a Runner on many files concurrently.
+
+    Each job runs the runner on one input file, yielding one output file, exactly as
+    would calling the runner directly; the runner's timeout and acceptable exit codes
+    therefore apply to each job individually. Since the work of each job is performed
+    by an external process, jobs are run in threads, no more than max_workers of which
+    run at once. Exceptions raised by a job, such as a ValueError for an unacceptable
+    exit code or a TimeoutExpired, are raised when the result of its future is
+    retrieved.
+
+    May be used as a context manager, in which case the pool is shut down on exit,
+    waiting for running jobs to complete; if exiting due to an exception, jobs that
+    have not yet started are cancelled.
+    """
+
+    def __init__(self, runner: RunnerLike, max_workers: int | None = None):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            runner: Runner to run
+            max_workers: Maximum number of jobs to run at once; if None, the number of
+              CPUs available to this process
+        """
+        self.runner = runner
+        """Runner to run"""
+        if max_workers is None:
+            max_workers = process_cpu_count() or 1
+        self.max_workers = val_int(max_workers, min_value=1)
+        """Maximum number of jobs to run at once"""
+
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> RunnerPool:
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        """Exit context, shutting down pool."""
+        self.shutdown(cancel_futures=exc_type is not None)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"runner={self.runner!r}, "
+            f"max_workers={self.max_workers!r})"
+        )
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"<{self.__class__.__name__}>"
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Executor in which jobs are run; started on first access."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def map(self, jobs: Iterable[tuple[Path | str, Path | str]]) -> list[Future[None]]:
+        """Submit many jobs.
+
+        Arguments:
+            jobs: Input and output file paths of each job
+        Returns:
+            Futures of jobs, in the order submitted
+        """
+        return [
+            self.submit(input_path, output_path) for input_path, output_path in jobs
+        ]
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Shut down pool; a new pool will be started if more jobs are submitted.
+
+        Arguments:
+            wait: Whether to wait for running jobs to complete
+            cancel_futures: Whether to cancel jobs that have not yet started
+        """
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        self._executor = None
+
+    def submit(self, input_path: Path | str, output_path: Path | str) -> Future[None]:
+        """Submit a job.
+
+        Arguments:
+            input_path: Input file path
+            output_path: Output file path
+        Returns:
+            Future of job
+        """
+        debug(f"{self}: submitting '{input_path}' -> '{output_path}'")
+        return self.executor.submit(self.runner, input_path, output_path)
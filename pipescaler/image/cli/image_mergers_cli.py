@@ -60,9 +60,10 @@ class ImageMergersCli(CommandLineInterface):
     @classmethod
     def mergers(cls) -> dict[str, type[ImageMergerCli]]:
         """Names and types of mergers wrapped by command-line interface."""
+        clis = [getattr(mergers, name) for name in getattr(mergers, "__all__", ())]
         return {
             merger.name(): merger
-            for merger in map(mergers.__dict__.get, getattr(mergers, "__all__", ()))
+            for merger in clis
             if isinstance(merger, type) and issubclass(merger, ImageMergerCli)
         }
 
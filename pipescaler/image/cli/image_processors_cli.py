@@ -60,11 +60,12 @@ class ImageProcessorsCli(CommandLineInterface):
     @classmethod
     def processors(cls) -> dict[str, type[ImageProcessorCli]]:
         """Names and types of processors wrapped by command-line interface."""
+        clis = [
+            getattr(processors, name) for name in getattr(processors, "__all__", ())
+        ]
         return {
             processor.name(): processor
-            for processor in map(
-                processors.__dict__.get, getattr(processors, "__all__", ())
-            )
+            for processor in clis
             if isinstance(processor, type) and issubclass(processor, ImageProcessorCli)
         }
 
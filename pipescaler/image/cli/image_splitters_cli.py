@@ -60,11 +60,10 @@ class ImageSplittersCli(CommandLineInterface):
     @classmethod
     def splitters(cls) -> dict[str, type[ImageSplitterCli]]:
         """Names and types of splitters wrapped by command-line interface."""
+        clis = [getattr(splitters, name) for name in getattr(splitters, "__all__", ())]
         return {
             splitter.name(): splitter
-            for splitter in map(
-                splitters.__dict__.get, getattr(splitters, "__all__", ())
-            )
+            for splitter in clis
             if isinstance(splitter, type) and issubclass(splitter, ImageSplitterCli)
         }
 
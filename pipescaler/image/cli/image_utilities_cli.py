@@ -60,11 +60,10 @@ class ImageUtilitiesCli(CommandLineInterface):
     @classmethod
     def utilities(cls) -> dict[str, type[UtilityCli]]:
         """Names and types of utilities wrapped by command-line interface."""
+        clis = [getattr(utilities, name) for name in getattr(utilities, "__all__", ())]
         return {
             utility.name(): utility
-            for utility in map(
-                utilities.__dict__.get, getattr(utilities, "__all__", ())
-            )
+            for utility in clis
             if isinstance(utility, type) and issubclass(utility, UtilityCli)
         }
 
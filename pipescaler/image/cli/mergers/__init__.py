@@ -10,10 +10,23 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .alpha_merger_cli import AlphaMergerCli
-from .palette_match_merger_cli import PaletteMatchMergerCli
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .alpha_merger_cli import AlphaMergerCli
+    from .palette_match_merger_cli import PaletteMatchMergerCli
 
 __all__ = [
     "AlphaMergerCli",
     "PaletteMatchMergerCli",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AlphaMergerCli": "alpha_merger_cli",
+        "PaletteMatchMergerCli": "palette_match_merger_cli",
+    },
+)
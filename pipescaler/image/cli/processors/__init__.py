@@ -12,16 +12,21 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .crop_cli import CropCli
-from .expand_cli import ExpandCli
-from .height_to_normal_cli import HeightToNormalCli
-from .mode_cli import ModeCli
-from .resize_cli import ResizeCli
-from .sharpen_cli import SharpenCli
-from .solid_color_cli import SolidColorCli
-from .spandrel_cli import SpandrelCli
-from .threshold_cli import ThresholdCli
-from .xbrz_cli import XbrzCli
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .crop_cli import CropCli
+    from .expand_cli import ExpandCli
+    from .height_to_normal_cli import HeightToNormalCli
+    from .mode_cli import ModeCli
+    from .resize_cli import ResizeCli
+    from .sharpen_cli import SharpenCli
+    from .solid_color_cli import SolidColorCli
+    from .spandrel_cli import SpandrelCli
+    from .threshold_cli import ThresholdCli
+    from .xbrz_cli import XbrzCli
 
 __all__ = [
     "CropCli",
@@ -35,3 +40,19 @@ __all__ = [
     "ThresholdCli",
     "XbrzCli",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "CropCli": "crop_cli",
+        "ExpandCli": "expand_cli",
+        "HeightToNormalCli": "height_to_normal_cli",
+        "ModeCli": "mode_cli",
+        "ResizeCli": "resize_cli",
+        "SharpenCli": "sharpen_cli",
+        "SolidColorCli": "solid_color_cli",
+        "SpandrelCli": "spandrel_cli",
+        "ThresholdCli": "threshold_cli",
+        "XbrzCli": "xbrz_cli",
+    },
+)
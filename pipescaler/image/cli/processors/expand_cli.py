@@ -6,7 +6,11 @@ from __future__ import annotations
 
 from argparse import ArgumentParser
 
-from pipescaler.common.argument_parsing import get_arg_groups_by_name, int_arg
+from pipescaler.common.argument_parsing import (
+    get_arg_groups_by_name,
+    int_arg,
+    str_arg,
+)
 from pipescaler.image.core.cli import ImageProcessorCli
 from pipescaler.image.operators.processors import ExpandProcessor
 
@@ -40,6 +44,15 @@ class ExpandCli(ImageProcessorCli):
             help="number of pixels to add to left, top, right, and bottom "
             "(default: %(default)s)",
         )
+        arg_groups["additional arguments"].add_argument(
+            "--mode",
+            default="symmetric",
+            type=str_arg(options=("edge", "reflect", "symmetric", "wrap")),
+            help="mode with which to fill expanded area; 'symmetric' to mirror image "
+            "including its edge pixels, 'reflect' to mirror image excluding its edge "
+            "pixels, 'wrap' to tile image, or 'edge' to repeat its edge pixels "
+            "(default: %(default)s)",
+        )
 
     @classmethod
     def processor(cls) -> type[ExpandProcessor]:
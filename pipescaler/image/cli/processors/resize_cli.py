@@ -48,6 +48,17 @@ class ResizeCli(ImageProcessorCli):
             type=str_arg(options=ResizeProcessor.resample_methods.keys()),
             help="Resampling method (default: %(default)s)",
         )
+        arg_groups["additional arguments"].add_argument(
+            "--premultiply-alpha",
+            action="store_true",
+            help="Premultiply color channels by alpha before resizing",
+        )
+        arg_groups["additional arguments"].add_argument(
+            "--backend",
+            default="pillow",
+            type=str_arg(options=("cv2", "pillow")),
+            help="Library with which to resize (default: %(default)s)",
+        )
 
     @classmethod
     def processor(cls) -> type[ResizeProcessor]:
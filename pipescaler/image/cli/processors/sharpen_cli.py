@@ -4,6 +4,13 @@
 
 from __future__ import annotations
 
+from argparse import ArgumentParser
+
+from pipescaler.common.argument_parsing import (
+    float_arg,
+    get_arg_groups_by_name,
+    str_arg,
+)
 from pipescaler.image.core.cli import ImageProcessorCli
 from pipescaler.image.operators.processors import SharpenProcessor
 
@@ -13,6 +20,41 @@ __all__ = ["SharpenCli"]
 class SharpenCli(ImageProcessorCli):
     """Command-line interface for SharpenProcessor."""
 
+    @classmethod
+    def add_arguments_to_argparser(cls, parser: ArgumentParser):
+        """Add arguments to a nascent argument parser.
+
+        Arguments:
+            parser: Nascent argument parser
+        """
+        super().add_arguments_to_argparser(parser)
+
+        arg_groups = get_arg_groups_by_name(
+            parser,
+            "required arguments",
+            optional_arguments_name="additional arguments",
+        )
+
+        arg_groups["additional arguments"].add_argument(
+            "--strength",
+            default=1.0,
+            type=float_arg(min_value=0),
+            help="Strength of sharpening (default: %(default)s)",
+        )
+        arg_groups["additional arguments"].add_argument(
+            "--radius",
+            default=0.0,
+            type=float_arg(min_value=0),
+            help="Standard deviation of Gaussian blur of unsharp mask; if 0, a 3x3 "
+            "Laplacian kernel is used instead (default: %(default)s)",
+        )
+        arg_groups["additional arguments"].add_argument(
+            "--channels",
+            default="value",
+            type=str_arg(options=("luminance", "rgb", "value")),
+            help="Channels of RGB images to sharpen (default: %(default)s)",
+        )
+
     @classmethod
     def processor(cls) -> type[SharpenProcessor]:
         """Type of processor wrapped by command-line interface."""
@@ -11,6 +11,18 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .alpha_splitter_cli import AlphaSplitterCli
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .alpha_splitter_cli import AlphaSplitterCli
 
 __all__ = ["AlphaSplitterCli"]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AlphaSplitterCli": "alpha_splitter_cli",
+    },
+)
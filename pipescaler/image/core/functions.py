@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
+from hashlib import blake2b
+
+import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-from scipy.ndimage import convolve
 
-from pipescaler.common.validation import val_float
+from pipescaler.common.validation import val_float, val_literal
 
 from .exceptions import UnsupportedImageModeError
+from .typing import ExpandMode
 
 __all__ = [
     "convert_mode",
@@ -18,6 +21,7 @@ __all__ = [
     "expand_image",
     "generate_normal_map_from_height_map_image",
     "get_font_size",
+    "get_image_digest",
     "get_palette",
     "get_text_size",
     "hstack_images",
@@ -72,10 +76,9 @@ def expand_image(  # noqa: PLR0913
     bottom: int = 0,
     *,
     min_size: int = 1,
+    mode: ExpandMode = "symmetric",
 ) -> Image.Image:
-    """Expand an image by reflecting it around its edges.
-
-    TODO: Implement option to tile rather than reflect
+    """Expand an image by padding it around its edges.
 
     Arguments:
         image: Input image
@@ -83,75 +86,30 @@ def expand_image(  # noqa: PLR0913
         top: Pixels to add to top
         right: Pixels to add to right side
         bottom: Pixels to add to bottom
-        min_size: Minimum size of expanded image
+        min_size: Minimum size of expanded image; additional pixels are split evenly
+          between opposite sides
+        mode: Mode with which to fill expanded area; 'symmetric' to mirror image
+          including its edge pixels, 'reflect' to mirror image excluding its edge
+          pixels, 'wrap' to tile image, or 'edge' to repeat its edge pixels
     Returns:
         Expanded image
     """
-    transposed_horizontally = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-    transposed_vertically = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-    transposed_horizontally_and_vertically = transposed_horizontally.transpose(
-        Image.Transpose.FLIP_TOP_BOTTOM
-    )
-
-    expanded = Image.new(
-        image.mode,
-        (
-            max(min_size, left + image.size[0] + right),
-            max(min_size, top + image.size[1] + bottom),
-        ),
-    )
-    center = (expanded.size[0] // 2, expanded.size[1] // 2)
-
-    expanded.paste(
-        image, (center[0] - image.size[0] // 2, center[1] - image.size[1] // 2)
-    )
-    expanded.paste(
-        transposed_horizontally,
-        (center[0] + image.size[0] // 2, center[1] - image.size[1] // 2),
-    )
-    expanded.paste(
-        transposed_horizontally,
-        (
-            center[0] - image.size[0] - image.size[0] // 2,
-            center[1] - image.size[1] // 2,
-        ),
-    )
-    expanded.paste(
-        transposed_vertically,
-        (
-            center[0] - image.size[0] // 2,
-            center[1] - image.size[1] - image.size[1] // 2,
-        ),
-    )
-    expanded.paste(
-        transposed_vertically,
-        (center[0] - image.size[0] // 2, center[1] + image.size[1] // 2),
-    )
-    expanded.paste(
-        transposed_horizontally_and_vertically,
-        (
-            center[0] + image.size[0] // 2,
-            center[1] - image.size[1] - image.size[1] // 2,
-        ),
-    )
-    expanded.paste(
-        transposed_horizontally_and_vertically,
-        (
-            center[0] - image.size[0] - image.size[0] // 2,
-            center[1] - image.size[1] - image.size[1] // 2,
-        ),
-    )
-    expanded.paste(
-        transposed_horizontally_and_vertically,
-        (
-            center[0] - image.size[0] - image.size[0] // 2,
-            center[1] + image.size[1] // 2,
-        ),
-    )
-    expanded.paste(
-        transposed_horizontally_and_vertically,
-        (center[0] + image.size[0] // 2, center[1] + image.size[1] // 2),
-    )
+    mode = val_literal(mode, ExpandMode)
+
+    width = left + image.size[0] + right
+    if width < min_size:
+        left += (min_size - width) // 2
+        right += min_size - width - (min_size - width) // 2
+    height = top + image.size[1] + bottom
+    if height < min_size:
+        top += (min_size - height) // 2
+        bottom += min_size - height - (min_size - height) // 2
+
+    input_arr = np.asarray(image)
+    pad_width = ((top, bottom), (left, right)) + ((0, 0),) * (input_arr.ndim - 2)
+    expanded = Image.fromarray(np.pad(input_arr, pad_width, mode=mode))
+    if image.mode == "P":
+        expanded.putpalette(image.getpalette())
 
     return expanded
 
@@ -159,34 +117,34 @@ def expand_image(  # noqa: PLR0913
 def generate_normal_map_from_height_map_image(image: Image.Image) -> Image.Image:
     """Generate normal map image from a height map image.
 
+    Gradients are calculated using separable float32 Sobel filters, and are scaled,
+    normalized, and converted to 8-bit in a single pass, without full-size float
+    temporaries.
+
     Arguments:
         image: Height map image
     Returns:
         Normal map image
     """
+    from .numba import normalize_gradients  # noqa: PLC0415
+
     input_arr = np.array(image)
 
-    # Prepare normal map
-    kernel = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
-    gradient_x = convolve(input_arr.astype(float), kernel)
-    gradient_y = convolve(input_arr.astype(float), kernel.T)
-    output_arr = np.zeros((input_arr.shape[0], input_arr.shape[1], 3))
-    max_dimension = max(gradient_x.max(), gradient_y.max())
-    output_arr[..., 0] = gradient_x / max_dimension
-    output_arr[..., 1] = gradient_y / max_dimension
-    output_arr[..., 2] = 1
-
-    # Normalize
-    magnitude = np.sqrt(
-        output_arr[..., 0] ** 2 + output_arr[..., 1] ** 2 + output_arr[..., 2] ** 2
+    # Calculate gradients; negated to match convolution rather than correlation
+    gradient_x = cv2.Sobel(
+        input_arr, cv2.CV_32F, 1, 0, ksize=3, scale=-1, borderType=cv2.BORDER_REFLECT
+    )
+    gradient_y = cv2.Sobel(
+        input_arr, cv2.CV_32F, 0, 1, ksize=3, scale=-1, borderType=cv2.BORDER_REFLECT
     )
-    output_arr[..., 0] /= magnitude
-    output_arr[..., 1] /= magnitude
-    output_arr[..., 2] /= magnitude
 
-    # Convert to image
-    output_arr = ((output_arr * 0.5) + 0.5) * 255
-    output_arr = np.clip(output_arr, 0, 255).astype(np.uint8)
+    # Scale, normalize, and convert to image
+    max_dimension = max(float(gradient_x.max()), float(gradient_y.max()))
+    scale = 0.0
+    if max_dimension != 0:
+        scale = 1 / max_dimension
+    output_arr = np.empty((input_arr.shape[0], input_arr.shape[1], 3), np.uint8)
+    normalize_gradients(gradient_x, gradient_y, scale, output_arr)
     output_img = Image.fromarray(output_arr)
 
     return output_img
@@ -225,6 +183,26 @@ def get_font_size(
     return round(100 / (observed_height / height) * proportional_height)
 
 
+def get_image_digest(image: Image.Image) -> str:
+    """Get digest of an image's pixels.
+
+    Images with the same mode, size, palette, and pixel values have the same digest,
+    regardless of the format or encoding of the files from which they were loaded.
+
+    Arguments:
+        image: Image
+    Returns:
+        Hexadecimal BLAKE2b digest of image's mode, size, palette, and pixels
+    """
+    digest = blake2b(digest_size=16)
+    digest.update(f"{image.mode};{image.width}x{image.height};".encode())
+    palette = image.getpalette()
+    if palette is not None:
+        digest.update(bytes(palette))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
 def get_text_size(
     text: str, width: int, height: int, font: str = "Arial", size: int = 100
 ) -> tuple[int, int]:
@@ -377,6 +355,10 @@ def remove_palette(image: Image.Image) -> Image.Image:
 def smooth_image(image: Image.Image, sigma: float) -> Image.Image:
     """Smooth an image using a Gaussian kernel.
 
+    The kernel is sampled at offsets from -3 * sigma to 3 * sigma in steps of one, and
+    is not normalized. It is convolved separably along each axis, accumulating in
+    float64 so that truncation to 8 bits matches that of earlier releases.
+
     Arguments:
         image: Image to smooth
         sigma: Sigma of Gaussian with which to smooth
@@ -387,10 +369,17 @@ def smooth_image(image: Image.Image, sigma: float) -> Image.Image:
         (-1 * (np.arange(-3 * sigma, 3 * sigma + 1).astype(float) ** 2))
         / (2 * (sigma**2))
     )
-    smoothed_arr = np.array(image).astype(float)
-    smoothed_arr = convolve(smoothed_arr, kernel[np.newaxis])
-    smoothed_arr = convolve(smoothed_arr, kernel[np.newaxis].T)
-    smoothed_arr = np.clip(smoothed_arr, 0, 255).astype(np.uint8)
+    # Reversed and anchored as by scipy.ndimage.convolve, including for even lengths
+    anchor = (kernel.size - 1) // 2
+    smoothed_arr = cv2.sepFilter2D(
+        np.array(image),
+        cv2.CV_64F,
+        kernel[::-1],
+        kernel[::-1],
+        anchor=(anchor, anchor),
+        borderType=cv2.BORDER_REFLECT,
+    )
+    smoothed_arr = np.clip(smoothed_arr, 0, 255, out=smoothed_arr).astype(np.uint8)
     smoothed_img = Image.fromarray(smoothed_arr)
 
     return smoothed_img
@@ -9,7 +9,31 @@ from typing import no_type_check
 import numpy as np
 from numba import njit
 
-__all__ = ["get_perceptually_weighted_distance"]
+__all__ = [
+    "denoise_binary_array",
+    "get_perceptually_weighted_distance",
+    "merge_normal_arrays",
+    "normalize_gradients",
+    "split_normal_array",
+]
+
+
+@no_type_check
+@njit(nogil=True, cache=True, fastmath=True)
+def denoise_binary_array(data: np.ndarray):
+    """Flip color of pixels bordered by less than 5 pixels of the same color.
+
+    Arguments:
+        data: Black and white image array; modified in-place
+    """
+    for x in range(1, data.shape[1] - 1):
+        for y in range(1, data.shape[0] - 1):
+            slc = data[y - 1 : y + 2, x - 1 : x + 2]
+            if data[y, x] == 0:
+                if (slc == 0).sum() < 4:
+                    data[y, x] = 255
+            elif (slc == 255).sum() < 4:
+                data[y, x] = 0
 
 
 @no_type_check
@@ -34,3 +58,84 @@ def get_perceptually_weighted_distance(
         + (4 * (dg**2))
         + ((2 + ((255 - rmean) / 256)) * (db**2))
     )
+
+
+@no_type_check
+@njit(nogil=True, cache=True, fastmath=True)
+def merge_normal_arrays(
+    x_arr: np.ndarray, y_arr: np.ndarray, z_arr: np.ndarray, output_arr: np.ndarray
+):
+    """Merge flattened x, y, and z arrays into a normalized normal map in one pass.
+
+    Arguments:
+        x_arr: Flattened x array
+        y_arr: Flattened y array
+        z_arr: Flattened z array
+        output_arr: Flattened output normal map array of shape (n, 3); modified
+          in-place
+    """
+    for i in range(x_arr.shape[0]):
+        x = np.float32(x_arr[i]) - 128
+        y = np.float32(y_arr[i]) - 128
+        z = min(np.float32(z_arr[i]) / 2, 127)
+        magnitude = np.sqrt(x**2 + y**2 + z**2)
+        if magnitude == 0:
+            output_arr[i, 0] = 128
+            output_arr[i, 1] = 128
+            output_arr[i, 2] = 128
+            continue
+        scale = 128 / magnitude
+        output_arr[i, 0] = int(min(max(x * scale + 128, 0), 255))
+        output_arr[i, 1] = int(min(max(y * scale + 128, 0), 255))
+        output_arr[i, 2] = int(min(max(z * scale + 128, 0), 255))
+
+
+@no_type_check
+@njit(nogil=True, cache=True, fastmath=True)
+def normalize_gradients(
+    gradient_x: np.ndarray,
+    gradient_y: np.ndarray,
+    scale: float,
+    output_arr: np.ndarray,
+):
+    """Convert scaled gradients of a height map to an 8-bit normal map in one pass.
+
+    Arguments:
+        gradient_x: Gradient of height map along x
+        gradient_y: Gradient of height map along y
+        scale: Factor by which to scale gradients
+        output_arr: Output normal map array; modified in-place
+    """
+    for y in range(gradient_x.shape[0]):
+        for x in range(gradient_x.shape[1]):
+            normal_x = gradient_x[y, x] * scale
+            normal_y = gradient_y[y, x] * scale
+            inverse_magnitude = 1 / np.sqrt(normal_x**2 + normal_y**2 + 1)
+            output_arr[y, x, 0] = int(
+                min(max(normal_x * inverse_magnitude * 127.5 + 127.5, 0), 255)
+            )
+            output_arr[y, x, 1] = int(
+                min(max(normal_y * inverse_magnitude * 127.5 + 127.5, 0), 255)
+            )
+            output_arr[y, x, 2] = int(
+                min(max(inverse_magnitude * 127.5 + 127.5, 0), 255)
+            )
+
+
+@no_type_check
+@njit(nogil=True, cache=True, fastmath=True)
+def split_normal_array(
+    input_arr: np.ndarray, x_arr: np.ndarray, y_arr: np.ndarray, z_arr: np.ndarray
+):
+    """Split a flattened normal map into x, y, and z arrays in one pass.
+
+    Arguments:
+        input_arr: Flattened normal map array of shape (n, 3)
+        x_arr: Flattened output x array; modified in-place
+        y_arr: Flattened output y array; modified in-place
+        z_arr: Flattened output z array; modified in-place
+    """
+    for i in range(input_arr.shape[0]):
+        x_arr[i] = input_arr[i, 0]
+        y_arr[i] = input_arr[i, 1]
+        z_arr[i] = min(max((np.int32(input_arr[i, 2]) - 128) * 2, 0), 255)
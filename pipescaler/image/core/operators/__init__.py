@@ -6,15 +6,18 @@ This module may import from: common, core, image.core
 
 Hierarchy within module:
 * image_merger / image_processor / image_splitter / processors
+* fused_image_processor
 """
 
 from __future__ import annotations
 
+from .fused_image_processor import FusedImageProcessor
 from .image_merger import ImageMerger
 from .image_processor import ImageProcessor
 from .image_splitter import ImageSplitter
 
 __all__ = [
+    "FusedImageProcessor",
     "ImageMerger",
     "ImageProcessor",
     "ImageSplitter",
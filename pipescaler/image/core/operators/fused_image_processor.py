@@ -0,0 +1,86 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Processes an image using a chain of image processors applied back-to-back."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from PIL import Image
+
+from pipescaler.image.core.exceptions import UnsupportedImageModeError
+from pipescaler.image.core.typing import ImageMode
+
+from .image_processor import ImageProcessor
+
+__all__ = ["FusedImageProcessor"]
+
+
+class FusedImageProcessor(ImageProcessor):
+    """Processes an image using a chain of image processors applied back-to-back.
+
+    The chain is validated once, when the processor is constructed: each processor
+    must declare at least one output mode that the next processor in the chain accepts
+    as input. Each processor still validates the image it receives, as it would if
+    applied alone, since processors have no entry point that skips validation; for an
+    intermediate image already in a supported mode, this is only a check of its mode.
+    Each intermediate image is passed directly to the next processor and released as
+    soon as it has been processed, so that at most two images are held in memory at
+    once.
+    """
+
+    def __init__(self, processors: Sequence[ImageProcessor]):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            processors: Processors to apply, in order
+        Raises:
+            ValueError: If no processors are provided
+            UnsupportedImageModeError: If no output mode of a processor is accepted as
+              input by the next processor
+        """
+        super().__init__()
+
+        if len(processors) == 0:
+            raise ValueError("At least one processor is required")
+        for upstream, downstream in zip(processors, processors[1:]):
+            output_modes = upstream.outputs()["output"]
+            input_modes = downstream.inputs()["input"]
+            if not set(output_modes) & set(input_modes):
+                raise UnsupportedImageModeError(
+                    f"{upstream} yields modes {list(output_modes)}, none of which are "
+                    f"among modes supported by {downstream}: {list(input_modes)}"
+                )
+
+        self.processors = tuple(processors)
+        """Processors to apply, in order"""
+
+    def __call__(self, input_image: Image.Image) -> Image.Image:
+        """Process an image.
+
+        Arguments:
+            input_image: Input image
+        Returns:
+            Processed output image
+        """
+        image = input_image
+        for processor in self.processors:
+            image = processor(image)
+
+        return image
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"{self.__class__.__name__}(processors={list(self.processors)!r})"
+
+    def inputs(  # ty: ignore[invalid-method-override]
+        self,
+    ) -> dict[str, tuple[ImageMode, ...]]:
+        """Inputs to this operator; those of the first processor."""
+        return self.processors[0].inputs()
+
+    def outputs(  # ty: ignore[invalid-method-override]
+        self,
+    ) -> dict[str, tuple[ImageMode, ...]]:
+        """Outputs of this operator; those of the last processor."""
+        return self.processors[-1].outputs()
@@ -43,3 +43,13 @@ class ImageOperatorSegment[T: ImageOperator](ImageSegment, ABC):
     def __repr__(self) -> str:
         """Representation."""
         return f"{self.__class__.__name__}(operator={self.operator!r})"
+
+    def pass_duplicates(self, *input_objs: PipeImage) -> tuple[PipeImage, ...]:
+        """Pass input images that duplicate earlier images through unprocessed.
+
+        Arguments:
+            input_objs: Input images, each a duplicate of an earlier image
+        Returns:
+            First input image, unmodified, in place of each output image
+        """
+        return (input_objs[0],) * len(self.operator.outputs())
@@ -11,6 +11,7 @@ from typing import Any, Self
 
 from PIL import Image
 
+from pipescaler.common.instrumentation import measure
 from pipescaler.common.validation import val_output_path
 from pipescaler.core.pipelines import PipeObject
 from pipescaler.image.core.functions import remove_palette
@@ -73,9 +74,17 @@ class PipeImage(PipeObject):
                     f"to an image; neither has been provided."
                 )
             debug(f"{self}: Opening image '{self.location_name}' from '{self.path}'")
-            image = Image.open(self.path)
-            if image.mode == "P":
-                image = remove_palette(image)
+            with measure(
+                "decode", self.__class__.__name__, subject=self
+            ) as measurement:
+                image = Image.open(self.path)
+                if measurement is not None:
+                    # Decode now rather than on first access of pixels, to measure it
+                    image.load()
+                    measurement.n_bytes = self.path.stat().st_size
+                    measurement.n_pixels = image.width * image.height
+                if image.mode == "P":
+                    image = remove_palette(image)
             self._image = image
         return self._image
 
@@ -84,6 +93,18 @@ class PipeImage(PipeObject):
         """Set image data."""
         self._image = value
 
+    def count_saved(self, args: tuple[Any, ...], result: None) -> tuple[int, int]:
+        """Count bytes and pixels saved by a call of save.
+
+        Arguments:
+            args: Positional arguments of call
+            result: Return value of call
+        Returns:
+            Number of bytes and pixels saved
+        """
+        n_bytes, _ = super().count_saved(args, result)
+        return n_bytes, self.image.width * self.image.height
+
     def save(self, path: Path | str):
         """Save image to file and set path.
 
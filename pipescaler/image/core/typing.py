@@ -6,7 +6,10 @@ from __future__ import annotations
 
 from typing import Literal
 
-__all__ = ["ImageMode"]
+__all__ = ["ExpandMode", "ImageMode"]
+
+type ExpandMode = Literal["edge", "reflect", "symmetric", "wrap"]
+"""Type alias for modes with which images may be expanded, as used by numpy.pad."""
 
 # Image modes supported by PipeScaler
 # 1-bit, grayscale, grayscale+alpha, palette, RGB, RGBA, HSV
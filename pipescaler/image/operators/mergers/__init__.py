@@ -10,12 +10,15 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .alpha_merger import AlphaMerger
-from .histogram_match_merger import (
-    HistogramMatchMerger,
-)
-from .normal_merger import NormalMerger
-from .palette_match_merger import PaletteMatchMerger
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .alpha_merger import AlphaMerger
+    from .histogram_match_merger import HistogramMatchMerger
+    from .normal_merger import NormalMerger
+    from .palette_match_merger import PaletteMatchMerger
 
 __all__ = [
     "AlphaMerger",
@@ -23,3 +26,13 @@ __all__ = [
     "NormalMerger",
     "PaletteMatchMerger",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AlphaMerger": "alpha_merger",
+        "HistogramMatchMerger": "histogram_match_merger",
+        "NormalMerger": "normal_merger",
+        "PaletteMatchMerger": "palette_match_merger",
+    },
+)
@@ -4,9 +4,9 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 from PIL import Image
-from skimage.exposure import match_histograms
 
 from pipescaler.image.core import UnsupportedImageModeError
 from pipescaler.image.core.operators import ImageMerger
@@ -17,7 +17,12 @@ __all__ = ["HistogramMatchMerger"]
 
 
 class HistogramMatchMerger(ImageMerger):
-    """Matches an image's color histogram to that of a reference image."""
+    """Matches an image's color histogram to that of a reference image.
+
+    Each channel is matched independently, using a 256-entry lookup table calculated
+    from the cumulative histograms of the channel in the fit and reference images;
+    the lookup tables of all channels are applied in a single pass.
+    """
 
     def __call__(self, *input_images: Image.Image) -> Image.Image:
         """Merge images.
@@ -38,10 +43,16 @@ class HistogramMatchMerger(ImageMerger):
         ref_arr = np.array(ref_img)
         fit_arr = np.array(fit_img)
         if ref_img.mode == "L":
-            output_arr = match_histograms(fit_arr, ref_arr)
+            lookup_table = self.get_lookup_table(ref_arr, fit_arr)
         else:
-            output_arr = match_histograms(fit_arr, ref_arr, channel_axis=0)
-        output_arr = np.clip(output_arr, 0, 255).astype(np.uint8)
+            lookup_table = np.stack(
+                [
+                    self.get_lookup_table(ref_arr, fit_arr, channel)
+                    for channel in range(fit_arr.shape[2])
+                ],
+                axis=-1,
+            )[:, np.newaxis]
+        output_arr = cv2.LUT(fit_arr, lookup_table)
         output_img = Image.fromarray(output_arr)
 
         return output_img
@@ -60,3 +71,30 @@ class HistogramMatchMerger(ImageMerger):
         return {
             "output": ("L", "LA", "RGB", "RGBA"),
         }
+
+    @staticmethod
+    def get_lookup_table(
+        ref_arr: np.ndarray, fit_arr: np.ndarray, channel: int = 0
+    ) -> np.ndarray:
+        """Get lookup table matching histogram of a channel to that of a reference.
+
+        Each value in the fit channel is mapped to the value at the same quantile of
+        the reference channel, interpolating between values present in the reference
+        channel.
+
+        Arguments:
+            ref_arr: Reference image array
+            fit_arr: Image array to fit to reference
+            channel: Channel for which to calculate lookup table
+        Returns:
+            Lookup table of matched values for each of the 256 values of fit channel
+        """
+        ref_counts = cv2.calcHist([ref_arr], [channel], None, [256], [0, 256])
+        ref_counts = ref_counts.ravel().astype(np.float64)
+        fit_counts = cv2.calcHist([fit_arr], [channel], None, [256], [0, 256])
+        fit_counts = fit_counts.ravel().astype(np.float64)
+        ref_values = np.flatnonzero(ref_counts)
+        ref_quantiles = np.cumsum(ref_counts[ref_values]) / ref_counts.sum()
+        fit_quantiles = np.cumsum(fit_counts) / fit_counts.sum()
+        lookup_table = np.interp(fit_quantiles, ref_quantiles, ref_values)
+        return np.rint(lookup_table).astype(np.uint8)
@@ -15,7 +15,11 @@ __all__ = ["NormalMerger"]
 
 
 class NormalMerger(ImageMerger):
-    """Merges x, y, and z images into a single normal map image."""
+    """Merges x, y, and z images into a single normal map image.
+
+    The x, y, and z planes are read, normalized, and written to the packed output in a
+    single pass, without intermediate arrays.
+    """
 
     def __call__(self, *input_images: Image.Image) -> Image.Image:
         """Merge images.
@@ -29,17 +33,9 @@ class NormalMerger(ImageMerger):
         y_img = validate_image(input_images[1], self.inputs()["y"])
         z_img = validate_image(input_images[2], self.inputs()["z"])
 
-        x_arr = np.clip(np.array(x_img, float) - 128, -128, 127)
-        y_arr = np.clip(np.array(y_img, float) - 128, -128, 127)
-        z_arr = np.clip(np.array(z_img, float) / 2, 0, 127)
-        magnitude = np.sqrt(x_arr**2 + y_arr**2 + z_arr**2)
-        x_arr = np.clip(((x_arr / magnitude) * 128) + 128, 0, 255).astype(np.uint8)
-        y_arr = np.clip(((y_arr / magnitude) * 128) + 128, 0, 255).astype(np.uint8)
-        z_arr = np.clip(((z_arr / magnitude) * 128) + 128, 0, 255).astype(np.uint8)
-        output_arr = np.zeros((*x_arr.shape, 3), np.uint8)
-        output_arr[:, :, 0] = x_arr
-        output_arr[:, :, 1] = y_arr
-        output_arr[:, :, 2] = z_arr
+        output_arr = self.merge_arrays(
+            np.array(x_img), np.array(y_img), np.array(z_img)
+        )
         output_img = Image.fromarray(output_arr)
 
         return output_img
@@ -59,3 +55,40 @@ class NormalMerger(ImageMerger):
         return {
             "output": ("RGB",),
         }
+
+    @staticmethod
+    def merge_arrays(
+        x_arr: np.ndarray, y_arr: np.ndarray, z_arr: np.ndarray
+    ) -> np.ndarray:
+        """Merge x, y, and z arrays into a normal map array.
+
+        Arrays may have any number of leading dimensions, so that a batch of
+        same-sized maps may be merged at once.
+
+        Arguments:
+            x_arr: 8-bit x array
+            y_arr: 8-bit y array
+            z_arr: 8-bit z array
+        Returns:
+            8-bit normal map array, with an additional trailing dimension of x, y, and z
+        Raises:
+            ValueError: If arrays do not have the same shape
+        """
+        from pipescaler.image.core.numba import merge_normal_arrays  # noqa: PLC0415
+
+        if not x_arr.shape == y_arr.shape == z_arr.shape:
+            raise ValueError(
+                f"x, y, and z arrays must have the same shape; received "
+                f"{x_arr.shape}, {y_arr.shape}, and {z_arr.shape}."
+            )
+        x_arr = np.ascontiguousarray(x_arr, np.uint8)
+        y_arr = np.ascontiguousarray(y_arr, np.uint8)
+        z_arr = np.ascontiguousarray(z_arr, np.uint8)
+        output_arr = np.empty((*x_arr.shape, 3), np.uint8)
+        merge_normal_arrays(
+            x_arr.reshape(-1),
+            y_arr.reshape(-1),
+            z_arr.reshape(-1),
+            output_arr.reshape(-1, 3),
+        )
+        return output_arr
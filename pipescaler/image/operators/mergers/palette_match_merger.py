@@ -13,7 +13,6 @@ from pipescaler.image.core import PaletteMatchMode, UnsupportedImageModeError
 from pipescaler.image.core.operators import ImageMerger
 from pipescaler.image.core.typing import ImageMode
 from pipescaler.image.core.validation import validate_image
-from pipescaler.image.utilities import LocalPaletteMatcher, PaletteMatcher
 
 __all__ = ["PaletteMatchMerger"]
 
@@ -48,6 +47,11 @@ class PaletteMatchMerger(ImageMerger):
         Returns:
             Merged output image
         """
+        from pipescaler.image.utilities import (  # noqa: PLC0415
+            LocalPaletteMatcher,
+            PaletteMatcher,
+        )
+
         ref_image = validate_image(input_images[0], self.inputs()["ref"])
         fit_image = validate_image(input_images[1], self.inputs()["fit"])
         if ref_image.mode != fit_image.mode:
@@ -2,31 +2,34 @@
 #  and distributed under the terms of the BSD license. See the LICENSE file for details.
 """PipeScaler image processor operators package.
 
-This module may import from: common, core, image.core, image.core.operators
+This module may import from: common, core, image.core, image.core.operators,
+image.subdivided_image
 
 Hierarchy within module:
 * crop_processor / expand_processor / height_to_normal_processor / mode_processor /
   potrace_processor / resize_processor / sharpen_processor / solid_color_processor /
-  spandrel_processor / threshold_processor / xbrz_processor
+  spandrel_processor / threshold_processor / tiled_image_processor / xbrz_processor
 """
 
 from __future__ import annotations
 
-from .crop_processor import CropProcessor
-from .expand_processor import ExpandProcessor
-from .height_to_normal_processor import (
-    HeightToNormalProcessor,
-)
-from .mode_processor import ModeProcessor
-from .potrace_processor import PotraceProcessor
-from .resize_processor import ResizeProcessor
-from .sharpen_processor import SharpenProcessor
-from .solid_color_processor import (
-    SolidColorProcessor,
-)
-from .spandrel_processor import SpandrelProcessor
-from .threshold_processor import ThresholdProcessor
-from .xbrz_processor import XbrzProcessor
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .crop_processor import CropProcessor
+    from .expand_processor import ExpandProcessor
+    from .height_to_normal_processor import HeightToNormalProcessor
+    from .mode_processor import ModeProcessor
+    from .potrace_processor import PotraceProcessor
+    from .resize_processor import ResizeProcessor
+    from .sharpen_processor import SharpenProcessor
+    from .solid_color_processor import SolidColorProcessor
+    from .spandrel_processor import SpandrelProcessor
+    from .threshold_processor import ThresholdProcessor
+    from .tiled_image_processor import TiledImageProcessor
+    from .xbrz_processor import XbrzProcessor
 
 __all__ = [
     "CropProcessor",
@@ -39,5 +42,24 @@ __all__ = [
     "SolidColorProcessor",
     "SpandrelProcessor",
     "ThresholdProcessor",
+    "TiledImageProcessor",
     "XbrzProcessor",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "CropProcessor": "crop_processor",
+        "ExpandProcessor": "expand_processor",
+        "HeightToNormalProcessor": "height_to_normal_processor",
+        "ModeProcessor": "mode_processor",
+        "PotraceProcessor": "potrace_processor",
+        "ResizeProcessor": "resize_processor",
+        "SharpenProcessor": "sharpen_processor",
+        "SolidColorProcessor": "solid_color_processor",
+        "SpandrelProcessor": "spandrel_processor",
+        "ThresholdProcessor": "threshold_processor",
+        "TiledImageProcessor": "tiled_image_processor",
+        "XbrzProcessor": "xbrz_processor",
+    },
+)
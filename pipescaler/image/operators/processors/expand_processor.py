@@ -1,34 +1,41 @@
 #  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
 #  and distributed under the terms of the BSD license. See the LICENSE file for details.
-"""Expands image canvas by mirroring image around edges."""
+"""Expands image canvas by padding image around edges."""
 
 from __future__ import annotations
 
 from PIL import Image
 
-from pipescaler.common.validation import val_int
+from pipescaler.common.validation import val_int, val_literal
 from pipescaler.image.core.functions import expand_image
 from pipescaler.image.core.operators import ImageProcessor
-from pipescaler.image.core.typing import ImageMode
+from pipescaler.image.core.typing import ExpandMode, ImageMode
 from pipescaler.image.core.validation import validate_image
 
 __all__ = ["ExpandProcessor"]
 
 
 class ExpandProcessor(ImageProcessor):
-    """Expands image canvas by mirroring image around edges."""
+    """Expands image canvas by padding image around edges."""
 
-    def __init__(self, pixels: tuple[int, int, int, int]):
+    def __init__(
+        self, pixels: tuple[int, int, int, int], mode: ExpandMode = "symmetric"
+    ):
         """Validate and store configuration and initialize.
 
         Arguments:
             pixels: Pixels to add to left, top, right, and bottom
+            mode: Mode with which to fill expanded area; 'symmetric' to mirror image
+              including its edge pixels, 'reflect' to mirror image excluding its edge
+              pixels, 'wrap' to tile image, or 'edge' to repeat its edge pixels
         """
         super().__init__()
 
         self.left, self.top, self.right, self.bottom = val_int(
             pixels, n_values=4, min_value=0
         )
+        self.mode = val_literal(mode, ExpandMode)
+        """Mode with which to fill expanded area"""
 
     def __call__(self, input_image: Image.Image) -> Image.Image:
         """Process an image.
@@ -41,7 +48,7 @@ class ExpandProcessor(ImageProcessor):
         input_image = validate_image(input_image, self.inputs()["input"])
 
         output_image = expand_image(
-            input_image, self.left, self.top, self.right, self.bottom
+            input_image, self.left, self.top, self.right, self.bottom, mode=self.mode
         )
 
         return output_image
@@ -50,7 +57,8 @@ class ExpandProcessor(ImageProcessor):
         """Representation."""
         return (
             f"{self.__class__.__name__}("
-            f"pixels=({self.left!r}, {self.top!r}, {self.right!r}, {self.bottom!r}))"
+            f"pixels=({self.left!r}, {self.top!r}, {self.right!r}, {self.bottom!r}), "
+            f"mode={self.mode!r})"
         )
 
     @classmethod
@@ -4,11 +4,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
 from PIL import Image, ImageOps
-from reportlab.graphics.renderPM import drawToFile
-from svglib.svglib import svg2rlg
 
-from pipescaler.common.file import get_temp_file_path
 from pipescaler.common.validation import val_float
 from pipescaler.image.core.operators import ImageProcessor
 from pipescaler.image.core.typing import ImageMode
@@ -21,6 +22,9 @@ __all__ = ["PotraceProcessor"]
 class PotraceProcessor(ImageProcessor):
     """Traces image using potrace and re-rasterizes, optionally resizing.
 
+    Images are passed to and from potrace via pipes and re-rasterized in memory,
+    without temporary files.
+
     See [Potrace](http://potrace.sourceforge.net/).
     """
 
@@ -51,30 +55,29 @@ class PotraceProcessor(ImageProcessor):
         Returns:
             Processed output image
         """
+        from reportlab.graphics.renderPM import drawToPIL  # noqa: PLC0415
+        from svglib.svglib import svg2rlg  # noqa: PLC0415
+
         input_image, _ = validate_image_and_convert_mode(
             input_image, self.inputs()["input"], "L"
         )
         if self.invert:
             input_image = ImageOps.invert(input_image)
 
-        with get_temp_file_path(".bmp") as temp_bmp_path:
-            input_image.save(temp_bmp_path)
-
-            with get_temp_file_path(".svg") as temp_svg_path:
-                self.potrace_runner.run(temp_bmp_path, temp_svg_path)
-                traced_drawing = svg2rlg(temp_svg_path)
-                if not traced_drawing:
-                    raise ValueError("No drawing found in SVG")
-                traced_drawing.scale(
-                    (input_image.size[0] / traced_drawing.width) * self.scale,
-                    (input_image.size[1] / traced_drawing.height) * self.scale,
-                )
-                traced_drawing.width = int(input_image.size[0] * self.scale)
-                traced_drawing.height = int(input_image.size[1] * self.scale)
-
-                with get_temp_file_path(".png") as temp_png_path:
-                    drawToFile(traced_drawing, temp_png_path, fmt="png")
-                    output_image = Image.open(temp_png_path).convert("L")
+        bmp_buffer = BytesIO()
+        input_image.save(bmp_buffer, format="BMP")
+        svg_bytes = self.potrace_runner.run_piped(bmp_buffer.getvalue())
+
+        traced_drawing = svg2rlg(BytesIO(svg_bytes))
+        if not traced_drawing:
+            raise ValueError("No drawing found in SVG")
+        traced_drawing.scale(
+            (input_image.size[0] / traced_drawing.width) * self.scale,
+            (input_image.size[1] / traced_drawing.height) * self.scale,
+        )
+        traced_drawing.width = int(input_image.size[0] * self.scale)
+        traced_drawing.height = int(input_image.size[1] * self.scale)
+        output_image = drawToPIL(traced_drawing).convert("L")
 
         if self.invert:
             output_image = ImageOps.invert(output_image)
@@ -90,6 +93,21 @@ class PotraceProcessor(ImageProcessor):
             f"scale={self.scale!r})"
         )
 
+    def process_batch(
+        self, input_images: Iterable[Image.Image], max_workers: int | None = None
+    ) -> list[Image.Image]:
+        """Process a batch of images concurrently on a process pool.
+
+        Arguments:
+            input_images: Input images
+            max_workers: Maximum number of processes; if None, chosen by
+              ProcessPoolExecutor
+        Returns:
+            Processed output images, in the same order as input images
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self, input_images))
+
     @classmethod
     def help_markdown(cls) -> str:
         """Short description of this tool in markdown, with links."""
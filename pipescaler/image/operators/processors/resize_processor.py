@@ -4,19 +4,40 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
+import cv2
 import numpy as np
 from PIL import Image
 
-from pipescaler.common.validation import val_float, val_str
+from pipescaler.common.validation import val_float, val_literal, val_str
 from pipescaler.image.core.operators import ImageProcessor
 from pipescaler.image.core.typing import ImageMode
 
 __all__ = ["ResizeProcessor"]
 
+type ResizeBackend = Literal["cv2", "pillow"]
+"""Backends supported by ResizeProcessor."""
 
-class ResizeProcessor(ImageProcessor):
-    """Resizes image canvas."""
 
+class ResizeProcessor(ImageProcessor):
+    """Resizes image canvas.
+
+    All channels are resized in a single pass. By default, the color channels of
+    images with alpha are resized independently of alpha; optionally, they may instead
+    be premultiplied by alpha before resizing and divided by it afterwards, which
+    prevents the colors of transparent pixels from bleeding into neighboring pixels.
+    """
+
+    cv2_interpolations = {
+        "bicubic": cv2.INTER_CUBIC,
+        "bilinear": cv2.INTER_LINEAR,
+        "lanczos": cv2.INTER_LANCZOS4,
+        "nearest": cv2.INTER_NEAREST,
+    }
+    """OpenCV interpolation methods by command-line name."""
+    premultiplied_modes = {"LA": "La", "RGBA": "RGBa"}
+    """Pillow premultiplied-alpha modes by straight-alpha mode."""
     resample_methods = {
         "bicubic": Image.Resampling.BICUBIC,
         "bilinear": Image.Resampling.BILINEAR,
@@ -25,19 +46,33 @@ class ResizeProcessor(ImageProcessor):
     }
     """Pillow resampling methods by command-line name."""
 
-    def __init__(self, scale: float, resample: str = "lanczos"):
+    def __init__(
+        self,
+        scale: float,
+        resample: str = "lanczos",
+        *,
+        premultiply_alpha: bool = False,
+        backend: ResizeBackend = "pillow",
+    ):
         """Validate and store configuration and initialize.
 
         Arguments:
             scale: Output image scale relative to input image
             resample: Resample algorithm
+            premultiply_alpha: Whether to premultiply color channels by alpha before
+              resizing
+            backend: Library with which to resize
         """
         super().__init__()
 
         self.scale = val_float(scale, min_value=0)
-        self.resample = self.resample_methods[
-            val_str(resample, options=self.resample_methods.keys())
-        ]
+        """Output image scale relative to input image"""
+        self.resample = val_str(resample, options=self.resample_methods.keys())
+        """Resample algorithm"""
+        self.premultiply_alpha = premultiply_alpha
+        """Whether to premultiply color channels by alpha before resizing"""
+        self.backend = val_literal(backend, ResizeBackend)
+        """Library with which to resize"""
 
     def __call__(self, input_image: Image.Image) -> Image.Image:
         """Process an image.
@@ -47,42 +82,100 @@ class ResizeProcessor(ImageProcessor):
         Returns:
             Processed output image
         """
-        input_arr = np.array(input_image)
-
         size = (
             round(input_image.size[0] * self.scale),
             round(input_image.size[1] * self.scale),
         )
-        if input_image.mode == "RGBA":
-            rgba_arr = np.zeros((size[1], size[0], 4), np.uint8)
-            rgb_img = Image.fromarray(input_arr[:, :, :3])
-            rgb_img = rgb_img.resize(size, resample=self.resample)
-            rgba_arr[:, :, :3] = np.array(rgb_img)
-            a_img = Image.fromarray(input_arr[:, :, 3])
-            a_img = a_img.resize(size, resample=self.resample)
-            rgba_arr[:, :, 3] = np.array(a_img)
-            output_img = Image.fromarray(rgba_arr)
-        elif input_image.mode == "LA":
-            la_arr = np.zeros((size[1], size[0], 2), np.uint8)
-            l_img = Image.fromarray(input_arr[:, :, 0])
-            l_img = l_img.resize(size, resample=self.resample)
-            la_arr[:, :, 0] = np.array(l_img)
-            a_img = Image.fromarray(input_arr[:, :, 1])
-            a_img = a_img.resize(size, resample=self.resample)
-            la_arr[:, :, 1] = np.array(a_img)
-            output_img = Image.fromarray(la_arr)
-        else:
-            output_img = input_image.resize(size, resample=self.resample)
-
-        return output_img
+        if self.backend == "cv2":
+            return self.resize_cv2(input_image, size)
+        return self.resize_pillow(input_image, size)
 
     def __repr__(self) -> str:
         """Representation."""
         return (
             f"{self.__class__.__name__}("
             f"scale={self.scale!r}, "
-            f"resample={self.resample!r})"
+            f"resample={self.resample!r}, "
+            f"premultiply_alpha={self.premultiply_alpha!r}, "
+            f"backend={self.backend!r})"
+        )
+
+    def resize_cv2(
+        self, input_image: Image.Image, size: tuple[int, int]
+    ) -> Image.Image:
+        """Resize image using OpenCV.
+
+        Arguments:
+            input_image: Input image
+            size: Output image size
+        Returns:
+            Resized image
+        """
+        if input_image.mode in ("1", "P"):
+            # Like Pillow, resize binary and palette images by nearest neighbor
+            input_arr = np.array(input_image)
+            output_arr = cv2.resize(
+                input_arr.view(np.uint8), size, interpolation=cv2.INTER_NEAREST
+            )
+            output_image = Image.fromarray(output_arr.view(input_arr.dtype))
+            if input_image.mode == "P":
+                output_image.putpalette(input_image.getpalette())
+                if "transparency" in input_image.info:
+                    output_image.info["transparency"] = input_image.info["transparency"]
+            return output_image
+
+        interpolation = self.cv2_interpolations[self.resample]
+        input_arr = np.asarray(input_image)
+        if (
+            not self.premultiply_alpha
+            or input_image.mode not in self.premultiplied_modes
+            or self.resample == "nearest"
+        ):
+            output_arr = cv2.resize(input_arr, size, interpolation=interpolation)
+            return Image.fromarray(output_arr)
+
+        premultiplied_arr = input_arr.astype(np.float32)
+        premultiplied_arr[:, :, :-1] *= premultiplied_arr[:, :, -1:] / 255
+        output_arr = cv2.resize(premultiplied_arr, size, interpolation=interpolation)
+        np.clip(output_arr, 0, 255, out=output_arr)
+        alpha = output_arr[:, :, -1:]
+        output_arr[:, :, :-1] = np.divide(
+            output_arr[:, :, :-1] * 255,
+            alpha,
+            out=np.zeros_like(output_arr[:, :, :-1]),
+            where=alpha > 0,
+        )
+        np.clip(output_arr, 0, 255, out=output_arr)
+        return Image.fromarray(np.rint(output_arr).astype(np.uint8))
+
+    def resize_pillow(
+        self, input_image: Image.Image, size: tuple[int, int]
+    ) -> Image.Image:
+        """Resize image using Pillow.
+
+        Arguments:
+            input_image: Input image
+            size: Output image size
+        Returns:
+            Resized image
+        """
+        resample = self.resample_methods[self.resample]
+        if (
+            self.premultiply_alpha
+            or input_image.mode not in self.premultiplied_modes
+            or resample == Image.Resampling.NEAREST
+        ):
+            # Pillow premultiplies color channels of images with alpha by default
+            return input_image.resize(size, resample=resample)
+
+        # Reinterpret straight alpha as premultiplied, so that Pillow resizes all
+        # channels independently
+        premultiplied_mode = self.premultiplied_modes[input_image.mode]
+        premultiplied_image = Image.frombytes(
+            premultiplied_mode, input_image.size, input_image.tobytes()
         )
+        output_image = premultiplied_image.resize(size, resample=resample)
+        return Image.frombytes(input_image.mode, size, output_image.tobytes())
 
     @classmethod
     def inputs(cls) -> dict[str, tuple[ImageMode, ...]]:
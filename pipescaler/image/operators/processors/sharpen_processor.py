@@ -4,22 +4,67 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
+import cv2
 import numpy as np
 from PIL import Image
-from scipy.signal import convolve2d
 
+from pipescaler.common.validation import val_float, val_literal
 from pipescaler.image.core.operators import ImageProcessor
 from pipescaler.image.core.typing import ImageMode
 from pipescaler.image.core.validation import validate_image
 
 __all__ = ["SharpenProcessor"]
 
+type SharpenChannels = Literal["luminance", "rgb", "value"]
+"""Channels of RGB images that may be sharpened by SharpenProcessor."""
+
 
 class SharpenProcessor(ImageProcessor):
-    """Sharpens an image."""
+    """Sharpens an image.
+
+    By default, images are convolved with a 3x3 Laplacian sharpening kernel, scaled
+    by strength; pixels beyond the border of the image are treated as zero. If a
+    nonzero radius is provided, images are instead sharpened by an unsharp mask, in
+    which the difference between the image and a Gaussian blur of the image is scaled
+    by strength and added to the image; the border of the image is reflected.
+
+    All arithmetic is performed by OpenCV on 8-bit images, saturating at 0 and 255.
+    """
+
+    laplacian_kernel = np.array([[0, -1, 0], [-1, 4, -1], [0, -1, 0]], np.float32)
+    """Laplacian kernel, scaled by strength to yield sharpening kernel."""
+
+    def __init__(
+        self,
+        strength: float = 1.0,
+        radius: float = 0.0,
+        channels: SharpenChannels = "value",
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            strength: Strength of sharpening
+            radius: Standard deviation of Gaussian blur of unsharp mask; if 0, a 3x3
+              Laplacian sharpening kernel is used instead
+            channels: Channels of RGB images to sharpen; 'value' to sharpen the value
+              channel in HSV, 'luminance' to sharpen luminance and add the change to
+              each of red, green, and blue, or 'rgb' to sharpen each channel
+        """
+        super().__init__()
 
-    kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], float)
-    """Convolution kernel used for sharpening."""
+        self.strength = val_float(strength, min_value=0)
+        """Strength of sharpening"""
+        self.radius = val_float(radius, min_value=0)
+        """Standard deviation of Gaussian blur of unsharp mask"""
+        self.channels = val_literal(channels, SharpenChannels)
+        """Channels of RGB images to sharpen"""
+
+        identity_kernel = np.zeros((3, 3), np.float32)
+        identity_kernel[1, 1] = 1
+        self.kernel = identity_kernel + self.strength * self.laplacian_kernel
+        """Convolution kernel used for sharpening."""
 
     def __call__(self, input_image: Image.Image) -> Image.Image:
         """Process an image.
@@ -31,21 +76,47 @@ class SharpenProcessor(ImageProcessor):
         """
         input_image = validate_image(input_image, self.inputs()["input"])
 
-        if input_image.mode == "L":
-            input_arr = np.array(input_image).astype(float)
-            output_arr = convolve2d(input_arr, self.kernel, "same")
-            output_arr = np.clip(output_arr, 0, 255).astype(np.uint8)
-            output_img = Image.fromarray(output_arr)
-        else:
-            hsv_img = input_image.convert("HSV")
-
-            hsv_arr = np.array(hsv_img)
-            v_arr = hsv_arr[:, :, 2].astype(float)
-            v_arr = convolve2d(v_arr, self.kernel, "same")
-            hsv_arr[:, :, 2] = np.clip(v_arr, 0, 255).astype(np.uint8)
-            output_img = Image.fromarray(hsv_arr, mode="HSV").convert("RGB")
-
-        return output_img
+        if input_image.mode == "L" or self.channels == "rgb":
+            return Image.fromarray(self.sharpen(np.array(input_image)))
+
+        if self.channels == "luminance":
+            rgb_arr = np.array(input_image)
+            y_arr = cv2.cvtColor(rgb_arr, cv2.COLOR_RGB2GRAY)
+            delta_arr = cv2.subtract(self.sharpen(y_arr), y_arr, dtype=cv2.CV_16S)
+            output_arr = cv2.add(
+                rgb_arr, cv2.merge([delta_arr, delta_arr, delta_arr]), dtype=cv2.CV_8U
+            )
+            return Image.fromarray(output_arr)
+
+        hsv_arr = np.array(input_image.convert("HSV"))
+        hsv_arr[:, :, 2] = self.sharpen(np.ascontiguousarray(hsv_arr[:, :, 2]))
+        return Image.fromarray(hsv_arr, mode="HSV").convert("RGB")
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"strength={self.strength!r}, "
+            f"radius={self.radius!r}, "
+            f"channels={self.channels!r})"
+        )
+
+    def sharpen(self, input_arr: np.ndarray) -> np.ndarray:
+        """Sharpen an 8-bit array.
+
+        Arguments:
+            input_arr: Input array
+        Returns:
+            Sharpened array
+        """
+        if self.radius == 0:
+            return cv2.filter2D(
+                input_arr, -1, self.kernel, borderType=cv2.BORDER_CONSTANT
+            )
+        blurred_arr = cv2.GaussianBlur(input_arr, (0, 0), self.radius)
+        return cv2.addWeighted(
+            input_arr, 1 + self.strength, blurred_arr, -self.strength, 0
+        )
 
     @classmethod
     def inputs(cls) -> dict[str, tuple[ImageMode, ...]]:
@@ -9,9 +9,7 @@ from pathlib import Path
 from typing import Any, cast
 
 import numpy as np
-import torch
 from PIL import Image
-from spandrel import ModelLoader
 
 from pipescaler.common.validation import val_input_path
 from pipescaler.image.core.operators import ImageProcessor
@@ -22,7 +20,11 @@ __all__ = ["SpandrelProcessor"]
 
 
 class SpandrelProcessor(ImageProcessor):
-    """Processes image using Pytorch models loaded through Spandrel."""
+    """Processes image using Pytorch models loaded through Spandrel.
+
+    Pytorch and Spandrel are imported only once a processor is initialized, as
+    importing them takes seconds.
+    """
 
     def __init__(self, model_input_path: Path | str, **kwargs: Any):
         """Initialize.
@@ -31,6 +33,9 @@ class SpandrelProcessor(ImageProcessor):
             model_input_path: Path to model file
             kwargs: Additional keyword arguments (reserved for future use)
         """
+        import torch  # noqa: PLC0415
+        from spandrel import ModelLoader  # noqa: PLC0415
+
         super().__init__()
 
         self.device = "cpu"
@@ -70,6 +75,8 @@ class SpandrelProcessor(ImageProcessor):
         Returns:
             Processed output image
         """
+        import torch  # noqa: PLC0415
+
         input_img, output_mode = validate_image_and_convert_mode(
             input_image, self.inputs()["input"], "RGB"
         )
@@ -101,6 +108,8 @@ class SpandrelProcessor(ImageProcessor):
         Returns:
             Upscaled array
         """
+        import torch  # noqa: PLC0415
+
         input_arr = input_arr * 1.0 / 255
         input_arr = np.transpose(input_arr[:, :, [2, 1, 0]], (2, 0, 1))
         input_tensor = torch.from_numpy(input_arr)
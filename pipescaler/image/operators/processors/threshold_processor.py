@@ -4,10 +4,7 @@
 
 from __future__ import annotations
 
-from typing import no_type_check
-
 import numpy as np
-from numba import njit
 from PIL import Image
 
 from pipescaler.common.validation import val_int
@@ -79,20 +76,13 @@ class ThresholdProcessor(ImageProcessor):
             "output": ("1",),
         }
 
-    @no_type_check
     @staticmethod
-    @njit(nogil=True, cache=True, fastmath=True)
     def denoise_array(data: np.ndarray):
         """Flip color of pixels bordered by less than 5 pixels of the same color.
 
         Arguments:
             data: Input image array; modified in-place
         """
-        for x in range(1, data.shape[1] - 1):
-            for y in range(1, data.shape[0] - 1):
-                slc = data[y - 1 : y + 2, x - 1 : x + 2]
-                if data[y, x] == 0:
-                    if (slc == 0).sum() < 4:
-                        data[y, x] = 255
-                elif (slc == 255).sum() < 4:
-                    data[y, x] = 0
+        from pipescaler.image.core.numba import denoise_binary_array  # noqa: PLC0415
+
+        denoise_binary_array(data)
@@ -0,0 +1,154 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Processes an image in overlapping tiles using another image processor."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from os import process_cpu_count
+from typing import Literal
+
+from PIL import Image
+
+from pipescaler.common.validation import val_int, val_literal
+from pipescaler.image.core.operators import ImageProcessor
+from pipescaler.image.core.typing import ImageMode
+from pipescaler.image.subdivided_image import SubdividedImage
+
+__all__ = ["TiledImageProcessor"]
+
+type TilePool = Literal["process", "thread"]
+"""Pools in which TiledImageProcessor may process tiles."""
+
+
+class TiledImageProcessor(ImageProcessor):
+    """Processes an image in overlapping tiles using another image processor.
+
+    The image is divided into tiles using the geometry of SubdividedImage. Tiles are
+    extracted lazily, processed in a pool of threads or processes, and recomposed in
+    order as they complete, with tapered blending across their overlaps. No more than
+    twice as many tiles as workers are in flight at once, so that memory use is bounded
+    by the size of the tiles rather than that of the image. The scale of the output
+    image is determined from the first processed tile.
+
+    Processors whose output at each pixel depends on a neighborhood of the input
+    should be given an overlap at least as large as that neighborhood.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        processor: ImageProcessor,
+        size: int = 512,
+        overlap: int = 32,
+        *,
+        pool: TilePool = "thread",
+        max_workers: int | None = None,
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            processor: Processor with which to process tiles
+            size: Size of tiles
+            overlap: Overlap between tiles
+            pool: Pool in which to process tiles; 'thread' for processors that release
+              the GIL, 'process' for those that do not; processor must be picklable
+              for the latter
+            max_workers: Maximum number of workers with which to process tiles; if 1,
+              tiles are processed sequentially in the calling thread; if None, chosen
+              by the pool
+        """
+        super().__init__()
+
+        self.processor = processor
+        """Processor with which to process tiles"""
+        self.size = val_int(size, min_value=4)
+        """Size of tiles"""
+        self.overlap = val_int(overlap, min_value=2)
+        """Overlap between tiles"""
+        self.pool = val_literal(pool, TilePool)
+        """Pool in which to process tiles"""
+        self.max_workers: int | None = None
+        """Maximum number of workers with which to process tiles"""
+        if max_workers is not None:
+            self.max_workers = val_int(max_workers, min_value=1)
+
+    def __call__(self, input_image: Image.Image) -> Image.Image:
+        """Process an image.
+
+        Arguments:
+            input_image: Input image
+        Returns:
+            Processed output image
+        """
+        subdivided_image = SubdividedImage(input_image, self.size, self.overlap)
+        output_modes: set[str] = set()
+
+        def get_processed_tiles() -> Iterator[Image.Image]:
+            """Yield processed tiles, blending 1-bit tiles as grayscale."""
+            for tile in self.process_tiles(subdivided_image.iter_subs()):
+                output_modes.add(tile.mode)
+                if tile.mode == "1":
+                    yield tile.convert("L")
+                else:
+                    yield tile
+
+        subdivided_image.recompose(get_processed_tiles())
+        output_image = subdivided_image.image
+        if "1" in output_modes:
+            output_image = output_image.convert("1", dither=Image.Dither.NONE)
+
+        return output_image
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"processor={self.processor!r}, "
+            f"size={self.size!r}, "
+            f"overlap={self.overlap!r}, "
+            f"pool={self.pool!r}, "
+            f"max_workers={self.max_workers!r})"
+        )
+
+    def inputs(  # ty: ignore[invalid-method-override]
+        self,
+    ) -> dict[str, tuple[ImageMode, ...]]:
+        """Inputs to this operator; those of the processor applied to tiles."""
+        return self.processor.inputs()
+
+    def outputs(  # ty: ignore[invalid-method-override]
+        self,
+    ) -> dict[str, tuple[ImageMode, ...]]:
+        """Outputs of this operator; those of the processor applied to tiles."""
+        return self.processor.outputs()
+
+    def process_tiles(self, tiles: Iterable[Image.Image]) -> Iterator[Image.Image]:
+        """Process tiles, yielding processed tiles in order.
+
+        Tiles are consumed from the iterable only as workers become available.
+
+        Arguments:
+            tiles: Tiles to process
+        Yields:
+            Processed tiles
+        """
+        if self.max_workers == 1:
+            for tile in tiles:
+                yield self.processor(tile)
+            return
+
+        max_pending = 2 * (self.max_workers or process_cpu_count() or 1)
+        if self.pool == "process":
+            executor_cls = ProcessPoolExecutor
+        else:
+            executor_cls = ThreadPoolExecutor
+        with executor_cls(max_workers=self.max_workers) as executor:
+            pending: deque[Future[Image.Image]] = deque()
+            for tile in tiles:
+                pending.append(executor.submit(self.processor, tile))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import xbrz
 from PIL import Image
@@ -19,18 +21,40 @@ __all__ = ["XbrzProcessor"]
 class XbrzProcessor(ImageProcessor):
     """Upscales image using xbrz.
 
+    Images taller than band_height are split into horizontal bands, each extended by
+    band_overlap rows of context above and below, which are scaled concurrently on a
+    thread pool; xbrz releases the GIL while scaling. Since each output pixel depends
+    only on nearby input pixels, the stitched output is identical to that of scaling
+    the whole image at once.
+
     See [xbrz](https://github.com/ioistired/xbrz.py).
     """
 
-    def __init__(self, scale: int = 4):
+    band_overlap = 8
+    """Rows of context above and below each band, beyond xbrz's neighborhood"""
+
+    def __init__(
+        self,
+        scale: int = 4,
+        *,
+        band_height: int = 128,
+        max_workers: int | None = None,
+    ):
         """Validate and store configuration and initialize.
 
         Arguments:
             scale: Factor by which to scale output image relative to input
+            band_height: Height of horizontal bands into which to split input image
+            max_workers: Maximum number of threads with which to scale bands; if None,
+              chosen by ThreadPoolExecutor
         """
         super().__init__()
 
         self.scale = val_int(scale, min_value=2, max_value=6)
+        self.band_height = val_int(band_height, min_value=1)
+        self.max_workers: int | None = None
+        if max_workers is not None:
+            self.max_workers = val_int(max_workers, min_value=1)
 
     def __call__(self, input_image: Image.Image) -> Image.Image:
         """Process an image.
@@ -44,21 +68,67 @@ class XbrzProcessor(ImageProcessor):
             input_image, self.inputs()["input"], "RGBA"
         )
 
-        output_image: Image.Image = xbrz.scale_pillow(input_image, self.scale)
-        if output_mode == "RGB":
-            output_image = Image.fromarray(np.array(output_image)[:, :, :3])
-        elif output_mode == "LA":
-            output_image = output_image.convert("LA")
-        elif output_mode in ("1", "L"):
-            output_image = Image.fromarray(np.array(output_image)[:, :, :3]).convert(
-                "L"
-            )
-
+        input_array = np.array(input_image)
+        output_size = (input_image.width * self.scale, input_image.height * self.scale)
+        output_array = np.empty((output_size[1], output_size[0], 4), np.uint8)
+        starts = range(0, input_image.height, self.band_height)
+        if len(starts) == 1 or self.max_workers == 1:
+            for start in starts:
+                self.scale_band(input_array, output_array, start)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self.scale_band, input_array, output_array, start)
+                    for start in starts
+                ]
+                for future in futures:
+                    future.result()
+
+        output_image = Image.frombuffer(
+            "RGBA", output_size, output_array, "raw", "RGBA", 0, 1
+        )
+        if output_mode in ("RGB", "LA"):
+            return output_image.convert(output_mode)
+        if output_mode in ("1", "L"):
+            return output_image.convert("L")
         return output_image
 
     def __repr__(self) -> str:
         """Representation."""
-        return f"{self.__class__.__name__}(scale={self.scale!r})"
+        return (
+            f"{self.__class__.__name__}("
+            f"scale={self.scale!r}, "
+            f"band_height={self.band_height!r}, "
+            f"max_workers={self.max_workers!r})"
+        )
+
+    def scale_band(self, input_array: np.ndarray, output_array: np.ndarray, start: int):
+        """Scale a horizontal band of an image into corresponding rows of output.
+
+        Arguments:
+            input_array: Input image array in RGBA mode
+            output_array: Output image array in RGBA mode, into which to write band
+            start: Index of first row of band within input image
+        """
+        height, width = input_array.shape[:2]
+        stop = min(start + self.band_height, height)
+        context_start = max(start - self.band_overlap, 0)
+        context_stop = min(stop + self.band_overlap, height)
+
+        band = input_array[context_start:context_stop]
+        scaled = xbrz.scale(
+            band,
+            self.scale,
+            width,
+            context_stop - context_start,
+            xbrz.ColorFormat.RGBA,
+        )
+        scaled_array = np.frombuffer(scaled, np.uint8).reshape(
+            -1, width * self.scale, 4
+        )
+        output_array[start * self.scale : stop * self.scale] = scaled_array[
+            (start - context_start) * self.scale : (stop - context_start) * self.scale
+        ]
 
     @classmethod
     def help_markdown(cls) -> str:
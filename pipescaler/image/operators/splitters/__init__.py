@@ -10,10 +10,23 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .alpha_splitter import AlphaSplitter
-from .normal_splitter import NormalSplitter
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .alpha_splitter import AlphaSplitter
+    from .normal_splitter import NormalSplitter
 
 __all__ = [
     "AlphaSplitter",
     "NormalSplitter",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AlphaSplitter": "alpha_splitter",
+        "NormalSplitter": "normal_splitter",
+    },
+)
@@ -15,7 +15,11 @@ __all__ = ["NormalSplitter"]
 
 
 class NormalSplitter(ImageSplitter):
-    """Splits a normal map image into separate x, y, and z images."""
+    """Splits a normal map image into separate x, y, and z images.
+
+    The packed normal map is read and the x, y, and z planes are written in a single
+    pass, without intermediate arrays.
+    """
 
     def __call__(self, input_image: Image.Image) -> tuple[Image.Image, ...]:
         """Split an image.
@@ -26,11 +30,7 @@ class NormalSplitter(ImageSplitter):
             Split output images
         """
         input_image = validate_image(input_image, self.inputs()["input"])
-        input_arr = np.array(input_image)
-        x_arr = input_arr[:, :, 0]
-        y_arr = input_arr[:, :, 1]
-        z_arr = (input_arr[:, :, 2].astype(float) - 128) * 2
-        z_arr = np.clip(z_arr, 0, 255).astype(np.uint8)
+        x_arr, y_arr, z_arr = self.split_array(np.array(input_image))
 
         x_img = Image.fromarray(x_arr)
         y_img = Image.fromarray(y_arr)
@@ -53,3 +53,29 @@ class NormalSplitter(ImageSplitter):
             "y": ("L",),
             "z": ("L",),
         }
+
+    @staticmethod
+    def split_array(input_arr: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Split a normal map array into x, y, and z arrays.
+
+        The array may have any number of leading dimensions, so that a batch of
+        same-sized maps may be split at once.
+
+        Arguments:
+            input_arr: 8-bit normal map array, with a trailing dimension of x, y, and z
+        Returns:
+            8-bit x, y, and z arrays
+        """
+        from pipescaler.image.core.numba import split_normal_array  # noqa: PLC0415
+
+        input_arr = np.ascontiguousarray(input_arr, np.uint8)
+        x_arr = np.empty(input_arr.shape[:-1], np.uint8)
+        y_arr = np.empty(input_arr.shape[:-1], np.uint8)
+        z_arr = np.empty(input_arr.shape[:-1], np.uint8)
+        split_normal_array(
+            input_arr.reshape(-1, 3),
+            x_arr.reshape(-1),
+            y_arr.reshape(-1),
+            z_arr.reshape(-1),
+        )
+        return x_arr, y_arr, z_arr
@@ -8,11 +8,15 @@ image.core.operators
 Hierarchy within module:
 * image_merger_segment / image_processor_segment / image_runner_segment /
   image_splitter_segment
-* post_checkpointed_image_runner_segment
+* fused_image_processor_segment / memoized_image_segment /
+  post_checkpointed_image_runner_segment
 """
 
 from __future__ import annotations
 
+from .fused_image_processor_segment import (
+    FusedImageProcessorSegment,
+)
 from .image_merger_segment import ImageMergerSegment
 from .image_processor_segment import (
     ImageProcessorSegment,
@@ -21,14 +25,17 @@ from .image_runner_segment import ImageRunnerSegment
 from .image_splitter_segment import (
     ImageSplitterSegment,
 )
+from .memoized_image_segment import MemoizedImageSegment
 from .post_checkpointed_image_runner_segment import (
     PostCheckpointedImageRunnerSegment,
 )
 
 __all__ = [
+    "FusedImageProcessorSegment",
     "ImageMergerSegment",
     "ImageProcessorSegment",
     "ImageRunnerSegment",
     "ImageSplitterSegment",
+    "MemoizedImageSegment",
     "PostCheckpointedImageRunnerSegment",
 ]
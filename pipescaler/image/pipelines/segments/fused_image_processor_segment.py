@@ -0,0 +1,38 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Segment that applies a chain of ImageProcessors as a single step."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from pipescaler.image.core.operators import FusedImageProcessor, ImageProcessor
+
+from .image_processor_segment import ImageProcessorSegment
+
+__all__ = ["FusedImageProcessorSegment"]
+
+
+class FusedImageProcessorSegment(ImageProcessorSegment):
+    """Segment that applies a chain of ImageProcessors as a single step.
+
+    Only the output of the final processor is wrapped in a PipeImage; intermediate
+    images are neither wrapped nor logged.
+    """
+
+    operator: FusedImageProcessor
+    """Operator to apply."""
+
+    def __init__(self, processors: Sequence[ImageProcessor]):
+        """Initialize.
+
+        Arguments:
+            processors: Processors to apply, in order
+        """
+        super().__init__(FusedImageProcessor(processors))
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}(processors={list(self.operator.processors)!r})"
+        )
@@ -4,17 +4,31 @@
 
 from __future__ import annotations
 
-from logging import warning
+from collections.abc import Sequence
+from contextlib import ExitStack
+from io import BytesIO
+from logging import info, warning
+from pathlib import Path
+
+from PIL import Image
 
 from pipescaler.common.file import get_temp_file_path
+from pipescaler.core import Runner, RunnerPool
 from pipescaler.core.typing import RunnerLike
+from pipescaler.image.core.functions import remove_palette
 from pipescaler.image.core.pipelines import ImageSegment, PipeImage
 
 __all__ = ["ImageRunnerSegment"]
 
 
 class ImageRunnerSegment(ImageSegment):
-    """Segment that applies a Runner."""
+    """Segment that applies a Runner.
+
+    If the runner supports reading input from standard input and writing output to
+    standard output, the input image is encoded in memory and piped to the runner, and
+    the output image decoded from its output, without temporary files. Otherwise,
+    temporary files are placed on a memory-backed filesystem, if available.
+    """
 
     def __init__(
         self,
@@ -47,21 +61,24 @@ class ImageRunnerSegment(ImageSegment):
         if len(input_objs) != 1:
             raise ValueError("RunnerSegment requires 1 input")
 
-        with get_temp_file_path(self.output_extension) as output_path:
+        if self.piped:
+            output_bytes = self.run_piped(input_objs[0])
+            output_image = self.get_output_image(output_bytes)
+            output = PipeImage(image=output_image, parents=input_objs[0])
+            self.warn_output_temporary()
+            return (output,)
+
+        with get_temp_file_path(self.output_extension, in_memory=True) as output_path:
             if input_objs[0].path is None:
-                with get_temp_file_path(self.input_extension) as input_path:
+                with get_temp_file_path(
+                    self.input_extension, in_memory=True
+                ) as input_path:
                     input_objs[0].image.save(input_path)
                     self.runner(input_path, output_path)
             else:
                 self.runner(input_objs[0].path, output_path)
-            output = PipeImage(path=output_path, parents=input_objs[0])
-            warning(
-                f"{self}: Output file is temporary and only image content is retained; "
-                f"if output file is needed (e.g. if the purpose of this processor is "
-                f"to convert an image to a specific format such as DDS), use a "
-                f"PostCheckpointedImageRunnerSegment."
-            )
-        output.path = None
+            output = self.load_output(input_objs[0], output_path)
+        self.warn_output_temporary()
 
         return (output,)
 
@@ -72,3 +89,119 @@ class ImageRunnerSegment(ImageSegment):
             f"input_extension={self.input_extension!r}, "
             f" output_extension={self.output_extension!r})"
         )
+
+    @property
+    def piped(self) -> bool:
+        """Whether runner reads input from stdin and writes output to stdout."""
+        return isinstance(self.runner, Runner) and self.runner.piped_command is not None
+
+    def get_input_bytes(self, input_obj: PipeImage) -> bytes:
+        """Get contents of input file for runner.
+
+        Arguments:
+            input_obj: Input image
+        Returns:
+            Contents of input image's file if it has one, otherwise image encoded in
+            format of input extension
+        """
+        if input_obj.path is not None:
+            return input_obj.path.read_bytes()
+        input_buffer = BytesIO()
+        input_obj.image.save(
+            input_buffer, format=Image.registered_extensions()[self.input_extension]
+        )
+        return input_buffer.getvalue()
+
+    def load_output(self, input_obj: PipeImage, output_path: Path) -> PipeImage:
+        """Load output image from temporary output file, before it is removed.
+
+        Arguments:
+            input_obj: Input image
+            output_path: Path to temporary output file
+        Returns:
+            Output image, retaining only image content
+        """
+        output = PipeImage(path=output_path, parents=input_obj)
+        output.image.load()
+        output.path = None
+
+        return output
+
+    def process_batch(
+        self, input_objs: Sequence[PipeImage], max_workers: int | None = None
+    ) -> list[PipeImage]:
+        """Process a batch of images, running the runner on several at once.
+
+        The runner is run on files, placed on a memory-backed filesystem if available,
+        whether or not it supports piped input and output.
+
+        Arguments:
+            input_objs: Input images
+            max_workers: Maximum number of runner invocations to run at once; if None,
+              the number of CPUs available to this process
+        Returns:
+            Output images, in the same order as input images
+        """
+        with ExitStack() as stack:
+            jobs = []
+            for input_obj in input_objs:
+                output_path = stack.enter_context(
+                    get_temp_file_path(self.output_extension, in_memory=True)
+                )
+                if input_obj.path is None:
+                    input_path = stack.enter_context(
+                        get_temp_file_path(self.input_extension, in_memory=True)
+                    )
+                    input_obj.image.save(input_path)
+                else:
+                    input_path = input_obj.path
+                jobs.append((input_path, output_path))
+
+            # Pool is shut down before temporary files are removed
+            pool = stack.enter_context(RunnerPool(self.runner, max_workers))
+            futures = pool.map(jobs)
+
+            outputs = []
+            for input_obj, (_, output_path), future in zip(input_objs, jobs, futures):
+                future.result()
+                outputs.append(self.load_output(input_obj, output_path))
+                info(f"{self}: '{input_obj.location_name}' processed")
+        self.warn_output_temporary()
+
+        return outputs
+
+    def run_piped(self, input_obj: PipeImage) -> bytes:
+        """Run runner on input image via stdin, yielding contents of output via stdout.
+
+        Arguments:
+            input_obj: Input image
+        Returns:
+            Contents of output file
+        """
+        if not isinstance(self.runner, Runner):
+            raise TypeError(f"{self.runner} does not support piped input and output")
+        return self.runner.call_piped(self.get_input_bytes(input_obj))
+
+    def warn_output_temporary(self):
+        """Warn that output files are temporary."""
+        warning(
+            f"{self}: Output file is temporary and only image content is retained; "
+            f"if output file is needed (e.g. if the purpose of this processor is "
+            f"to convert an image to a specific format such as DDS), use a "
+            f"PostCheckpointedImageRunnerSegment."
+        )
+
+    @staticmethod
+    def get_output_image(output_bytes: bytes) -> Image.Image:
+        """Decode output image from contents of output file.
+
+        Arguments:
+            output_bytes: Contents of output file
+        Returns:
+            Output image
+        """
+        output_image = Image.open(BytesIO(output_bytes))
+        output_image.load()
+        if output_image.mode == "P":
+            output_image = remove_palette(output_image)
+        return output_image
@@ -0,0 +1,223 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Segment that memoizes outputs of an image operator segment by input content."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from hashlib import blake2b
+from logging import debug, info
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from PIL import Image
+
+from pipescaler.common.validation import val_int, val_output_dir_path
+from pipescaler.image.core import ImageOperator
+from pipescaler.image.core.functions import get_image_digest
+from pipescaler.image.core.pipelines import (
+    ImageOperatorSegment,
+    ImageSegment,
+    PipeImage,
+)
+
+__all__ = ["MemoizedImageSegment"]
+
+
+class MemoizedImageSegment(ImageSegment):
+    """Segment that memoizes outputs of an image operator segment by input content.
+
+    Outputs are keyed on the representation of the segment's operator and the digests
+    of the pixels of its inputs, so that work is reused whenever the same pixels reach
+    the same operator, regardless of the names or locations of the images. Operators
+    must therefore be deterministic.
+
+    Outputs are held in memory, the least recently used being discarded once their
+    total size exceeds a maximum. Optionally, outputs are also saved to a directory as
+    PNG files, from which they are loaded if not present in memory, including in later
+    sessions.
+
+    Output images loaded from memory are shared between all outputs of the same key,
+    and must not be modified in place.
+    """
+
+    def __init__(
+        self,
+        segment: ImageOperatorSegment[ImageOperator],
+        max_size: int = 2**28,
+        dir_path: Path | str | None = None,
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            segment: Segment whose outputs to memoize
+            max_size: Maximum total size in bytes of output images held in memory
+            dir_path: Path to directory in which to save outputs; if None, outputs are
+              held only in memory
+        """
+        if not isinstance(segment, ImageOperatorSegment):
+            raise TypeError(
+                f"{self.__class__.__name__} requires an ImageOperatorSegment, but "
+                f"received {segment.__class__.__name__}"
+            )
+
+        self.segment = segment
+        """Segment whose outputs to memoize"""
+        self.max_size = val_int(max_size, min_value=0)
+        """Maximum total size in bytes of output images held in memory"""
+        self.dir_path: Path | None = None
+        """Path to directory in which to save outputs"""
+        if dir_path is not None:
+            self.dir_path = val_output_dir_path(dir_path)
+
+        self.entries: OrderedDict[str, tuple[Image.Image, ...]] = OrderedDict()
+        """Output images by key, from least to most recently used"""
+        self.size = 0
+        """Total size in bytes of output images held in memory"""
+        self.hits = 0
+        """Number of inputs whose outputs were found in memory"""
+        self.disk_hits = 0
+        """Number of inputs whose outputs were found in directory"""
+        self.misses = 0
+        """Number of inputs whose outputs were not found"""
+
+    def __call__(self, *input_objs: PipeImage) -> tuple[PipeImage, ...]:
+        """Return outputs of wrapped segment, loaded from memo if available.
+
+        Arguments:
+            input_objs: Input images
+        Returns:
+            Output images
+        """
+        key = self.get_key(input_objs)
+        output_images = self.load(key)
+        if output_images is None:
+            outputs = self.segment(*input_objs)
+            self.save(key, tuple(output.image for output in outputs))
+            return outputs
+
+        outputs = tuple(PipeImage(image=o, parents=input_objs) for o in output_images)
+        info(f"{self}: '{input_objs[0].location_name}' loaded from memo")
+
+        return outputs
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"segment={self.segment!r}, "
+            f"max_size={self.max_size!r}, "
+            f"dir_path={self.dir_path!r})"
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Numbers of inputs whose outputs were found in memory, on disk, or not."""
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses}
+
+    def get_key(self, input_objs: tuple[PipeImage, ...]) -> str:
+        """Get key of outputs of input images.
+
+        Arguments:
+            input_objs: Input images
+        Returns:
+            Key of outputs
+        """
+        digest = blake2b(repr(self.segment.operator).encode(), digest_size=16)
+        for input_obj in input_objs:
+            digest.update(get_image_digest(input_obj.image).encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> tuple[Image.Image, ...] | None:
+        """Load output images from memory or directory, if available.
+
+        Arguments:
+            key: Key of outputs
+        Returns:
+            Output images if available, otherwise None
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.dir_path is not None:
+            key_dir_path = self.dir_path / key
+            if key_dir_path.exists():
+                output_images = []
+                for output_path in sorted(key_dir_path.glob("*.png")):
+                    output_image = Image.open(output_path)
+                    output_image.load()
+                    output_images.append(output_image)
+                debug(f"{self}: '{key}' loaded from '{key_dir_path}'")
+                self.disk_hits += 1
+                self.store(key, tuple(output_images))
+                return tuple(output_images)
+
+        self.misses += 1
+        return None
+
+    def pass_duplicates(self, *input_objs: PipeImage) -> tuple[PipeImage, ...]:
+        """Pass input images that duplicate earlier images through wrapped segment.
+
+        Arguments:
+            input_objs: Input images, each a duplicate of an earlier image
+        Returns:
+            Input images, as passed through by wrapped segment
+        """
+        return self.segment.pass_duplicates(*input_objs)
+
+    def save(self, key: str, output_images: tuple[Image.Image, ...]):
+        """Save output images to memory and directory, if configured.
+
+        Arguments:
+            key: Key of outputs
+            output_images: Output images
+        """
+        self.store(key, output_images)
+        if self.dir_path is None:
+            return
+
+        key_dir_path = self.dir_path / key
+        if key_dir_path.exists():
+            return
+
+        # Save to a uniquely-named temporary directory first, so that outputs are all
+        # or nothing, and sessions saving the same key at once do not collide
+        partial_dir_path = Path(mkdtemp(prefix=f".{key}.", dir=self.dir_path))
+        try:
+            for i, output_image in enumerate(output_images):
+                output_image.save(partial_dir_path / f"{i:03d}.png")
+            partial_dir_path.rename(key_dir_path)
+        except OSError:
+            rmtree(partial_dir_path, ignore_errors=True)
+            if not key_dir_path.exists():
+                raise
+            debug(f"{self}: '{key}' already saved to '{key_dir_path}'")
+            return
+        debug(f"{self}: '{key}' saved to '{key_dir_path}'")
+
+    def store(self, key: str, output_images: tuple[Image.Image, ...]):
+        """Store output images in memory, discarding least recently used if needed.
+
+        Arguments:
+            key: Key of outputs
+            output_images: Output images
+        """
+        self.entries[key] = output_images
+        self.size += self.get_size(output_images)
+        while self.size > self.max_size and self.entries:
+            _, discarded_images = self.entries.popitem(last=False)
+            self.size -= self.get_size(discarded_images)
+
+    @staticmethod
+    def get_size(images: tuple[Image.Image, ...]) -> int:
+        """Get approximate size in bytes of images' pixels.
+
+        Arguments:
+            images: Images
+        Returns:
+            Approximate size in bytes of images' pixels
+        """
+        return sum(i.width * i.height * len(i.getbands()) for i in images)
@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from contextlib import ExitStack
 from logging import info
+from time import perf_counter
 
 from pipescaler.common.file import get_temp_file_path
+from pipescaler.common.instrumentation import measure
+from pipescaler.core import RunnerPool
 from pipescaler.core.pipelines import CheckpointedSegment, CheckpointManagerBase
 from pipescaler.image.core.pipelines import PipeImage
 
@@ -59,25 +63,110 @@ class PostCheckpointedImageRunnerSegment(CheckpointedSegment):
             consistency with other Segments
         """
         cpt_path = self.cp_manager.dir_path / input_objs[0].location_name / self.cpts[0]
-        if cpt_path.exists() and self.cp_manager.checkpoints_current(
-            input_objs, [cpt_path]
+        with measure(
+            "checkpoint_load", self.__class__.__name__, self.cpts[0], input_objs[0]
         ):
+            loaded = self.cp_manager.checkpoints_available(input_objs, [cpt_path])
+        if loaded:
             output = PipeImage(path=cpt_path, parents=input_objs)
             info(
                 f"{self}: '{input_objs[0].location_name}' checkpoints "
                 f"'{self.cpts}' loaded"
             )
         else:
-            if not cpt_path.parent.exists():
-                cpt_path.parent.mkdir(parents=True)
-            if input_objs[0].path is None:
-                with get_temp_file_path(self.segment.input_extension) as input_path:
-                    input_objs[0].image.save(input_path)
-                    self.segment.runner(input_path, cpt_path)
-            else:
-                self.segment.runner(input_objs[0].path, cpt_path)
+            start = perf_counter()
+            with measure(
+                "checkpoint_run", self.__class__.__name__, self.cpts[0], input_objs[0]
+            ):
+                if not cpt_path.parent.exists():
+                    cpt_path.parent.mkdir(parents=True)
+                if self.segment.piped:
+                    cpt_path.write_bytes(self.segment.run_piped(input_objs[0]))
+                elif input_objs[0].path is None:
+                    with get_temp_file_path(
+                        self.segment.input_extension, in_memory=True
+                    ) as input_path:
+                        input_objs[0].image.save(input_path)
+                        self.segment.runner(input_path, cpt_path)
+                else:
+                    self.segment.runner(input_objs[0].path, cpt_path)
+            self.cp_manager.record_computed(
+                self.cpts[0], perf_counter() - start, cpt_path
+            )
             output = PipeImage(path=cpt_path, parents=input_objs[0])
             info(f"{self}: '{output.location_name}' checkpoint '{self.cpts[0]}' saved")
         self.cp_manager.observe(input_objs[0].location_name, self.cpts[0])
 
         return (output,)
+
+    def process_batch(
+        self, input_objs: Sequence[PipeImage], max_workers: int | None = None
+    ) -> list[PipeImage]:
+        """Process a batch of images, running the runner on several at once.
+
+        Images whose checkpoints are current are loaded from them; the runner is run
+        on the remainder concurrently. Images that duplicate earlier images are passed
+        through, their checkpoints linked from those of the duplicated images once the
+        runner has finished.
+
+        Arguments:
+            input_objs: Input images
+            max_workers: Maximum number of runner invocations to run at once; if None,
+              the number of CPUs available to this process
+        Returns:
+            Output images, in the same order as input images
+        """
+        outputs: list[PipeImage | None] = [None] * len(input_objs)
+        duplicate_indexes = []
+        with ExitStack() as stack:
+            jobs = []
+            job_indexes = []
+            for i, input_obj in enumerate(input_objs):
+                if input_obj.duplicate_of is not None:
+                    duplicate_indexes.append(i)
+                    continue
+                cpt_path = (
+                    self.cp_manager.dir_path / input_obj.location_name / self.cpts[0]
+                )
+                if self.cp_manager.checkpoints_available((input_obj,), [cpt_path]):
+                    outputs[i] = PipeImage(path=cpt_path, parents=(input_obj,))
+                    info(
+                        f"{self}: '{input_obj.location_name}' checkpoints "
+                        f"'{self.cpts}' loaded"
+                    )
+                    continue
+                if not cpt_path.parent.exists():
+                    cpt_path.parent.mkdir(parents=True)
+                if input_obj.path is None:
+                    input_path = stack.enter_context(
+                        get_temp_file_path(self.segment.input_extension, in_memory=True)
+                    )
+                    input_obj.image.save(input_path)
+                else:
+                    input_path = input_obj.path
+                jobs.append((input_path, cpt_path))
+                job_indexes.append(i)
+
+            # Pool is shut down before temporary files are removed
+            pool = stack.enter_context(RunnerPool(self.segment.runner, max_workers))
+            start = perf_counter()
+            futures = pool.map(jobs)
+            for i, (_, cpt_path), future in zip(job_indexes, jobs, futures):
+                future.result()
+            # Runs overlap, so each is attributed an equal share of the batch's time
+            seconds = (perf_counter() - start) / max(len(jobs), 1)
+            for i, (_, cpt_path) in zip(job_indexes, jobs):
+                self.cp_manager.record_computed(self.cpts[0], seconds, cpt_path)
+                outputs[i] = PipeImage(path=cpt_path, parents=input_objs[i])
+                info(
+                    f"{self}: '{input_objs[i].location_name}' checkpoint "
+                    f"'{self.cpts[0]}' saved"
+                )
+
+        for i in duplicate_indexes:
+            outputs[i] = self.pass_duplicates(input_objs[i])[0]
+
+        for input_obj in input_objs:
+            self.cp_manager.observe(input_obj.location_name, self.cpts[0])
+
+        return [output for output in outputs if output is not None]
@@ -6,10 +6,14 @@ This module may import from: common, core.pipelines, image.core.pipelines
 
 Hierarchy within module:
 * image_directory_source / image_video_frame_source
+* image_deduplicating_source
 """
 
 from __future__ import annotations
 
+from .image_deduplicating_source import (
+    ImageDeduplicatingSource,
+)
 from .image_directory_source import (
     ImageDirectorySource,
 )
@@ -18,6 +22,7 @@ from .image_video_frame_source import (
 )
 
 __all__ = [
+    "ImageDeduplicatingSource",
     "ImageDirectorySource",
     "ImageVideoFrameSource",
 ]
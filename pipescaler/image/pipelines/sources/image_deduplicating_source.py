@@ -0,0 +1,131 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Yields images from another source, identifying duplicates by content."""
+
+from __future__ import annotations
+
+from logging import info
+from typing import Any
+from weakref import ReferenceType, ref
+
+from pipescaler.common.file import get_file_digest
+from pipescaler.image.core.functions import get_image_digest
+from pipescaler.image.core.pipelines import ImageSource, PipeImage
+
+__all__ = ["ImageDeduplicatingSource"]
+
+
+class ImageDeduplicatingSource(ImageSource):
+    """Yields images from another source, identifying duplicates by content.
+
+    The first image yielded with given contents is the canonical image for those
+    contents. Each later image whose file is byte-identical to, or whose pixels are
+    identical to, those of a canonical image is yielded with duplicate_of set to a
+    reference to the canonical image. Segments pass duplicates through without
+    processing them, linking the checkpoints of the canonical image if checkpointed,
+    and a terminus fulfils them from the output of the canonical image.
+
+    Canonical images with paths are referenced by path, so that their images are not
+    held in memory. Canonical images without paths are referenced weakly, and so are
+    not held in memory by this source; once such an image has been released by the
+    pipeline, later images with its contents are yielded as canonical images.
+
+    Files are first compared by digest of their bytes, so that byte-identical
+    duplicates are identified without decoding; images not identified this way are
+    decoded and compared by digest of their pixels.
+    """
+
+    def __init__(self, source: ImageSource, **kwargs: Any):
+        """Initialize.
+
+        Arguments:
+            source: Source from which to yield images
+            **kwargs: Additional keyword arguments
+        """
+        super().__init__(**kwargs)
+
+        self.source = source
+        """Source from which to yield images"""
+        self.file_digests: dict[str, PipeImage] = {}
+        """References to canonical images, keyed by digest of file bytes"""
+        self.image_digests: dict[str, PipeImage | ReferenceType[PipeImage]] = {}
+        """References to canonical images, keyed by digest of pixels"""
+        self.n_duplicates = 0
+        """Number of duplicate images yielded"""
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"{self.__class__.__name__}(source={self.source!r})"
+
+    def __next__(self) -> PipeImage:
+        """Get next image, identifying it as a duplicate if applicable."""
+        pipe_image = next(self.source)
+        if pipe_image.duplicate_of is not None:
+            return pipe_image
+
+        file_digest = None
+        if pipe_image.path is not None:
+            file_digest = get_file_digest(pipe_image.path)
+            if file_digest in self.file_digests:
+                return self.get_duplicate(pipe_image, self.file_digests[file_digest])
+
+        image_digest = get_image_digest(pipe_image.image)
+        canonical = self.image_digests.get(image_digest)
+        if isinstance(canonical, ReferenceType):
+            canonical = canonical()
+        if canonical is not None:
+            if file_digest is not None and canonical.path is not None:
+                self.file_digests[file_digest] = canonical
+            return self.get_duplicate(pipe_image, canonical)
+
+        reference = self.get_reference(pipe_image)
+        if file_digest is not None and isinstance(reference, PipeImage):
+            self.file_digests[file_digest] = reference
+        self.image_digests[image_digest] = reference
+        return pipe_image
+
+    def get_duplicate(self, pipe_image: PipeImage, canonical: PipeImage) -> PipeImage:
+        """Get image identified as a duplicate of a canonical image.
+
+        Arguments:
+            pipe_image: Image yielded by source
+            canonical: Reference to canonical image
+        Returns:
+            Image with duplicate_of set to canonical image
+        """
+        self.n_duplicates += 1
+        info(
+            f"{self}: '{pipe_image.location_name}' duplicates "
+            f"'{canonical.location_name}'"
+        )
+        if pipe_image.path is not None:
+            return PipeImage(
+                path=pipe_image.path,
+                name=pipe_image.name,
+                location_path=pipe_image.location,
+                duplicate_of=canonical,
+            )
+        return PipeImage(
+            image=pipe_image.image,
+            name=pipe_image.name,
+            location_path=pipe_image.location,
+            duplicate_of=canonical,
+        )
+
+    @staticmethod
+    def get_reference(pipe_image: PipeImage) -> PipeImage | ReferenceType[PipeImage]:
+        """Get reference to a canonical image that does not hold it in memory.
+
+        Arguments:
+            pipe_image: Canonical image
+        Returns:
+            If the image has a path, an image loading its image from that path only if
+            needed; otherwise, a weak reference to the image
+        """
+        if pipe_image.path is not None:
+            return PipeImage(
+                path=pipe_image.path,
+                name=pipe_image.name,
+                location_path=pipe_image.location,
+            )
+        return ref(pipe_image)
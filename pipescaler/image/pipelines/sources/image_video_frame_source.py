@@ -4,25 +4,57 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from hashlib import blake2b
+from logging import debug
 from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Event, Thread
 from typing import Any
 
 import cv2
+import numpy as np
 from PIL import Image
 
-from pipescaler.common.validation import val_input_path
+from pipescaler.common.validation import val_input_path, val_int
 from pipescaler.image.core.pipelines import ImageSource, PipeImage
 
 __all__ = ["ImageVideoFrameSource"]
 
+type DecodedFrame = tuple[int, Image.Image, bytes | None, np.uint64 | None]
+"""Index of frame, frame, and exact and perceptual hashes of frame, if calculated."""
+
 
 class ImageVideoFrameSource(ImageSource):
-    """Yields images from a video file."""
+    """Yields images from a video file.
+
+    Frames are decoded sequentially on a background thread and passed through a
+    bounded queue, so that decoding of upcoming frames overlaps with processing of
+    the current frame. The video is seeked at most once, to the first selected frame;
+    frames skipped by the stride are grabbed but not retrieved or converted.
+
+    Optionally, frames may be deduplicated, which is useful for animated content in
+    which frames are held or repeated. Each selected frame is hashed, exactly and
+    optionally perceptually, and frames matching an earlier frame are yielded with
+    duplicate_of set to the image yielded for the earlier frame. Segments pass such
+    frames through without processing them, and a terminus fulfils them from the
+    output of the earlier frame. So that memory is bounded, only the most recent
+    unique frames are retained for later frames to duplicate; a frame matching an
+    earlier frame that is no longer retained is yielded as a unique frame.
+    """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         input_path: Path | str,
         location_path: Path | None = None,
+        *,
+        start: int = 0,
+        stop: int | None = None,
+        stride: int = 1,
+        queue_size: int = 8,
+        dedup: bool = False,
+        dedup_tolerance: int | None = None,
+        dedup_window: int = 64,
         **kwargs: Any,
     ):
         """Initialize.
@@ -30,6 +62,16 @@ class ImageVideoFrameSource(ImageSource):
         Arguments:
             input_path: Video file from which to yield images
             location_path: Path relative to parent directory
+            start: Index of first frame to yield
+            stop: Index of frame at which to stop, exclusive; if None, end of video
+            stride: Interval between yielded frames
+            queue_size: Maximum number of decoded frames to hold in queue
+            dedup: Whether to identify frames that duplicate an earlier frame
+            dedup_tolerance: Maximum number of differing bits between perceptual hashes
+              of frames for them to be considered duplicates; if None, only frames
+              whose pixels are exactly identical are considered duplicates
+            dedup_window: Maximum number of unique frames to retain for later frames
+              to duplicate
             **kwargs: Additional keyword arguments
         """
         super().__init__(**kwargs)
@@ -38,12 +80,55 @@ class ImageVideoFrameSource(ImageSource):
         """Path to video file"""
         self.location_path = location_path
         """Path relative to parent directory"""
+        self.start = val_int(start, min_value=0)
+        """Index of first frame to yield"""
+        self.stop: int | None = None
+        """Index of frame at which to stop, exclusive; if None, end of video"""
+        if stop is not None:
+            self.stop = val_int(stop, min_value=0)
+        self.stride = val_int(stride, min_value=1)
+        """Interval between yielded frames"""
+        self.queue_size = val_int(queue_size, min_value=1)
+        """Maximum number of decoded frames to hold in queue"""
+        self.dedup = dedup
+        """Whether to identify frames that duplicate an earlier frame"""
+        self.dedup_tolerance: int | None = None
+        """Maximum number of differing bits between perceptual hashes of duplicates"""
+        if dedup_tolerance is not None:
+            self.dedup_tolerance = val_int(dedup_tolerance, min_value=0, max_value=64)
+        self.dedup_window = val_int(dedup_window, min_value=1)
+        """Maximum number of unique frames to retain for later frames to duplicate"""
+
         self.cap = cv2.VideoCapture(str(self.input_path))
         """Video capture"""
         self.length = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         """Number of frames in video"""
-        self.index = 0
-        """Index of next frame to be read"""
+        self.index = self.start
+        """Index of next frame to be yielded"""
+
+        self._queue: Queue[DecodedFrame | BaseException | None] = Queue(
+            maxsize=self.queue_size
+        )
+        """Queue of decoded frames, exceptions raised while decoding, or None at end"""
+        self._unique_frames: OrderedDict[int, PipeImage] = OrderedDict()
+        """Images of retained unique frames by index, from least to most recently
+        duplicated"""
+        self._exact_hashes: dict[bytes, int] = {}
+        """Index of retained unique frame with each exact hash"""
+        self._unique_exact_hashes: dict[int, bytes] = {}
+        """Exact hash of each retained unique frame by index"""
+        self._perceptual_hashes = np.zeros(self.dedup_window, np.uint64)
+        """Perceptual hashes of retained unique frames by slot"""
+        self._perceptual_indexes = np.full(self.dedup_window, -1, np.int64)
+        """Index of retained unique frame in each slot, or -1 if slot is empty"""
+        self._stop_event = Event()
+        """Event set to signal decode thread to stop"""
+        self._thread: Thread | None = None
+        """Background decode thread; started on first call to __next__"""
+
+    def __del__(self):
+        """Stop decode thread and release video capture."""
+        self.close()
 
     def __repr__(self) -> str:
         """Representation."""
@@ -53,26 +138,212 @@ class ImageVideoFrameSource(ImageSource):
             location_path = f"Path({str(self.location_path)!r})"
         return (
             f"{self.__class__.__name__}(input_path={input_path}, "
-            f"location_path={location_path})"
+            f"location_path={location_path}, "
+            f"start={self.start!r}, "
+            f"stop={self.stop!r}, "
+            f"stride={self.stride!r}, "
+            f"queue_size={self.queue_size!r}, "
+            f"dedup={self.dedup!r}, "
+            f"dedup_tolerance={self.dedup_tolerance!r}, "
+            f"dedup_window={self.dedup_window!r})"
         )
 
     def __next__(self) -> PipeImage:
         """Get next image from video."""
-        if self.index < self.length:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.index)
-            _, frame = self.cap.read()
-            self.index += 1
-            img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            location_path = Path(
-                f"{self.input_path.stem}_{self.input_path.suffix.lstrip('.')}"
+        if self._thread is None:
+            self._thread = Thread(target=self._decode, daemon=True)
+            self._thread.start()
+
+        item = None
+        if not self._stop_event.is_set() or not self._queue.empty():
+            item = self._queue.get()
+        if isinstance(item, BaseException):
+            self.close()
+            raise item
+        if item is None:
+            self.close()
+            raise StopIteration()
+
+        frame_index, img, exact_hash, perceptual_hash = item
+        self.index = frame_index + self.stride
+        location_path = Path(
+            f"{self.input_path.stem}_{self.input_path.suffix.lstrip('.')}"
+        )
+        if self.location_path:
+            location_path = self.location_path / location_path
+        duplicate_of = None
+        if exact_hash is not None:
+            duplicate_of = self._get_duplicate_of(exact_hash, perceptual_hash)
+        pipe_image = PipeImage(
+            image=img,
+            name=f"{frame_index + 1:06d}",
+            location_path=location_path,
+            duplicate_of=duplicate_of,
+        )
+        if duplicate_of is not None:
+            debug(
+                f"{self}: '{pipe_image.location_name}' duplicates "
+                f"'{duplicate_of.location_name}'"
             )
-            if self.location_path:
-                location_path = self.location_path / location_path
-            return PipeImage(
-                image=img,
-                name=f"{self.index:06d}",
-                location_path=location_path,
+        elif exact_hash is not None:
+            self._store_unique_frame(
+                frame_index, pipe_image, exact_hash, perceptual_hash
             )
+        return pipe_image
+
+    def close(self):
+        """Stop decode thread and release video capture."""
+        stop_event = getattr(self, "_stop_event", None)
+        if stop_event is None:
+            return
+        stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            while thread.is_alive():
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    pass
+                thread.join(timeout=0.01)
+        else:
+            self.cap.release()
+
+    def _decode(self):
+        """Decode selected frames sequentially and put them on the queue."""
+        try:
+            stop = self.length
+            if self.stop is not None:
+                stop = min(self.stop, self.length)
+            if self.start > 0 and self.start < stop:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.start)
+
+            frame: np.ndarray | None = None
+            rgb: np.ndarray | None = None
+            for frame_index in range(self.start, stop):
+                if self._stop_event.is_set():
+                    return
+                if not self.cap.grab():
+                    break
+                if (frame_index - self.start) % self.stride != 0:
+                    continue
+                retrieved, frame = self.cap.retrieve(frame)
+                if not retrieved:
+                    break
+                if rgb is None or rgb.shape != frame.shape:
+                    rgb = np.empty_like(frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+                exact_hash, perceptual_hash = self._get_hashes(frame)
+                item = (frame_index, Image.fromarray(rgb), exact_hash, perceptual_hash)
+                if not self._put(item):
+                    return
+            self._put(None)
+        except Exception as exc:
+            self._put(exc)
+        finally:
+            self.cap.release()
+
+    def _get_duplicate_of(
+        self, exact_hash: bytes, perceptual_hash: np.uint64 | None
+    ) -> PipeImage | None:
+        """Get image of retained unique frame duplicated by a frame, if any.
+
+        Arguments:
+            exact_hash: Exact hash of frame
+            perceptual_hash: Perceptual hash of frame, if calculated
+        Returns:
+            Image of unique frame duplicated by frame, or None if frame is unique
+        """
+        unique_index = self._exact_hashes.get(exact_hash)
+        if (
+            unique_index is None
+            and perceptual_hash is not None
+            and self.dedup_tolerance is not None
+        ):
+            distances = np.bitwise_count(self._perceptual_hashes ^ perceptual_hash)
+            distances[self._perceptual_indexes < 0] = 65  # Exclude empty slots
+            slot = int(np.argmin(distances))
+            if distances[slot] <= self.dedup_tolerance:
+                unique_index = int(self._perceptual_indexes[slot])
+        if unique_index is None:
+            return None
+        self._unique_frames.move_to_end(unique_index)
+        return self._unique_frames[unique_index]
+
+    def _get_hashes(self, frame: np.ndarray) -> tuple[bytes | None, np.uint64 | None]:
+        """Get hashes of a frame with which to identify duplicates, as configured.
 
-        self.cap.release()
-        raise StopIteration()
+        Arguments:
+            frame: Decoded frame
+        Returns:
+            Exact hash of frame if deduplicating, and perceptual hash of frame if
+            deduplicating with a tolerance
+        """
+        if not self.dedup:
+            return None, None
+        exact_hash = blake2b(np.ascontiguousarray(frame), digest_size=16).digest()
+        if self.dedup_tolerance is None:
+            return exact_hash, None
+        return exact_hash, self.get_perceptual_hash(frame)
+
+    def _put(self, item: DecodedFrame | BaseException | None) -> bool:
+        """Put item on queue, giving up if decode thread is asked to stop.
+
+        Arguments:
+            item: Decoded frame, exception raised while decoding, or None at end
+        Returns:
+            Whether item was put on queue
+        """
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _store_unique_frame(
+        self,
+        frame_index: int,
+        pipe_image: PipeImage,
+        exact_hash: bytes,
+        perceptual_hash: np.uint64 | None,
+    ):
+        """Store image and hashes of a unique frame, for later frames to duplicate.
+
+        If dedup_window unique frames are already retained, the least recently
+        duplicated is released along with its hashes, so that later frames are matched
+        against at most dedup_window unique frames.
+
+        Arguments:
+            frame_index: Index of frame
+            pipe_image: Image of frame
+            exact_hash: Exact hash of frame
+            perceptual_hash: Perceptual hash of frame, if calculated
+        """
+        if len(self._unique_frames) == self.dedup_window:
+            released_index, _ = self._unique_frames.popitem(last=False)
+            del self._exact_hashes[self._unique_exact_hashes.pop(released_index)]
+            self._perceptual_indexes[self._perceptual_indexes == released_index] = -1
+
+        self._unique_frames[frame_index] = pipe_image
+        self._unique_exact_hashes[frame_index] = exact_hash
+        self._exact_hashes[exact_hash] = frame_index
+        if perceptual_hash is not None:
+            slot = int(np.flatnonzero(self._perceptual_indexes < 0)[0])
+            self._perceptual_hashes[slot] = perceptual_hash
+            self._perceptual_indexes[slot] = frame_index
+
+    @staticmethod
+    def get_perceptual_hash(frame: np.ndarray) -> np.uint64:
+        """Get 64-bit difference hash of a frame.
+
+        Arguments:
+            frame: Frame in BGR order
+        Returns:
+            Difference hash, whose bits indicate whether each pixel of an 8x8 grayscale
+            thumbnail is brighter than the pixel to its left
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumbnail = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = np.packbits(thumbnail[:, 1:] > thumbnail[:, :-1])
+        return bits.view(np.uint64)[0]
@@ -4,22 +4,72 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
+from filecmp import cmp
 from logging import info
-from os import utime
-from shutil import copyfile
+from os import remove, supports_follow_symlinks, utime
+from pathlib import Path
 
 import numpy as np
 from PIL import Image
 
+from pipescaler.common.file import LinkStrategy, link_file
 from pipescaler.core.pipelines import DirectoryTerminus
+from pipescaler.image.core.functions import get_image_digest
 from pipescaler.image.core.pipelines import ImageTerminus, PipeImage
 
 __all__ = ["ImageDirectoryTerminus"]
 
 
 class ImageDirectoryTerminus(ImageTerminus, DirectoryTerminus[PipeImage]):
-    """Copies images to an output directory."""
+    """Copies images to an output directory.
+
+    Digests of the pixels of images saved to the output directory are stored in a
+    manifest within the output directory, alongside the size and modification time of
+    each output file. On later runs, an incoming image is compared to a pre-existing
+    output file by digest, without decoding the output file, so long as the output
+    file's size and modification time match those in the manifest.
+    """
+
+    manifest_filename = ".pipescaler_digests.jsonl"
+    """Name of manifest file within output directory"""
+
+    def __init__(
+        self,
+        dir_path: Path | str,
+        *,
+        link_strategy: LinkStrategy = "copy",
+        manifest: bool = True,
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            dir_path: Path to directory to which to copy images
+            link_strategy: Strategy with which to link files of images that have
+              paths into output directory; falls back to copying if unsupported
+            manifest: Whether to store digests of output images in a manifest
+        """
+        super().__init__(dir_path, link_strategy=link_strategy)
+
+        self.manifest = manifest
+        """Whether to store digests of output images in a manifest"""
+        self.output_paths: dict[str, Path] = {}
+        """Paths to which images have been output, keyed by location and name"""
+        self.digests: dict[str, dict[str, int | str]] = {}
+        """Manifest entries of output images, keyed by path relative to directory"""
+        if self.manifest:
+            self.observed_files.add(self.manifest_filename)
+            self.load_manifest()
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"dir_path={self.dir_path!r}, "
+            f"link_strategy={self.link_strategy!r}, "
+            f"manifest={self.manifest!r})"
+        )
 
     def __call__(self, input_obj: PipeImage):
         """Save image to output directory.
@@ -28,12 +78,29 @@ class ImageDirectoryTerminus(ImageTerminus, DirectoryTerminus[PipeImage]):
         overwritten. If pre-existing image is newer, or pre-existing image's contents
         are the same as the incoming image, does not overwrite.
 
+        If image is a duplicate of an image already output by this terminus, copies
+        that image's output file rather than saving the incoming image, which may not
+        have been processed.
+
         Arguments:
             input_obj: Image to save to output directory
+        Raises:
+            ValueError: If image is a duplicate of an image not output by this terminus
         """
+        if input_obj.duplicate_of is not None:
+            duplicated_location_name = input_obj.duplicate_of.location_name
+            if duplicated_location_name not in self.output_paths:
+                raise ValueError(
+                    f"{self}: '{input_obj.location_name}' duplicates "
+                    f"'{duplicated_location_name}', which has not been output by this "
+                    f"terminus; duplicates must reach the same terminus as the images "
+                    f"they duplicate, after them."
+                )
+            self.save_duplicate(input_obj, self.output_paths[duplicated_location_name])
+            return
 
         def save_image():
-            """Save image, by copying file if possible."""
+            """Save image, by linking or copying file if possible."""
             if not self.dir_path.exists():
                 self.dir_path.mkdir(parents=True)
                 info(f"{self}: '{self.dir_path}' created")
@@ -43,13 +110,17 @@ class ImageDirectoryTerminus(ImageTerminus, DirectoryTerminus[PipeImage]):
                     f"{self}: '{output_path.parent.relative_to(self.dir_path)}' created"
                 )
             if input_obj.path:
-                copyfile(input_obj.path, output_path)
+                link_file(input_obj.path, output_path, self.link_strategy)
             else:
+                if output_path.exists() or output_path.is_symlink():
+                    remove(output_path)
                 input_obj.image.save(output_path)
+                self.record_digest(output_path, get_image_digest(input_obj.image))
 
         suffix = input_obj.path.suffix if input_obj.path else ".png"
         output_path = (self.dir_path / input_obj.location_name).with_suffix(suffix)
         self.observed_files.add(str(output_path.relative_to(self.dir_path)))
+        self.output_paths[input_obj.location_name] = output_path
         if output_path.exists():
             if (
                 input_obj.path
@@ -57,16 +128,175 @@ class ImageDirectoryTerminus(ImageTerminus, DirectoryTerminus[PipeImage]):
             ):
                 info(f"{self}: '{output_path}' is newer; not overwritten")
                 return
-            if np.array_equal(
-                np.array(input_obj.image), np.array(Image.open(output_path))
-            ):
+            unchanged, digest = self.compare_to_output(input_obj, output_path)
+            if unchanged:
                 info(f"{self}: '{output_path}' unchanged; not overwritten")
-                epoch = datetime.now().timestamp()
-                utime(output_path, (epoch, epoch))
-                info(f"{self}: '{output_path}' timestamp updated")
+                if self.manifest and digest is None:
+                    digest = get_image_digest(input_obj.image)
+                self.touch_output(output_path, input_obj.path)
+                if digest is not None:
+                    self.record_digest(output_path, digest)
                 return
             save_image()
             info(f"{self}: '{output_path}' changed; overwritten")
             return
         save_image()
         info(f"{self}: '{output_path}' saved")
+
+    def compare_to_output(
+        self, input_obj: PipeImage, output_path: Path
+    ) -> tuple[bool, str | None]:
+        """Determine whether pre-existing output image matches incoming image.
+
+        Checks are made in order of increasing cost: if the incoming image has a path,
+        its file is first compared byte-by-byte to the output file; next, if the
+        manifest contains a current entry for the output file, the digest of the
+        incoming image is compared to that entry; finally, both images are decoded and
+        their pixels compared.
+
+        If the incoming image's file matches the output file, the digest of the output
+        image is taken from its manifest entry if current, without decoding.
+
+        Arguments:
+            input_obj: Incoming image
+            output_path: Path to pre-existing output image
+        Returns:
+            Whether output image matches incoming image, and digest of incoming image
+            if calculated
+        """
+        recorded_digest = self.get_recorded_digest(output_path)
+        if input_obj.path and cmp(input_obj.path, output_path, shallow=False):
+            return True, recorded_digest
+
+        if recorded_digest is not None:
+            digest = get_image_digest(input_obj.image)
+            return digest == recorded_digest, digest
+
+        if not np.array_equal(
+            np.array(input_obj.image), np.array(Image.open(output_path))
+        ):
+            return False, None
+        if self.manifest:
+            return True, get_image_digest(input_obj.image)
+        return True, None
+
+    def get_recorded_digest(self, output_path: Path) -> str | None:
+        """Get digest of output image recorded in manifest, if current.
+
+        Arguments:
+            output_path: Path to output image
+        Returns:
+            Digest of output image, if manifest contains an entry for it whose size and
+            modification time match those of the output file, otherwise None
+        """
+        if not self.manifest:
+            return None
+        entry = self.digests.get(str(output_path.relative_to(self.dir_path)))
+        if entry is None:
+            return None
+        stat = output_path.stat()
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return str(entry["digest"])
+
+    def load_manifest(self):
+        """Load manifest of output image digests, if present."""
+        manifest_path = self.dir_path / self.manifest_filename
+        if not manifest_path.exists():
+            return
+        with open(manifest_path, encoding="utf-8") as infile:
+            for line in infile:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self.digests[entry["path"]] = entry
+
+    def purge_unrecognized_files(self, dir_path: Path | None = None):
+        """Remove unrecognized files and subdirectories in output directory.
+
+        Also compacts the manifest, retaining only entries of recognized files.
+        """
+        super().purge_unrecognized_files(dir_path)
+        if dir_path is not None or not self.manifest:
+            return
+        self.digests = {
+            path: entry
+            for path, entry in self.digests.items()
+            if path in self.observed_files
+        }
+        with open(
+            self.dir_path / self.manifest_filename, "w", encoding="utf-8"
+        ) as outfile:
+            for entry in self.digests.values():
+                outfile.write(f"{json.dumps(entry)}\n")
+
+    def record_digest(self, output_path: Path, digest: str):
+        """Record digest of output image in manifest.
+
+        Entries are appended to the manifest file, so that recording is cheap
+        regardless of the number of output images; later entries for the same output
+        path supersede earlier ones.
+
+        Arguments:
+            output_path: Path to output image
+            digest: Digest of output image's pixels
+        """
+        if not self.manifest:
+            return
+        stat = output_path.stat()
+        entry: dict[str, int | str] = {
+            "path": str(output_path.relative_to(self.dir_path)),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        self.digests[str(entry["path"])] = entry
+        with open(
+            self.dir_path / self.manifest_filename, "a", encoding="utf-8"
+        ) as outfile:
+            outfile.write(f"{json.dumps(entry)}\n")
+
+    def save_duplicate(self, input_obj: PipeImage, duplicated_path: Path):
+        """Save duplicate image by linking output file of image it duplicates.
+
+        Arguments:
+            input_obj: Duplicate image to save to output directory
+            duplicated_path: Output path of image duplicated by input image
+        """
+        output_path = (self.dir_path / input_obj.location_name).with_suffix(
+            duplicated_path.suffix
+        )
+        self.observed_files.add(str(output_path.relative_to(self.dir_path)))
+        self.output_paths[input_obj.location_name] = output_path
+        if output_path.exists() and cmp(duplicated_path, output_path, shallow=False):
+            info(f"{self}: '{output_path}' unchanged; not overwritten")
+            self.touch_output(output_path, duplicated_path)
+            return
+        if not output_path.parent.exists():
+            output_path.parent.mkdir(parents=True)
+            info(f"{self}: '{output_path.parent.relative_to(self.dir_path)}' created")
+        link_file(duplicated_path, output_path, self.link_strategy)
+        info(f"{self}: '{output_path}' linked from duplicate '{duplicated_path}'")
+
+    def touch_output(self, output_path: Path, source_path: Path | None = None):
+        """Update modification time of an unchanged output file.
+
+        A symlink is itself touched rather than its target, where supported. An output
+        file hardlinked to its source file is not touched, as that would also touch
+        the source file.
+
+        Arguments:
+            output_path: Path to output file
+            source_path: Path to file from which output file was linked or copied, if
+              applicable
+        """
+        if output_path.is_symlink():
+            if utime not in supports_follow_symlinks:
+                info(f"{self}: '{output_path}' is a symlink; timestamp not updated")
+                return
+        elif source_path is not None and output_path.samefile(source_path):
+            info(f"{self}: '{output_path}' is a hardlink; timestamp not updated")
+            return
+        epoch = datetime.now().timestamp()
+        utime(output_path, (epoch, epoch), follow_symlinks=False)
+        info(f"{self}: '{output_path}' timestamp updated")
@@ -10,7 +10,7 @@ from shlex import split
 from shutil import copyfile
 from typing import Any
 
-from pipescaler.common.subprocess import run_command
+from pipescaler.common.subprocess import run_command, run_command_piped
 from pipescaler.core import Runner
 
 __all__ = ["PngquantRunner"]
@@ -42,7 +42,8 @@ class PngquantRunner(Runner):
         return (
             f"{self.__class__.__name__}("
             f"arguments={self.arguments!r}, "
-            f"timeout={self.timeout!r})"
+            f"timeout={self.timeout!r}, "
+            f"cache={self.cache!r})"
         )
 
     @property
@@ -53,6 +54,11 @@ class PngquantRunner(Runner):
             f"--output {{output_path}} {{input_path}}"
         )
 
+    @property
+    def piped_command(self) -> str:
+        """Command reading input from standard input and writing output to stdout."""
+        return f"{self.executable_path} {self.arguments} -"
+
     def run(self, input_path: Path | str, output_path: Path | str):
         """Read image from input_path, process it, and save to output_path.
 
@@ -71,6 +77,27 @@ class PngquantRunner(Runner):
             # pngquant may not save output file if it is too large or low quality
             copyfile(input_path, output_path)
 
+    def run_piped(self, input_bytes: bytes) -> bytes:
+        """Run executable on input bytes via stdin, yielding output bytes via stdout.
+
+        Arguments:
+            input_bytes: Contents of input file
+        Returns:
+            Contents of output file
+        """
+        command = self.piped_command
+        debug(f"{self}: {command}")
+        exitcode, stdout, _ = run_command_piped(
+            split(command),
+            input_bytes,
+            acceptable_exitcodes=[0, 98, 99],
+            timeout=self.timeout,
+        )
+        if exitcode in [98, 99]:
+            # pngquant may not write output if it is too large or low quality
+            return input_bytes
+        return stdout
+
     @classmethod
     def executable(cls) -> str:
         """Name of executable."""
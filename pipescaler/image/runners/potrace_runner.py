@@ -33,7 +33,8 @@ class PotraceRunner(Runner):
         return (
             f"{self.__class__.__name__}("
             f"arguments={self.arguments!r}, "
-            f"timeout={self.timeout!r})"
+            f"timeout={self.timeout!r}, "
+            f"cache={self.cache!r})"
         )
 
     @property
@@ -43,6 +44,11 @@ class PotraceRunner(Runner):
             f"{self.executable_path} {{input_path}} {self.arguments} -o {{output_path}}"
         )
 
+    @property
+    def piped_command(self) -> str:
+        """Command reading input from standard input and writing output to stdout."""
+        return f"{self.executable_path} {self.arguments} -o -"
+
     @classmethod
     def executable(cls) -> str:
         """Name of executable."""
@@ -42,7 +42,8 @@ class TexconvRunner(Runner):
         return (
             f"{self.__class__.__name__}("
             f"arguments={self.arguments!r}, "
-            f"timeout={self.timeout!r})"
+            f"timeout={self.timeout!r}, "
+            f"cache={self.cache!r})"
         )
 
     @property
@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import chain
+
 import numpy as np
 from PIL import Image
-from scipy.special import erf
 
 from pipescaler.common.validation import val_int
 
@@ -14,7 +17,13 @@ __all__ = ["SubdividedImage"]
 
 
 class SubdividedImage:
-    """Image divided into subdivisions."""
+    """Image divided into subdivisions.
+
+    Subdivisions may be processed either as a list, by getting and setting subs, or
+    as a stream, by passing processed subdivisions yielded lazily from iter_subs to
+    recompose; in the latter case only one subdivision need be held in memory at a
+    time.
+    """
 
     def __init__(self, image: Image.Image, size: int, overlap: int):
         """Initialize.
@@ -29,7 +38,7 @@ class SubdividedImage:
         self.overlap = val_int(overlap, min_value=2)
         self.boxes = self.get_boxes(image.width, image.height, self.size, self.overlap)
 
-        self._subs = self.get_subs(image, self.boxes)
+        self._subs: list[Image.Image] | None = None
 
     def __repr__(self) -> str:
         """Representation."""
@@ -51,25 +60,53 @@ class SubdividedImage:
         subs to a particular value will not necessarily result in subs being set to
         that value.
         """
+        if self._subs is None:
+            self._subs = self.get_subs(self.image, self.boxes)
         return self._subs
 
     @subs.setter
     def subs(self, value: list[Image.Image]):
         """Set subdivisions and update internal geometry as needed."""
-        if len(value) != len(self._subs):
+        if len(value) != len(self.boxes):
             raise ValueError(
-                f"Expected {len(self._subs)} subdivisions, received {len(value)}"
+                f"Expected {len(self.boxes)} subdivisions, received {len(value)}"
             )
-        scale = int(value[0].width / self._subs[0].width)
-        if scale != 1:
-            self.size *= scale
-            self.overlap *= scale
-            self.boxes *= scale
-
-        self.image = self.get_recomposed_image(
-            value, self.boxes, self.size, self.overlap
+        self.recompose(value)
+
+    def iter_subs(self) -> Iterator[Image.Image]:
+        """Yield subdivisions of image lazily, one at a time.
+
+        Yields:
+            Subdivisions of image
+        """
+        for box in self.boxes:
+            yield self.image.crop(box)
+
+    def recompose(self, subs: Iterable[Image.Image]):
+        """Recompose image from processed subdivisions, consuming them one at a time.
+
+        The scale of the processed subdivisions is determined from the first; if it
+        has changed, size, overlap, and boxes are scaled accordingly.
+
+        Arguments:
+            subs: Processed subdivisions, in the order yielded by iter_subs
+        """
+        subs = iter(subs)
+        first_sub = next(subs, None)
+        if first_sub is None:
+            raise ValueError(f"Expected {len(self.boxes)} subdivisions, received 0")
+        scale = int(first_sub.width / (self.boxes[0, 2] - self.boxes[0, 0]))
+
+        # Subdivisions may still be being yielded from the current image and boxes
+        boxes = self.boxes * scale
+        image = self.get_recomposed_image(
+            chain([first_sub], subs), boxes, self.size * scale, self.overlap * scale
         )
-        self._subs = self.get_subs(self.image, self.boxes)
+        self.image = image
+        self.size *= scale
+        self.overlap *= scale
+        self.boxes = boxes
+        self._subs = None
 
     @classmethod
     def get_boxes(cls, width: int, height: int, size: int, overlap: int) -> np.ndarray:
@@ -98,48 +135,69 @@ class SubdividedImage:
 
     @classmethod
     def get_recomposed_image(
-        cls, subs: list[Image.Image], boxes: np.ndarray, size: int, overlap: int
+        cls, subs: Iterable[Image.Image], boxes: np.ndarray, size: int, overlap: int
     ) -> Image.Image:
         """Get recomposed image from subdivisions.
 
+        Subdivisions are consumed one at a time and accumulated in float32, so that
+        they need not all be held in memory at once.
+
         Arguments:
             subs: Subdivisions of image
             boxes: Boxes for subdivisions in format of (left, upper, right, lower)
-            size: Size of subdivisions
+            size: Size of subdivisions; retained for compatibility, as sizes are taken
+              from boxes
             overlap: Overlap of subdivisions
         Returns:
             Recomposed image
         """
         width = boxes[:, 2].max()
         height = boxes[:, 3].max()
-        n_dim = len(subs[0].getbands())
-
-        # Prepare arrays to hold image data and total weights
-        if n_dim == 1:
-            recomposed_arr = np.zeros((height, width), float)
-        else:
-            recomposed_arr = np.zeros((height, width, n_dim), float)
-        recomposed_weights = np.zeros((height, width), float)
-
-        # Sum image data and weights
-        weights = cls.get_sub_weights(boxes, size, overlap)
-        for sub, box, weight in zip(subs, boxes, weights):
-            sub_arr = np.array(sub).astype(float)
-            if n_dim == 1:
-                sub_arr *= weight
-            else:
-                sub_arr *= np.stack([weight] * n_dim, axis=2)
-            recomposed_arr[box[1] : box[3], box[0] : box[2]] += sub_arr
+
+        # Sum weighted image data and weights
+        recomposed_arr: np.ndarray | None = None
+        recomposed_weights = np.zeros((height, width, 1), np.float32)
+        weighted_arr = np.empty(0, np.float32)
+        n_subs = 0
+        for sub in subs:
+            if n_subs >= len(boxes):
+                raise ValueError(
+                    f"Expected {len(boxes)} subdivisions, received more than "
+                    f"{len(boxes)}"
+                )
+            box = boxes[n_subs]
+            n_subs += 1
+            sub_arr = np.asarray(sub)
+            if sub_arr.ndim == 2:
+                sub_arr = sub_arr[:, :, np.newaxis]
+            if recomposed_arr is None:
+                recomposed_arr = np.zeros((height, width, sub_arr.shape[2]), np.float32)
+            if weighted_arr.shape != sub_arr.shape:
+                weighted_arr = np.empty(sub_arr.shape, np.float32)
+            weight = cls.get_sub_weight(
+                int(box[3] - box[1]),
+                int(box[2] - box[0]),
+                overlap,
+                (
+                    bool(box[0] != 0),
+                    bool(box[1] != 0),
+                    bool(box[2] != width),
+                    bool(box[3] != height),
+                ),
+            )
+            np.multiply(sub_arr, weight, out=weighted_arr)
+            recomposed_arr[box[1] : box[3], box[0] : box[2]] += weighted_arr
             recomposed_weights[box[1] : box[3], box[0] : box[2]] += weight
+        if recomposed_arr is None or n_subs != len(boxes):
+            raise ValueError(f"Expected {len(boxes)} subdivisions, received {n_subs}")
 
         # Normalize image data and convert to image
-        if n_dim == 1:
-            recomposed_arr /= recomposed_weights
-        else:
-            recomposed_arr /= np.stack([recomposed_weights] * n_dim, axis=2)
-        recomposed_arr = np.clip(np.round(recomposed_arr), 0, 255).astype(np.uint8)
-
-        return Image.fromarray(recomposed_arr)
+        recomposed_arr /= recomposed_weights
+        np.rint(recomposed_arr, out=recomposed_arr)
+        np.clip(recomposed_arr, 0, 255, out=recomposed_arr)
+        if recomposed_arr.shape[2] == 1:
+            return Image.fromarray(recomposed_arr[:, :, 0].astype(np.uint8))
+        return Image.fromarray(recomposed_arr.astype(np.uint8))
 
     @classmethod
     def get_sub_weights(
@@ -149,27 +207,29 @@ class SubdividedImage:
 
         Arguments:
             boxes: Boxes for subdivisions in form of [[left, upper, right, lower], ...]
-            size: Size of subdivisions
+            size: Size of subdivisions; retained for compatibility, as sizes are taken
+              from boxes
             overlap: Overlap of subdivisions
         Returns:
             Weights for each subdivision to be used when recomposing full image
         """
-        left, top, right, bottom = cls.get_sub_edge_tapers(size, overlap)
-
-        weights = []
-        for box in boxes:
-            weight = np.ones((box[3] - box[1], box[2] - box[0]), float)
-            if box[0] != 0:
-                weight[:, :overlap] = np.minimum(weight[:, :overlap], left)
-            if box[1] != 0:
-                weight[:overlap, :] = np.minimum(weight[:overlap, :], top)
-            if box[2] != boxes[:, 2].max():
-                weight[:, -overlap:] = np.minimum(weight[:, -overlap:], right)
-            if box[3] != boxes[:, 3].max():
-                weight[-overlap:, :] = np.minimum(weight[-overlap:, :], bottom)
-            weights.append(weight)
-
-        return weights
+        width = boxes[:, 2].max()
+        height = boxes[:, 3].max()
+
+        return [
+            cls.get_sub_weight(
+                int(box[3] - box[1]),
+                int(box[2] - box[0]),
+                overlap,
+                (
+                    bool(box[0] != 0),
+                    bool(box[1] != 0),
+                    bool(box[2] != width),
+                    bool(box[3] != height),
+                ),
+            )[:, :, 0]
+            for box in boxes
+        ]
 
     @staticmethod
     def get_subs(image: Image.Image, boxes: np.ndarray) -> list[Image.Image]:
@@ -230,9 +290,8 @@ class SubdividedImage:
         return edges
 
     @staticmethod
-    def get_sub_edge_tapers(
-        size: int, overlap: int
-    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    @lru_cache(maxsize=64)
+    def get_sub_edge_taper(overlap: int) -> np.ndarray:
         """Get weights for tapering edges of subdivisions during recomposition.
 
         Weights are generated using the error function, whose x range  from (-2, 2)
@@ -243,19 +302,38 @@ class SubdividedImage:
         (0.002, 0.022, 0.113, 0.343, 0.657, 0.887, 0.978, 0.998), which for a channel
         with an original value of 255 yield (1, 6, 29, 87, 168, 226, 249, 254).
 
-        These weights are then rotated and tiled, yielding four arrays that can be
-        used to taper the left, top, right, and bottom edges of subdivisions during
-        recomposition.
+        Weights are cached, and are read-only.
 
         Arguments:
-            size: Size of subdivisions
             overlap: Overlap between subdivisions
         Returns:
-            Weights for tapering along left, top, right, and bottom edges
+            Weights for tapering an edge, increasing away from the edge
         """
+        from scipy.special import erf  # noqa: PLC0415
+
         x = np.arange(overlap)
         adjusted_x = ((4 * x) / (overlap - 1)) - 2
-        taper = (erf(adjusted_x) + 1) / 2
+        taper = ((erf(adjusted_x) + 1) / 2).astype(np.float32)
+        taper.flags.writeable = False
+
+        return taper
+
+    @staticmethod
+    def get_sub_edge_tapers(
+        size: int, overlap: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get weights for tapering edges of subdivisions during recomposition.
+
+        Retained for compatibility; get_sub_edge_taper provides the same weights
+        without tiling them.
+
+        Arguments:
+            size: Size of subdivisions
+            overlap: Overlap between subdivisions
+        Returns:
+            Weights for tapering along left, top, right, and bottom edges
+        """
+        taper = SubdividedImage.get_sub_edge_taper(overlap)
 
         left = np.tile(taper, (size, 1))
         top = np.tile(np.reshape(taper, (overlap, 1)), (1, size))
@@ -263,3 +341,51 @@ class SubdividedImage:
         bottom = np.tile(np.reshape(taper, (overlap, 1))[::-1], (1, size))
 
         return left, top, right, bottom
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_sub_weight(
+        height: int, width: int, overlap: int, edges: tuple[bool, bool, bool, bool]
+    ) -> np.ndarray:
+        """Get weight of a subdivision to be used when recomposing full image.
+
+        Subdivisions of the same size whose same edges overlap other subdivisions share
+        the same weight, which is cached, and is read-only.
+
+        Arguments:
+            height: Height of subdivision
+            width: Width of subdivision
+            overlap: Overlap of subdivisions
+            edges: Whether left, top, right, and bottom edges of subdivision overlap
+              other subdivisions, and are tapered
+        Returns:
+            Weight of subdivision, with a trailing dimension of size 1 for broadcasting
+            across channels
+        """
+        taper = SubdividedImage.get_sub_edge_taper(overlap)
+        left, top, right, bottom = edges
+
+        weight = np.ones((height, width, 1), np.float32)
+        if left:
+            np.minimum(
+                weight[:, :overlap], taper[:, np.newaxis], out=weight[:, :overlap]
+            )
+        if top:
+            np.minimum(
+                weight[:overlap], taper[:, np.newaxis, np.newaxis], out=weight[:overlap]
+            )
+        if right:
+            np.minimum(
+                weight[:, -overlap:],
+                taper[::-1, np.newaxis],
+                out=weight[:, -overlap:],
+            )
+        if bottom:
+            np.minimum(
+                weight[-overlap:],
+                taper[::-1, np.newaxis, np.newaxis],
+                out=weight[-overlap:],
+            )
+        weight.flags.writeable = False
+
+        return weight
@@ -11,12 +11,26 @@ Hierarchy within module:
 
 from __future__ import annotations
 
-from .local_palette_matcher import LocalPaletteMatcher
-from .mask_filler import MaskFiller
-from .palette_matcher import PaletteMatcher
+from typing import TYPE_CHECKING
+
+from pipescaler.common.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .local_palette_matcher import LocalPaletteMatcher
+    from .mask_filler import MaskFiller
+    from .palette_matcher import PaletteMatcher
 
 __all__ = [
     "LocalPaletteMatcher",
     "MaskFiller",
     "PaletteMatcher",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "LocalPaletteMatcher": "local_palette_matcher",
+        "MaskFiller": "mask_filler",
+        "PaletteMatcher": "palette_matcher",
+    },
+)
@@ -10,8 +10,6 @@ from PIL import Image
 from pipescaler.core import Utility
 from pipescaler.image.core.enums import MaskFillMode
 
-from .palette_matcher import PaletteMatcher
-
 __all__ = ["MaskFiller"]
 
 
@@ -60,6 +58,8 @@ class MaskFiller(Utility):
         # Return image
         filled_img = Image.fromarray(image_arr)
         if mask_fill_mode == MaskFillMode.MATCH_PALETTE:
+            from .palette_matcher import PaletteMatcher  # noqa: PLC0415
+
             filled_img = PaletteMatcher.run(img, filled_img)
         return filled_img
 
@@ -9,6 +9,8 @@ from itertools import cycle
 from logging import info
 from os import remove, rmdir
 from pathlib import Path
+from time import perf_counter
+from typing import Any
 
 from pipescaler.core.pipelines import CheckpointManagerBase, PipeObject, SegmentLike
 
@@ -21,7 +23,30 @@ __all__ = ["CheckpointManager"]
 
 
 class CheckpointManager(CheckpointManagerBase):
-    """Manages checkpoints."""
+    """Manages checkpoints.
+
+    Checkpoints saved after failing to load are counted as computed, in the time
+    between the attempt to load them and their saving.
+    """
+
+    def __init__(self, dir_path: Path | str, **kwargs: Any):
+        """Initialize.
+
+        Arguments:
+            dir_path: Path to directory in which to store checkpoints
+            **kwargs: Additional keyword arguments
+        """
+        super().__init__(dir_path, **kwargs)
+
+        self._load_starts: dict[tuple[str, str], float] = {}
+
+    def close(self):
+        """Finish run, logging report and saving times spent computing checkpoints.
+
+        Times of checkpoints that failed to load and were never saved are discarded.
+        """
+        self._load_starts.clear()
+        super().close()
 
     def load(
         self,
@@ -35,6 +60,9 @@ class CheckpointManager(CheckpointManagerBase):
         If the length of inputs is equal to the length of cpts, inputs and cpts are
         zipped. Otherwise, the first input is used for all cpts.
 
+        If all inputs are duplicates of earlier objects, their checkpoints are first
+        linked from those of the duplicated objects, so that they may be loaded.
+
         Arguments:
             inputs: Input objects
             cpts: Names of checkpoints to load
@@ -54,11 +82,12 @@ class CheckpointManager(CheckpointManagerBase):
             )
         for ln, c in zip(cycle(location_names), cpts):
             self.observe(ln, c)
+        if all(i.duplicate_of is not None for i in inputs):
+            for i in inputs:
+                self.save_duplicate(i, cpts)
 
         cpt_paths = self.get_cpt_paths(self.dir_path, location_names, cpts)
-        if all(p.exists() for p in cpt_paths) and self.checkpoints_current(
-            inputs, cpt_paths
-        ):
+        if self.checkpoints_available(inputs, cpt_paths):
             outputs = tuple(cls(path=p, parents=inputs) for p in cpt_paths)
             location_str = (
                 location_names[0] if len(location_names) == 1 else location_names
@@ -66,6 +95,8 @@ class CheckpointManager(CheckpointManagerBase):
             cpts_str = cpts[0] if len(cpts) == 1 else cpts
             info(f"{self}: '{location_str}' checkpoints '{cpts_str}' loaded")
 
+            for ln, c in zip(cycle(location_names), cpts):
+                self._load_starts.pop((ln, c), None)
             internal_cpts = self.get_cpts_of_segments(*calls) if calls else []
             for ln in location_names:
                 for c in internal_cpts:
@@ -73,6 +104,9 @@ class CheckpointManager(CheckpointManagerBase):
 
             return outputs
 
+        start = perf_counter()
+        for ln, c in zip(cycle(location_names), cpts):
+            self._load_starts[ln, c] = start
         return None
 
     def post_segment(
@@ -134,13 +168,23 @@ class CheckpointManager(CheckpointManagerBase):
         return decorator
 
     def purge_unrecognized_files(self, dir_path: Path | None = None):
-        """Remove unrecognized files and subdirectories in checkpoint directory."""
+        """Remove unrecognized files and subdirectories in checkpoint directory.
+
+        Since checkpoints are purged at the end of a run, the manager is then closed.
+
+        Arguments:
+            dir_path: Subdirectory to purge; if None, checkpoint directory
+        """
         if dir_path is None:
-            dir_path = self.dir_path
+            self.purge_unrecognized_files(self.dir_path)
+            self.close()
+            return
         for path in dir_path.iterdir():
             if path.is_dir():
                 self.purge_unrecognized_files(path)
             elif path.is_file():
+                if path == self.timings_path:
+                    continue
                 relative_path = path.relative_to(self.dir_path)
                 checkpoint = (str(relative_path.parent), path.name)
                 if checkpoint not in self.observed_checkpoints:
@@ -177,14 +221,20 @@ class CheckpointManager(CheckpointManagerBase):
             self.dir_path, [i.location_name for i in inputs], cpts
         )
         for i, c, p in zip(inputs, cpts, cpt_paths):
-            if not p.parent.exists():
-                p.parent.mkdir(parents=True)
-                info(f"{self}: directory '{p.parent}' created")
-            if not p.exists() or overwrite:
-                i.save(p)
-                info(f"{self}: '{i.location_name}' checkpoint '{c}' saved")
-            else:
-                i.path = p
+            try:
+                if not p.parent.exists():
+                    p.parent.mkdir(parents=True)
+                    info(f"{self}: directory '{p.parent}' created")
+                if not p.exists() or overwrite:
+                    i.save(p)
+                    info(f"{self}: '{i.location_name}' checkpoint '{c}' saved")
+                else:
+                    i.path = p
+                start = self._load_starts.get((i.location_name, c))
+                if start is not None:
+                    self.record_computed(c, perf_counter() - start, p)
+            finally:
+                self._load_starts.pop((i.location_name, c), None)
             self.observe(i.location_name, c)
 
         return inputs
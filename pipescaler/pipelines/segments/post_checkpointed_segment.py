@@ -5,7 +5,9 @@
 from __future__ import annotations
 
 from logging import info
+from time import perf_counter
 
+from pipescaler.common.instrumentation import measure
 from pipescaler.core.pipelines import CheckpointedSegment, PipeObject
 
 __all__ = ["PostCheckpointedSegment"]
@@ -29,9 +31,12 @@ class PostCheckpointedSegment(CheckpointedSegment):
             for i in input_objs
             for c in self.cpts
         ]
-        if all(p.exists() for p in cpt_paths) and self.cp_manager.checkpoints_current(
-            input_objs, cpt_paths
+        cpts_name = ", ".join(self.cpts)
+        with measure(
+            "checkpoint_load", self.__class__.__name__, cpts_name, input_objs[0]
         ):
+            loaded = self.cp_manager.checkpoints_available(input_objs, cpt_paths)
+        if loaded:
             outputs = tuple(cls(path=p, parents=input_objs) for p in cpt_paths)
             location_name = input_objs[0].location_name
             info(f"{self}: '{location_name}' checkpoints '{self.cpts}' loaded")
@@ -44,7 +49,12 @@ class PostCheckpointedSegment(CheckpointedSegment):
                     f"{self.__class__.__name__} requires a callable Segment; "
                     f"{self.segment.__class__.__name__} is not callable."
                 )
-            outputs = self.segment(*input_objs)
+            start = perf_counter()
+            with measure(
+                "checkpoint_run", self.__class__.__name__, cpts_name, input_objs[0]
+            ):
+                outputs = self.segment(*input_objs)
+            seconds = (perf_counter() - start) / len(cpt_paths)
             if len(outputs) != len(self.cpts):
                 raise ValueError(
                     f"Expected {len(self.cpts)} outputs from {self.segment} "
@@ -53,10 +63,26 @@ class PostCheckpointedSegment(CheckpointedSegment):
             if not cpt_paths[0].parent.exists():
                 cpt_paths[0].parent.mkdir(parents=True)
             for o, c, p in zip(outputs, self.cpts, cpt_paths):
-                o.save(p)
+                with measure("checkpoint_save", self.__class__.__name__, c, o):
+                    o.save(p)
+                self.cp_manager.record_computed(c, seconds, p)
                 info(f"{self}: '{o.location_name}' checkpoint '{c}' saved")
         for i in input_objs:
             for c in self.cpts:
                 self.cp_manager.observe(i.location_name, c)
 
         return outputs
+
+    def pass_duplicates(self, *input_objs: PipeObject) -> tuple[PipeObject, ...]:
+        """Pass input objects that duplicate earlier objects through unprocessed.
+
+        Checkpoints of the duplicated objects, including internal checkpoints, are
+        linked to those of the input objects.
+
+        Arguments:
+            input_objs: Input objects, each a duplicate of an earlier object
+        Returns:
+            First input object, unmodified, in place of each output object
+        """
+        super().pass_duplicates(*input_objs)
+        return (input_objs[0],) * len(self.cpts)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from logging import info
 
+from pipescaler.common.instrumentation import measure
 from pipescaler.core.pipelines import CheckpointedSegment, PipeObject
 
 __all__ = ["PreCheckpointedSegment"]
@@ -40,7 +41,8 @@ class PreCheckpointedSegment(CheckpointedSegment):
             if p.exists():
                 i.path = p
             else:
-                i.save(p)
+                with measure("checkpoint_save", self.__class__.__name__, c, i):
+                    i.save(p)
                 info(f"{self}: '{i.location_name}' checkpoint '{p}' saved")
             self.cp_manager.observe(i.location_name, c)
 
@@ -5,7 +5,7 @@
 This module may import from: common, core, pipelines, image, video, cli
 
 Hierarchy within module:
-* execution_counter / file / fixture / mark
+* benchmark / execution_counter / file / fixture / mark
 """
 
 from __future__ import annotations
@@ -0,0 +1,196 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Functions and classes related to benchmarking."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from math import ceil
+from os import getenv, getpid, replace
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from PIL import Image
+from pytest import fail, skip
+
+from pipescaler.common.validation import val_float, val_int
+
+__all__ = [
+    "BenchmarkBaselines",
+    "get_benchmark_image",
+    "time_call",
+]
+
+
+class BenchmarkBaselines:
+    """Baseline timings of benchmarks, against which to check for regressions.
+
+    Baselines are stored as JSON, mapping the name of each benchmark to its time in
+    seconds. Baselines are specific to the machine on which they are recorded; if the
+    environment variable PIPESCALER_UPDATE_BENCHMARKS is set, timings are recorded
+    as new baselines rather than checked.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        tolerance: float = 1.0,
+        update: bool | None = None,
+    ):
+        """Validate and store configuration and initialize.
+
+        Arguments:
+            path: Path to JSON file of baselines
+            tolerance: Fraction by which a timing may exceed its baseline before it is
+              considered a regression
+            update: Whether to record timings as new baselines rather than check
+              them; if None, whether PIPESCALER_UPDATE_BENCHMARKS is set
+        """
+        self.path = Path(path)
+        """Path to JSON file of baselines"""
+        self.tolerance = val_float(tolerance, min_value=0)
+        """Fraction by which a timing may exceed its baseline"""
+        if update is None:
+            update = getenv("PIPESCALER_UPDATE_BENCHMARKS") is not None
+        self.update = update
+        """Whether to record timings as new baselines rather than check them"""
+        self.baselines = self.load()
+        """Baseline timings in seconds by name of benchmark"""
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"path={self.path!r}, "
+            f"tolerance={self.tolerance!r}, "
+            f"update={self.update!r})"
+        )
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"<{self.__class__.__name__}>"
+
+    def check(self, name: str, seconds: float):
+        """Check timing of a benchmark against its baseline, or record it.
+
+        Arguments:
+            name: Name of benchmark
+            seconds: Time of benchmark in seconds
+        """
+        if self.update:
+            self.save(name, seconds)
+            return
+
+        baseline = self.baselines.get(name)
+        if baseline is None:
+            skip(f"No baseline for benchmark '{name}' in '{self.path}'")
+        if seconds > baseline * (1 + self.tolerance):
+            fail(
+                f"Benchmark '{name}' took {seconds:.4f} s, more than "
+                f"{self.tolerance:.0%} longer than its baseline of {baseline:.4f} s"
+            )
+
+    def load(self) -> dict[str, float]:
+        """Load baselines from file.
+
+        Returns:
+            Baseline timings in seconds by name of benchmark
+        """
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding="utf-8") as infile:
+            return json.load(infile)
+
+    def save(self, name: str, seconds: float):
+        """Save timing of a benchmark as its baseline.
+
+        Baselines are reloaded before saving, so that those saved by other processes
+        are retained.
+
+        Arguments:
+            name: Name of benchmark
+            seconds: Time of benchmark in seconds
+        """
+        self.baselines = self.load()
+        self.baselines[name] = round(seconds, 6)
+        partial_path = self.path.with_suffix(f".{getpid()}.tmp")
+        with open(partial_path, "w", encoding="utf-8") as outfile:
+            json.dump(dict(sorted(self.baselines.items())), outfile, indent=2)
+            outfile.write("\n")
+        replace(partial_path, self.path)
+
+
+def get_benchmark_image(
+    mode: str, size: int, n_colors: int | None = None, seed: int = 0
+) -> Image.Image:
+    """Get synthetic image with which to benchmark operators.
+
+    Images combine smooth gradients with noise, and are reproducible for a given
+    mode, size, number of colors, and seed.
+
+    Arguments:
+        mode: Mode of image; one of '1', 'L', 'LA', 'RGB', or 'RGBA'
+        size: Width and height of image
+        n_colors: Number of distinct colors in image; if None, not limited
+        seed: Seed of random number generator
+    Returns:
+        Synthetic image
+    """
+    size = val_int(size, min_value=1)
+    bands = Image.getmodebands(mode)
+    rng = np.random.default_rng(seed)
+
+    # Each band is a sinusoidal gradient of random frequency and direction
+    y, x = np.mgrid[0:size, 0:size] / size
+    frequencies = rng.uniform(1, 8, (bands, 2))
+    phases = rng.uniform(0, 2 * np.pi, bands)
+    angles = [
+        2 * np.pi * (frequencies[i, 0] * x + frequencies[i, 1] * y) + phases[i]
+        for i in range(bands)
+    ]
+    array = 127.5 * (1 + np.sin(np.stack(angles, axis=-1)))
+    array += rng.normal(0, 16, array.shape)
+    array = np.clip(array, 0, 255).astype(np.uint8)
+
+    if n_colors is not None:
+        palette = rng.integers(0, 256, (val_int(n_colors, min_value=1), bands))
+        indexes = array[..., 0].astype(np.int64) * n_colors // 256
+        array = palette[indexes].astype(np.uint8)
+
+    if mode == "1":
+        return Image.fromarray(array[..., 0] > 127)
+    if bands == 1:
+        return Image.fromarray(array[..., 0])
+    return Image.fromarray(array)
+
+
+def time_call(
+    function: Callable[[], Any], repeats: int = 5, min_time: float = 0.05
+) -> float:
+    """Time a function, as the shortest mean time of several rounds of calls.
+
+    Each round calls the function enough times to take at least min_time, so that
+    timings of fast functions are not dominated by noise.
+
+    Arguments:
+        function: Function to time
+        repeats: Number of rounds
+        min_time: Minimum duration of each round in seconds
+    Returns:
+        Shortest mean time of a call in seconds
+    """
+    start = perf_counter()
+    function()
+    first_time = perf_counter() - start
+    n_calls = max(1, ceil(val_float(min_time, min_value=0) / max(first_time, 1e-9)))
+
+    times = [first_time]
+    for _ in range(val_int(repeats, min_value=1)):
+        start = perf_counter()
+        for _ in range(n_calls):
+            function()
+        times.append((perf_counter() - start) / n_calls)
+    return min(times)
@@ -5,8 +5,8 @@
 from __future__ import annotations
 
 from logging import info, warning
-from shutil import copyfile
 
+from pipescaler.common.file import link_file
 from pipescaler.core.pipelines import DirectoryTerminus
 from pipescaler.video.core.pipelines import PipeVideo, VideoTerminus
 
@@ -34,7 +34,7 @@ class VideoDirectoryTerminus(VideoTerminus, DirectoryTerminus[PipeVideo]):
                     f"{self}: '{output_path.parent.relative_to(self.dir_path)}' created"
                 )
             if input_obj.path:
-                copyfile(input_obj.path, output_path)
+                link_file(input_obj.path, output_path, self.link_strategy)
             else:
                 raise NotImplementedError("Saving video from memory not implemented")
 
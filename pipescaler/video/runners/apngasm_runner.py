@@ -37,7 +37,8 @@ class ApngasmRunner(Runner):
         return (
             f"{self.__class__.__name__}("
             f"arguments={self.arguments!r}, "
-            f"timeout={self.timeout!r})"
+            f"timeout={self.timeout!r}, "
+            f"cache={self.cache!r})"
         )
 
     @property
@@ -0,0 +1,36 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Configuration of benchmarks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pipescaler.testing.benchmark import BenchmarkBaselines
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    """Skip benchmarks unless selected with '-m benchmark'.
+
+    Arguments:
+        config: Pytest configuration
+        items: Collected tests
+    """
+    if "benchmark" in config.getoption("markexpr", ""):
+        return
+    skip_benchmark = pytest.mark.skip(reason="run benchmarks with '-m benchmark'")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session")
+def baselines() -> BenchmarkBaselines:
+    """Pytest fixture that provides baseline timings of benchmarks.
+
+    Returns:
+        Baseline timings of benchmarks
+    """
+    return BenchmarkBaselines(Path(__file__).parent / "baselines.json")
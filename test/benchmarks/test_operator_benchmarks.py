@@ -0,0 +1,181 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmarks of image operators and sorters.
+
+Run with 'pytest -m benchmark -n 0'; set PIPESCALER_UPDATE_BENCHMARKS to record
+timings as new baselines.
+"""
+
+from __future__ import annotations
+
+import pytest
+from PIL import Image
+
+from pipescaler.image.core import (
+    AlphaMode,
+    ImageOperator,
+    MaskFillMode,
+    PaletteMatchMode,
+)
+from pipescaler.image.core.pipelines import ImageSorter, PipeImage
+from pipescaler.image.operators.mergers import (
+    AlphaMerger,
+    HistogramMatchMerger,
+    NormalMerger,
+    PaletteMatchMerger,
+)
+from pipescaler.image.operators.processors import (
+    CropProcessor,
+    ExpandProcessor,
+    HeightToNormalProcessor,
+    ModeProcessor,
+    ResizeProcessor,
+    SharpenProcessor,
+    SolidColorProcessor,
+    ThresholdProcessor,
+    XbrzProcessor,
+)
+from pipescaler.image.operators.splitters import AlphaSplitter, NormalSplitter
+from pipescaler.image.pipelines.sorters import (
+    AlphaSorter,
+    GrayscaleSorter,
+    ModeSorter,
+    MonochromeSorter,
+    SizeSorter,
+    SolidColorSorter,
+)
+from pipescaler.testing.benchmark import (
+    BenchmarkBaselines,
+    get_benchmark_image,
+    time_call,
+)
+
+type ImageSpec = str | tuple[str, int]
+"""Mode of synthetic image, optionally with number of distinct colors."""
+
+sizes = [64, 256, 512]
+"""Widths and heights of synthetic images."""
+
+
+def get_input_images(specs: tuple[ImageSpec, ...], size: int) -> list[Image.Image]:
+    """Get synthetic input images.
+
+    Arguments:
+        specs: Mode of each image, optionally with number of distinct colors
+        size: Width and height of images
+    Returns:
+        Synthetic input images
+    """
+    images = []
+    for seed, spec in enumerate(specs):
+        if isinstance(spec, tuple):
+            mode, n_colors = spec
+            images.append(get_benchmark_image(mode, size, n_colors, seed=seed))
+        else:
+            images.append(get_benchmark_image(spec, size, seed=seed))
+    return images
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", sizes)
+@pytest.mark.parametrize(
+    ("operator", "specs"),
+    [
+        pytest.param(CropProcessor(pixels=(4, 4, 4, 4)), ("RGB",), id="Crop-RGB"),
+        pytest.param(ExpandProcessor(pixels=(8, 8, 8, 8)), ("RGB",), id="Expand-RGB"),
+        pytest.param(HeightToNormalProcessor(sigma=1.0), ("L",), id="HeightToNormal-L"),
+        pytest.param(ModeProcessor(mode="L"), ("RGBA",), id="Mode-RGBA"),
+        pytest.param(ResizeProcessor(scale=2), ("RGB",), id="Resize-RGB"),
+        pytest.param(ResizeProcessor(scale=2), ("RGBA",), id="Resize-RGBA"),
+        pytest.param(SharpenProcessor(), ("RGB",), id="Sharpen-RGB"),
+        pytest.param(SolidColorProcessor(scale=2), ("RGB",), id="SolidColor-RGB"),
+        pytest.param(ThresholdProcessor(), ("L",), id="Threshold-L"),
+        pytest.param(
+            ThresholdProcessor(denoise=True), ("L",), id="Threshold(denoise)-L"
+        ),
+        pytest.param(XbrzProcessor(scale=2), ("RGB",), id="Xbrz-RGB"),
+        pytest.param(AlphaSplitter(), ("RGBA",), id="AlphaSplitter-RGBA"),
+        pytest.param(
+            AlphaSplitter(
+                alpha_mode=AlphaMode.MONOCHROME_OR_GRAYSCALE,
+                mask_fill_mode=MaskFillMode.BASIC,
+            ),
+            ("RGBA",),
+            id="AlphaSplitter(fill)-RGBA",
+        ),
+        pytest.param(NormalSplitter(), ("RGB",), id="NormalSplitter-RGB"),
+        pytest.param(AlphaMerger(), ("RGB", "L"), id="AlphaMerger-RGB-L"),
+        pytest.param(
+            HistogramMatchMerger(), ("RGB", "RGB"), id="HistogramMatchMerger-RGB-RGB"
+        ),
+        pytest.param(NormalMerger(), ("L", "L", "L"), id="NormalMerger-L-L-L"),
+        pytest.param(
+            PaletteMatchMerger(),
+            (("RGB", 16), ("RGB", 256)),
+            id="PaletteMatchMerger-RGB-RGB",
+        ),
+        pytest.param(
+            PaletteMatchMerger(palette_match_mode=PaletteMatchMode.LOCAL),
+            (("RGB", 16), ("RGB", 256)),
+            id="PaletteMatchMerger(local)-RGB-RGB",
+        ),
+    ],
+)
+def test_operator(
+    operator: ImageOperator,
+    specs: tuple[ImageSpec, ...],
+    size: int,
+    baselines: BenchmarkBaselines,
+    request: pytest.FixtureRequest,
+):
+    """Benchmark image operator.
+
+    Arguments:
+        operator: Image operator to benchmark
+        specs: Mode of each input image, optionally with number of distinct colors
+        size: Width and height of input images
+        baselines: Baseline timings of benchmarks
+        request: Pytest request fixture
+    """
+    input_images = get_input_images(specs, size)
+
+    seconds = time_call(lambda: operator(*input_images))
+
+    baselines.check(request.node.name, seconds)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", sizes)
+@pytest.mark.parametrize(
+    ("sorter", "spec"),
+    [
+        pytest.param(AlphaSorter(), "RGBA", id="AlphaSorter-RGBA"),
+        pytest.param(GrayscaleSorter(), "RGB", id="GrayscaleSorter-RGB"),
+        pytest.param(ModeSorter(), "RGB", id="ModeSorter-RGB"),
+        pytest.param(MonochromeSorter(), "L", id="MonochromeSorter-L"),
+        pytest.param(SizeSorter(), "RGB", id="SizeSorter-RGB"),
+        pytest.param(SolidColorSorter(), "RGB", id="SolidColorSorter-RGB"),
+    ],
+)
+def test_sorter(
+    sorter: ImageSorter,
+    spec: ImageSpec,
+    size: int,
+    baselines: BenchmarkBaselines,
+    request: pytest.FixtureRequest,
+):
+    """Benchmark image sorter.
+
+    Arguments:
+        sorter: Image sorter to benchmark
+        spec: Mode of input image, optionally with number of distinct colors
+        size: Width and height of input image
+        baselines: Baseline timings of benchmarks
+        request: Pytest request fixture
+    """
+    (input_image,) = get_input_images((spec,), size)
+    input_obj = PipeImage(image=input_image, name="benchmark")
+
+    seconds = time_call(lambda: sorter(input_obj))
+
+    baselines.check(request.node.name, seconds)
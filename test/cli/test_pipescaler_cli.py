@@ -4,10 +4,15 @@
 
 from __future__ import annotations
 
+import csv
+import json
+import sys
 from contextlib import redirect_stderr, redirect_stdout
 from inspect import getfile
 from io import StringIO
 from pathlib import Path
+from subprocess import run
+from textwrap import dedent
 
 import pytest
 
@@ -15,8 +20,12 @@ from pipescaler.cli import PipeScalerCli
 from pipescaler.common import CommandLineInterface
 from pipescaler.common.testing import run_cli_with_args
 from pipescaler.image.cli import ImageCli
+from pipescaler.testing.file import get_test_input_path
 from pipescaler.testing.mark import parametrize_with_readable_ids
 
+IMPORT_TIME_BUDGET = 2.0
+"""Maximum time in seconds to import command-line interface and construct parser."""
+
 
 @parametrize_with_readable_ids(
     "commands",
@@ -74,3 +83,83 @@ def test_usage(commands: tuple[type[CommandLineInterface], ...]):
         assert stderr.getvalue().startswith(
             f"usage: {Path(getfile(commands[0])).name} {subcommands}"
         )
+
+
+@pytest.mark.parametrize("suffix", [".json", ".csv"])
+def test_profile(tmp_path: Path, suffix: str):
+    """Test that profile flag saves time and throughput of components.
+
+    Arguments:
+        tmp_path: Temporary directory
+        suffix: Suffix of profile path, which selects its format
+    """
+    input_path = get_test_input_path("RGB")
+    output_path = tmp_path / "output.png"
+    profile_path = tmp_path / f"profile{suffix}"
+
+    run_cli_with_args(
+        PipeScalerCli,
+        f"--profile {profile_path} image process crop --pixels 4 4 4 4 "
+        f"{input_path} {output_path}",
+    )
+
+    assert output_path.exists()
+    with open(profile_path, encoding="utf-8") as infile:
+        if suffix == ".csv":
+            rows = list(csv.DictReader(infile))
+        else:
+            rows = json.load(infile)
+    assert any(row["component"] == "ImageCli" for row in rows)
+
+
+def test_trace(tmp_path: Path):
+    """Test that trace flag saves trace of execution.
+
+    Arguments:
+        tmp_path: Temporary directory
+    """
+    input_path = get_test_input_path("RGB")
+    output_path = tmp_path / "output.png"
+    trace_path = tmp_path / "trace.json"
+
+    run_cli_with_args(
+        PipeScalerCli,
+        f"--trace {trace_path} image process crop --pixels 4 4 4 4 "
+        f"{input_path} {output_path}",
+    )
+
+    assert output_path.exists()
+    with open(trace_path, encoding="utf-8") as infile:
+        trace = json.load(infile)
+    assert any(e["name"] == "ImageCli" for e in trace["traceEvents"])
+
+
+def test_import_time():
+    """Test that command-line interface starts quickly, without heavy dependencies.
+
+    The interface is imported and its argument parser constructed in a new
+    interpreter, as on each invocation from the command line.
+    """
+    script = dedent(
+        """
+        import json
+        import sys
+        from time import perf_counter
+
+        start = perf_counter()
+        from pipescaler.cli import PipeScalerCli
+
+        PipeScalerCli.argparser()
+        seconds = perf_counter() - start
+        print(json.dumps({"seconds": seconds, "modules": sorted(sys.modules)}))
+        """
+    )
+    result = run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    startup = json.loads(result.stdout.splitlines()[-1])
+
+    packages = {module.split(".")[0] for module in startup["modules"]}
+    heavy_packages = {"numba", "reportlab", "scipy", "spandrel", "svglib", "torch"}
+    assert packages.isdisjoint(heavy_packages), packages & heavy_packages
+    assert startup["seconds"] < IMPORT_TIME_BUDGET
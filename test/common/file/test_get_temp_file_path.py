@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from pipescaler.common.file import get_temp_file_path
 
 
@@ -48,3 +50,17 @@ def test_get_temp_file_path_cleanup_on_exception():
     # File should still be cleaned up
     assert temp_file is not None
     assert not temp_file.exists()
+
+
+def test_get_temp_file_path_in_memory():
+    """Test temporary file path on a memory-backed filesystem."""
+    with get_temp_file_path(suffix=".txt", in_memory=True) as temp_file_path:
+        assert temp_file_path.suffix == ".txt"
+        assert not temp_file_path.exists()
+        if Path("/dev/shm").is_dir():
+            assert temp_file_path.parent == Path("/dev/shm")
+
+        temp_file_path.write_text("test content")
+        assert temp_file_path.exists()
+
+    assert not temp_file_path.exists()
@@ -0,0 +1,44 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of common.file.link_file."""
+
+from __future__ import annotations
+
+import pytest
+
+from pipescaler.common.file import LinkStrategy, get_temp_directory_path, link_file
+
+
+@pytest.mark.parametrize("strategy", ["copy", "hardlink", "reflink", "symlink"])
+def test_link_file(strategy: LinkStrategy):
+    """Test linking a file over a pre-existing output file."""
+    with get_temp_directory_path() as temp_directory_path:
+        source_path = temp_directory_path / "source.txt"
+        source_path.write_text("source content")
+        output_path = temp_directory_path / "output.txt"
+        output_path.write_text("pre-existing content")
+
+        used_strategy = link_file(source_path, output_path, strategy)
+
+        assert output_path.read_text() == "source content"
+        if used_strategy == "hardlink":
+            assert output_path.samefile(source_path)
+        elif used_strategy == "symlink":
+            assert output_path.is_symlink()
+        else:
+            assert not output_path.is_symlink()
+            assert not output_path.samefile(source_path)
+        if strategy != "reflink":
+            assert used_strategy == strategy
+        else:
+            assert used_strategy in ("copy", "reflink")
+
+
+def test_link_file_invalid_strategy():
+    """Test that an unsupported link strategy raises ValueError."""
+    with get_temp_directory_path() as temp_directory_path:
+        source_path = temp_directory_path / "source.txt"
+        source_path.write_text("source content")
+
+        with pytest.raises(ValueError):
+            link_file(source_path, temp_directory_path / "output.txt", "move")
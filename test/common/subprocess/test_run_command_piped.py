@@ -0,0 +1,56 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of common.subprocess.run_command_piped."""
+
+from __future__ import annotations
+
+import sys
+from subprocess import TimeoutExpired
+
+import pytest
+
+from pipescaler.common.subprocess import run_command_piped
+
+
+def test_run_command_piped_binary_round_trip():
+    """Test passing binary data through a command's stdin and stdout."""
+    input_bytes = bytes(range(256)) * 64
+    exitcode, stdout, stderr = run_command_piped(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read()[::-1])",
+        ],
+        input_bytes,
+    )
+
+    assert exitcode == 0
+    assert stdout == input_bytes[::-1]
+    assert stderr == ""
+
+
+def test_run_command_piped_failure():
+    """Test that an unacceptable exit code raises ValueError."""
+    with pytest.raises(ValueError, match="failed with exit code 3"):
+        run_command_piped(
+            [sys.executable, "-c", "import sys; sys.stdin.read(); sys.exit(3)"], b""
+        )
+
+
+def test_run_command_piped_acceptable_exitcode():
+    """Test that an acceptable non-zero exit code does not raise."""
+    exitcode, _, _ = run_command_piped(
+        [sys.executable, "-c", "import sys; sys.stdin.read(); sys.exit(3)"],
+        b"",
+        acceptable_exitcodes=[0, 3],
+    )
+
+    assert exitcode == 3
+
+
+def test_run_command_piped_timeout():
+    """Test that a command exceeding its timeout raises TimeoutExpired."""
+    with pytest.raises(TimeoutExpired):
+        run_command_piped(
+            [sys.executable, "-c", "import time; time.sleep(10)"], b"", timeout=1
+        )
@@ -0,0 +1,92 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of common.instrumentation."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any
+
+from pipescaler.common.instrumentation import Instrumentation, instrumented, measure
+
+
+class Component:
+    """Component whose calls are instrumented."""
+
+    @instrumented("component", "count")
+    def __call__(self, n_bytes: int) -> int:
+        """Return number of bytes."""
+        return n_bytes
+
+    def count(self, args: tuple[Any, ...], result: int) -> tuple[int, int]:
+        """Count bytes and pixels processed by a call."""
+        return result, 2 * result
+
+
+class ChildComponent(Component):
+    """Component that calls the instrumented method of its parent."""
+
+    @instrumented("component", "count")
+    def __call__(self, n_bytes: int) -> int:
+        """Return number of bytes."""
+        return super().__call__(n_bytes)
+
+
+def test_inactive():
+    """Test that nothing is measured while instrumentation is inactive."""
+    with measure("block", "Block") as measurement:
+        assert measurement is None
+    assert Component()(1) == 1
+
+    instrumentation = Instrumentation()
+    assert instrumentation.rows == []
+
+
+def test_checkpoint():
+    """Test association of nested measurements with checkpoint of enclosing block."""
+    with Instrumentation() as instrumentation:
+        with measure("block", "Block", "a.png"):
+            Component()(1)
+        Component()(1)
+
+    rows = {(r["category"], r["checkpoint"]): r for r in instrumentation.rows}
+    assert rows["block", "a.png"]["calls"] == 1
+    assert rows["component", "a.png"]["calls"] == 1
+    assert rows["component", ""]["calls"] == 1
+
+
+def test_instrumented():
+    """Test measurement and aggregation of calls of instrumented methods."""
+    with Instrumentation() as instrumentation:
+        Component()(3)
+        Component()(4)
+        ChildComponent()(5)
+
+    rows = {r["component"]: r for r in instrumentation.rows}
+    assert rows["Component"]["calls"] == 2
+    assert rows["Component"]["n_bytes"] == 7
+    assert rows["Component"]["n_pixels"] == 14
+    assert rows["ChildComponent"]["calls"] == 1
+    assert rows["ChildComponent"]["n_bytes"] == 5
+    assert rows["Component"]["wall_time"] >= 0
+    assert rows["Component"]["cpu_time"] >= 0
+
+
+def test_save(tmp_path: Path):
+    """Test saving of summary on exit."""
+    json_path = tmp_path / "summary.json"
+    csv_path = tmp_path / "summary.csv"
+    with Instrumentation(json_path=json_path, csv_path=csv_path) as instrumentation:
+        Component()(3)
+
+    assert "Component" in instrumentation.get_summary()
+    with open(json_path, encoding="utf-8") as infile:
+        json_rows = json.load(infile)
+    assert json_rows == instrumentation.rows
+    with open(csv_path, encoding="utf-8", newline="") as infile:
+        csv_rows = list(csv.DictReader(infile))
+    assert len(csv_rows) == 1
+    assert csv_rows[0]["component"] == "Component"
+    assert csv_rows[0]["n_bytes"] == "3"
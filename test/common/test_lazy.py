@@ -0,0 +1,39 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of common.lazy."""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+
+def test_lazy_getattr(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test importing of a package's names on first access."""
+    package_path = tmp_path / "lazy_package"
+    package_path.mkdir()
+    (package_path / "__init__.py").write_text(
+        "from pipescaler.common.lazy import lazy_getattr\n"
+        "\n"
+        '__all__ = ["Thing"]\n'
+        "\n"
+        '__getattr__ = lazy_getattr(__name__, {"Thing": "thing"})\n'
+    )
+    (package_path / "thing.py").write_text("class Thing:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_package", raising=False)
+    monkeypatch.delitem(sys.modules, "lazy_package.thing", raising=False)
+
+    package = import_module("lazy_package")
+    assert "lazy_package.thing" not in sys.modules
+
+    thing = package.Thing
+    assert "lazy_package.thing" in sys.modules
+    assert thing is sys.modules["lazy_package.thing"].Thing
+    assert package.__dict__["Thing"] is thing
+
+    with pytest.raises(AttributeError):
+        _ = package.Other
@@ -0,0 +1,56 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of common.tracing."""
+
+from __future__ import annotations
+
+import json
+from os import getpid
+from pathlib import Path
+from threading import Thread, get_ident
+
+from pipescaler.common.instrumentation import instrumented, measure
+from pipescaler.common.tracing import Tracer
+
+
+class Component:
+    """Component whose calls are instrumented."""
+
+    def __str__(self) -> str:
+        """String representation."""
+        return "<Component>"
+
+    @instrumented("component")
+    def __call__(self, subject: str) -> str:
+        """Return subject."""
+        return subject
+
+
+def test_trace(tmp_path: Path):
+    """Test tracing of calls in multiple threads."""
+    trace_path = tmp_path / "trace.json"
+    with Tracer(trace_path) as tracer:
+        with measure("block", "Block", "a.png"):
+            Component()("a")
+        thread = Thread(target=Component(), args=("b",), name="worker")
+        thread.start()
+        thread.join()
+    assert len(tracer.events) == 3
+
+    with open(trace_path, encoding="utf-8") as infile:
+        trace = json.load(infile)
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    threads = {
+        e["args"]["name"]: e["tid"] for e in trace["traceEvents"] if e["ph"] == "M"
+    }
+
+    assert [s["name"] for s in spans] == ["Block", "Component", "Component"]
+    assert all(s["pid"] == getpid() for s in spans)
+    block, component_a, component_b = spans
+    assert block["ts"] <= component_a["ts"]
+    assert component_a["ts"] + component_a["dur"] <= block["ts"] + block["dur"]
+    assert component_a["args"] == {"subject": "a", "checkpoint": "a.png"}
+    assert component_a["tid"] == get_ident()
+    assert component_b["args"] == {"subject": "b"}
+    assert component_b["tid"] == threads["worker"]
+    assert component_b["tid"] != component_a["tid"]
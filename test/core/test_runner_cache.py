@@ -0,0 +1,181 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for RunnerCache."""
+
+from __future__ import annotations
+
+from os import utime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pipescaler.common.file import get_temp_directory_path
+from pipescaler.core import Runner, RunnerCache
+
+
+class CountingCopyRunner(Runner):
+    """Copies input file to output file, counting runs."""
+
+    def __init__(self, **kwargs: Any):
+        """Initialize.
+
+        Arguments:
+            kwargs: Additional keyword arguments
+        """
+        super().__init__(**kwargs)
+
+        self.runs = 0
+
+    @property
+    def command_template(self) -> str:
+        """String template with which to generate command."""
+        return f"{self.executable_path} {{input_path}} {{output_path}}"
+
+    @property
+    def piped_command(self) -> str:
+        """Command reading input from standard input and writing output to stdout."""
+        return "cat"
+
+    def run(self, input_path: Path | str, output_path: Path | str):
+        """Run executable on input file, yielding output file.
+
+        Arguments:
+            input_path: Input file path
+            output_path: Output file path
+        """
+        self.runs += 1
+        super().run(input_path, output_path)
+
+    def run_piped(self, input_bytes: bytes) -> bytes:
+        """Run executable on input bytes via stdin, yielding output bytes via stdout.
+
+        Arguments:
+            input_bytes: Contents of input file
+        Returns:
+            Contents of output file
+        """
+        self.runs += 1
+        return super().run_piped(input_bytes)
+
+    @classmethod
+    def executable(cls) -> str:
+        """Name of executable."""
+        return "cp"
+
+    @classmethod
+    def supported_platforms(cls) -> set[str]:
+        """Platforms on which runner is supported."""
+        return {"Darwin", "Linux"}
+
+
+def test():
+    """Test that Runner loads outputs of inputs already processed from cache."""
+    with get_temp_directory_path() as dir_path:
+        cache = RunnerCache(dir_path / "cache")
+        runner = CountingCopyRunner(cache=cache)
+        input_path = dir_path / "input.txt"
+        input_path.write_text("input")
+        duplicate_path = dir_path / "duplicate.txt"
+        duplicate_path.write_text("input")
+
+        runner(input_path, dir_path / "output_1.txt")
+        runner(duplicate_path, dir_path / "output_2.txt")
+        assert runner.runs == 1
+        assert (dir_path / "output_2.txt").read_text() == "input"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Cache persists between sessions
+        runner = CountingCopyRunner(cache=RunnerCache(dir_path / "cache"))
+        runner(input_path, dir_path / "output_3.txt")
+        assert runner.runs == 0
+        assert (dir_path / "output_3.txt").read_text() == "input"
+
+        # Different input is not loaded from cache
+        input_path.write_text("changed")
+        runner(input_path, dir_path / "output_4.txt")
+        assert runner.runs == 1
+        assert (dir_path / "output_4.txt").read_text() == "changed"
+
+
+def test_evict():
+    """Test that RunnerCache evicts least recently used entries."""
+    with get_temp_directory_path() as dir_path:
+        cache = RunnerCache(dir_path / "cache", max_size=20)
+        runner = CountingCopyRunner(cache=cache)
+        input_paths = []
+        for i in range(3):
+            input_path = dir_path / f"input_{i}.txt"
+            input_path.write_text(f"{i}" * 8)
+            input_paths.append(input_path)
+
+        runner(input_paths[0], dir_path / "output.txt")
+        runner(input_paths[1], dir_path / "output.txt")
+        runner(input_paths[0], dir_path / "output.txt")
+        runner(input_paths[2], dir_path / "output.txt")
+        assert runner.runs == 3
+        assert cache.size == 16
+        assert len(list(cache.dir_path.iterdir())) == 2
+
+        # Entry 1 was least recently used, and so was evicted
+        runner(input_paths[0], dir_path / "output.txt")
+        runner(input_paths[1], dir_path / "output.txt")
+        assert runner.runs == 4
+
+
+def test_interrupted():
+    """Test that RunnerCache does not keep entries whose writing was interrupted."""
+    with get_temp_directory_path() as dir_path:
+        cache = RunnerCache(dir_path / "cache")
+        output_path = dir_path / "output.txt"
+        output_path.write_text("output")
+
+        with (
+            patch("pipescaler.core.runner_cache.replace", side_effect=OSError()),
+            pytest.raises(OSError),
+        ):
+            cache.save("key", output_path)
+        with (
+            patch("pipescaler.core.runner_cache.replace", side_effect=OSError()),
+            pytest.raises(OSError),
+        ):
+            cache.save_bytes("key", b"output")
+        assert not any(cache.dir_path.iterdir())
+        assert cache.load_bytes("key") is None
+
+        cache.save("key", output_path)
+        assert [path.name for path in cache.dir_path.iterdir()] == ["key"]
+        assert cache.load_bytes("key") == b"output"
+
+
+def test_load_entries():
+    """Test that RunnerCache loads and evicts entries left by an earlier session."""
+    with get_temp_directory_path() as dir_path:
+        cache = RunnerCache(dir_path, max_size=20)
+        for i in range(3):
+            cache.save_bytes(f"key_{i}", f"{i}".encode() * 8)
+            utime(dir_path / f"key_{i}", ns=(i * 10**9, i * 10**9))
+        assert cache.size == 16
+
+        # Entries beyond a smaller maximum are evicted on startup
+        cache = RunnerCache(dir_path, max_size=10)
+        assert list(cache.entries) == ["key_2"]
+        assert [path.name for path in dir_path.iterdir()] == ["key_2"]
+
+        # Entries removed by another session are misses
+        (dir_path / "key_2").unlink()
+        assert cache.load_bytes("key_2") is None
+        assert cache.size == 0
+        assert cache.misses == 1
+
+
+def test_piped():
+    """Test that Runner loads piped outputs of inputs already processed from cache."""
+    with get_temp_directory_path() as dir_path:
+        runner = CountingCopyRunner(cache=RunnerCache(dir_path))
+
+        assert runner.call_piped(b"input") == b"input"
+        assert runner.call_piped(b"input") == b"input"
+        assert runner.call_piped(b"other") == b"other"
+        assert runner.runs == 2
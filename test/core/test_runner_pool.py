@@ -0,0 +1,107 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for RunnerPool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from shutil import copyfile
+from threading import Lock
+from time import sleep
+
+import pytest
+
+from pipescaler.common.file import get_temp_directory_path
+from pipescaler.core import Runner, RunnerPool
+
+
+class CopyRunner(Runner):
+    """Copies input file to output file using cp."""
+
+    @property
+    def command_template(self) -> str:
+        """String template with which to generate command."""
+        return f"{self.executable_path} {{input_path}} {{output_path}}"
+
+    @classmethod
+    def executable(cls) -> str:
+        """Name of executable."""
+        return "cp"
+
+    @classmethod
+    def supported_platforms(cls) -> set[str]:
+        """Platforms on which runner is supported."""
+        return {"Darwin", "Linux"}
+
+
+class FailingRunner(CopyRunner):
+    """Exits with a nonzero exit code without writing output file."""
+
+    @classmethod
+    def executable(cls) -> str:
+        """Name of executable."""
+        return "false"
+
+
+def test():
+    """Test that RunnerPool runs each job and returns futures in order."""
+    with get_temp_directory_path() as dir_path:
+        input_paths = [dir_path / f"input_{i}.txt" for i in range(8)]
+        output_paths = [dir_path / f"output_{i}.txt" for i in range(8)]
+        for i, input_path in enumerate(input_paths):
+            input_path.write_text(str(i))
+
+        with RunnerPool(CopyRunner(), max_workers=3) as pool:
+            futures = pool.map(zip(input_paths, output_paths))
+            for future in futures:
+                assert future.result() is None
+
+        for i, output_path in enumerate(output_paths):
+            assert output_path.read_text() == str(i)
+
+
+def test_exitcode():
+    """Test that RunnerPool raises unacceptable exit codes from futures."""
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "input.txt"
+        input_path.write_text("input")
+
+        with RunnerPool(FailingRunner(), max_workers=2) as pool:
+            future = pool.submit(input_path, dir_path / "output.txt")
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_max_workers():
+    """Test that RunnerPool runs no more than max_workers jobs at once."""
+    lock = Lock()
+    running = 0
+    max_running = 0
+
+    def runner(input_path: Path, output_path: Path):
+        """Copy file, recording number of jobs running at once.
+
+        Arguments:
+            input_path: Input file path
+            output_path: Output file path
+        """
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        sleep(0.02)
+        copyfile(input_path, output_path)
+        with lock:
+            running -= 1
+
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "input.txt"
+        input_path.write_text("input")
+        jobs = [(input_path, dir_path / f"output_{i}.txt") for i in range(12)]
+
+        pool = RunnerPool(runner, max_workers=3)
+        for future in pool.map(jobs):
+            future.result()
+        pool.shutdown()
+
+    assert 1 < max_running <= 3
@@ -35,10 +35,13 @@ from pipescaler.testing.file import get_test_input_path
     [
         (CropCli, "--pixels 4 4 4 4", "RGB"),
         (ExpandCli, "--pixels 8 8 8 8", "RGB"),
+        (ExpandCli, "--pixels 8 4 2 1 --mode wrap", "RGBA"),
         (HeightToNormalCli, "--sigma 1.0", "L"),
         (ModeCli, "--mode L", "RGB"),
         (ResizeCli, "--scale 2", "RGB"),
+        (ResizeCli, "--scale 2 --premultiply-alpha --backend cv2", "RGBA"),
         (SharpenCli, "", "RGB"),
+        (SharpenCli, "--strength 0.5 --radius 2 --channels luminance", "RGB"),
         (SolidColorCli, "--scale 2", "RGB"),
         (ThresholdCli, "--threshold 64 --denoise", "L"),
         (XbrzCli, "--scale 2", "RGB"),
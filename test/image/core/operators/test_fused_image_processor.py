@@ -0,0 +1,84 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for FusedImageProcessor."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipescaler.image.core import UnsupportedImageModeError
+from pipescaler.image.core.operators import FusedImageProcessor
+from pipescaler.image.operators.processors import (
+    CropProcessor,
+    ModeProcessor,
+    ResizeProcessor,
+    SharpenProcessor,
+    ThresholdProcessor,
+)
+from pipescaler.testing.file import get_test_input_path
+
+
+@pytest.mark.parametrize(
+    "input_filename",
+    [
+        "L",
+        "LA",
+        "RGB",
+        "RGBA",
+        "PRGB",
+    ],
+)
+def test(input_filename: str):
+    """Test that FusedImageProcessor matches processors applied one at a time.
+
+    Arguments:
+        input_filename: Input image filename
+    """
+    processors = [
+        CropProcessor((4, 8, 12, 16)),
+        ModeProcessor(mode="L"),
+        ResizeProcessor(scale=2),
+        ThresholdProcessor(denoise=True),
+    ]
+    processor = FusedImageProcessor(processors)
+    input_path = get_test_input_path(input_filename)
+    input_img = Image.open(input_path)
+    output_img = processor(input_img)
+
+    expected_img = input_img
+    for step in processors:
+        expected_img = step(expected_img)
+    assert output_img.mode == expected_img.mode
+    assert np.array_equal(np.array(output_img), np.array(expected_img))
+
+
+def test_inputs_outputs():
+    """Test FusedImageProcessor accepting and yielding modes of its processors."""
+    processor = FusedImageProcessor([ThresholdProcessor(), ModeProcessor(mode="L")])
+
+    assert processor.inputs() == ThresholdProcessor.inputs()
+    assert processor.outputs() == ModeProcessor.outputs()
+
+    # Modes are validated by the first processor
+    with pytest.raises(UnsupportedImageModeError):
+        processor(Image.open(get_test_input_path("RGB")))
+
+
+def test_invalid_chain():
+    """Test that FusedImageProcessor rejects chains with incompatible modes."""
+    with pytest.raises(UnsupportedImageModeError):
+        FusedImageProcessor([ThresholdProcessor(), SharpenProcessor()])
+    with pytest.raises(ValueError):
+        FusedImageProcessor([])
+
+
+def test_invalid_input():
+    """Test that FusedImageProcessor validates input mode before processing."""
+    processor = FusedImageProcessor([SharpenProcessor(), ModeProcessor(mode="L")])
+    input_path = get_test_input_path("LA")
+    input_img = Image.open(input_path)
+
+    with pytest.raises(UnsupportedImageModeError):
+        processor(input_img)
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -60,3 +61,25 @@ def test(ref: str, fit: str, merger: HistogramMatchMerger):
 
     assert output_img.mode == get_expected_output_mode(fit_img)
     assert output_img.size == fit_img.size
+
+
+def test_channels(merger: HistogramMatchMerger):
+    """Test that HistogramMatchMerger matches each channel independently.
+
+    Arguments:
+        merger: HistogramMatchMerger fixture instance
+    """
+    rng = np.random.default_rng(0)
+    ref_arr = np.stack(
+        [
+            rng.integers(50, 100, (64, 32)),
+            rng.integers(100, 200, (64, 32)),
+            rng.integers(150, 250, (64, 32)),
+        ],
+        axis=-1,
+    ).astype(np.uint8)
+    fit_arr = (ref_arr - np.array([50, 100, 150], np.uint8)) * 2
+
+    output_img = merger(Image.fromarray(ref_arr), Image.fromarray(fit_arr))
+
+    assert np.array_equal(np.array(output_img), ref_arr)
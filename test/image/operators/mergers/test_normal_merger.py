@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -60,3 +61,64 @@ def test(x: str, y: str, z: str, merger: NormalMerger):
 
     assert output_img.mode == "RGB"
     assert output_img.size == x_img.size == y_img.size == z_img.size
+
+
+def get_expected_output_array(
+    x_arr: np.ndarray, y_arr: np.ndarray, z_arr: np.ndarray
+) -> np.ndarray:
+    """Get normal map merged from x, y, and z arrays, in float64 NumPy.
+
+    Arguments:
+        x_arr: X channel array
+        y_arr: Y channel array
+        z_arr: Z channel array
+    Returns:
+        Merged normal map array
+    """
+    x_arr = np.clip(x_arr.astype(float) - 128, -128, 127)
+    y_arr = np.clip(y_arr.astype(float) - 128, -128, 127)
+    z_arr = np.clip(z_arr.astype(float) / 2, 0, 127)
+    magnitude = np.sqrt(x_arr**2 + y_arr**2 + z_arr**2)
+    return np.stack(
+        [
+            np.clip(((arr / magnitude) * 128) + 128, 0, 255).astype(np.uint8)
+            for arr in (x_arr, y_arr, z_arr)
+        ],
+        axis=-1,
+    )
+
+
+def test_batch(merger: NormalMerger):
+    """Test NormalMerger with a batch of same-sized x, y, and z arrays.
+
+    Arguments:
+        merger: NormalMerger fixture instance
+    """
+    rng = np.random.default_rng(0)
+    x_arr, y_arr, z_arr = rng.integers(0, 256, (3, 4, 32, 16), dtype=np.uint8)
+
+    output_arr = merger.merge_arrays(x_arr, y_arr, z_arr)
+
+    assert output_arr.shape == (4, 32, 16, 3)
+    assert np.array_equal(output_arr, get_expected_output_array(x_arr, y_arr, z_arr))
+    for i in range(4):
+        output_img = merger(
+            Image.fromarray(x_arr[i]),
+            Image.fromarray(y_arr[i]),
+            Image.fromarray(z_arr[i]),
+        )
+        assert np.array_equal(output_arr[i], np.array(output_img))
+
+
+def test_shape_mismatch():
+    """Test NormalMerger rejecting x, y, and z channels of different sizes."""
+    with pytest.raises(ValueError):
+        NormalMerger.merge_arrays(
+            np.zeros((64, 64), np.uint8),
+            np.zeros((8, 8), np.uint8),
+            np.zeros((8, 8), np.uint8),
+        )
+    with pytest.raises(ValueError):
+        NormalMerger()(
+            Image.new("L", (64, 64)), Image.new("L", (8, 8)), Image.new("L", (8, 8))
+        )
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -17,6 +18,9 @@ from pipescaler.testing.fixture import parametrized_fixture
     cls=ExpandProcessor,
     params=[
         {"pixels": (4, 4, 4, 4)},
+        {"pixels": (8, 0, 300, 2), "mode": "reflect"},
+        {"pixels": (4, 4, 4, 4), "mode": "wrap"},
+        {"pixels": (0, 6, 2, 0), "mode": "edge"},
     ],
 )
 def processor(request: pytest.FixtureRequest) -> ExpandProcessor:
@@ -60,3 +64,19 @@ def test(input_filename: str, processor: ExpandProcessor):
         input_img.size[0] + processor.left + processor.right,
         input_img.size[1] + processor.top + processor.bottom,
     )
+
+
+@pytest.mark.parametrize("mode", ["edge", "reflect", "symmetric", "wrap"])
+def test_mode(mode: str):
+    """Test ExpandProcessor matches numpy padding, including beyond image size.
+
+    Arguments:
+        mode: Mode with which to fill expanded area
+    """
+    input_arr = np.arange(5 * 7 * 3, dtype=np.uint8).reshape((5, 7, 3))
+    input_img = Image.fromarray(input_arr)
+    output_img = ExpandProcessor((9, 2, 0, 11), mode=mode)(input_img)
+
+    assert np.array_equal(
+        np.array(output_img), np.pad(input_arr, ((2, 11), (9, 0), (0, 0)), mode=mode)
+    )
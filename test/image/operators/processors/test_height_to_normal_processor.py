@@ -7,7 +7,9 @@ from __future__ import annotations
 import numpy as np
 import pytest
 from PIL import Image
+from scipy.ndimage import convolve
 
+from pipescaler.image.core.functions import smooth_image
 from pipescaler.image.operators.processors import HeightToNormalProcessor
 from pipescaler.image.testing import xfail_unsupported_image_mode
 from pipescaler.testing.file import get_test_input_path
@@ -58,3 +60,46 @@ def test(input_filename: str, processor: HeightToNormalProcessor):
     assert output_img.mode == "RGB"
     assert output_img.size == input_img.size
     assert np.min(output_datum[:, :, 2] >= 128)
+
+
+def test_flat(processor: HeightToNormalProcessor):
+    """Test HeightToNormalProcessor with a flat height map.
+
+    Arguments:
+        processor: HeightToNormalProcessor fixture instance
+    """
+    input_img = Image.new("L", (64, 64), 100)
+    output_img = processor(input_img)
+
+    output_datum = np.array(output_img)
+    assert np.all(output_datum == (127, 127, 255))
+
+
+@pytest.mark.parametrize("sigma", [0.5, 1.0, 1.2, 1.5, 2.0])
+@pytest.mark.parametrize("divisor", [1, 16])
+@pytest.mark.parametrize("seed", [None, 2, 17])
+def test_smooth_image(sigma: float, divisor: int, seed: int | None):
+    """Test smooth_image against the scipy convolution it replaced.
+
+    Arguments:
+        sigma: Sigma of Gaussian with which to smooth
+        divisor: Divisor of input image's pixels, so that smoothing does not saturate
+        seed: Seed of random input image, or None for test input image
+    """
+    if seed is None:
+        input_arr = np.array(Image.open(get_test_input_path("L")))
+    else:
+        input_arr = np.random.default_rng(seed).integers(0, 256, (64, 64), np.uint8)
+    input_img = Image.fromarray(input_arr // divisor)
+    kernel = np.exp(
+        (-1 * (np.arange(-3 * sigma, 3 * sigma + 1).astype(float) ** 2))
+        / (2 * (sigma**2))
+    )
+    expected_arr = np.array(input_img).astype(float)
+    expected_arr = convolve(expected_arr, kernel[np.newaxis])
+    expected_arr = convolve(expected_arr, kernel[np.newaxis].T)
+    expected_arr = np.clip(expected_arr, 0, 255).astype(np.uint8)
+
+    output_arr = np.array(smooth_image(input_img, sigma))
+
+    assert np.array_equal(output_arr, expected_arr)
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from platform import system
+
 import pytest
 from PIL import Image
 
@@ -74,3 +76,19 @@ def test(input_filename: str, processor: PotraceProcessor):
         input_img.size[0] * processor.scale,
         input_img.size[1] * processor.scale,
     )
+
+
+@pytest.mark.xfail(
+    system() == "Windows", raises=FileNotFoundError, reason="Not supported on Windows"
+)
+def test_process_batch():
+    """Test PotraceProcessor processing a batch of images on a process pool."""
+    processor = PotraceProcessor()
+    input_imgs = [Image.open(get_test_input_path(name)) for name in ("1", "L", "PL")]
+
+    output_imgs = processor.process_batch(input_imgs, max_workers=2)
+
+    assert len(output_imgs) == len(input_imgs)
+    for input_img, output_img in zip(input_imgs, output_imgs, strict=True):
+        assert output_img.mode == "L"
+        assert output_img.size == input_img.size
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -16,6 +17,9 @@ from pipescaler.testing.fixture import parametrized_fixture
     cls=ResizeProcessor,
     params=[
         {"scale": 2},
+        {"scale": 2, "premultiply_alpha": True},
+        {"scale": 2, "backend": "cv2"},
+        {"scale": 2, "premultiply_alpha": True, "backend": "cv2"},
     ],
 )
 def processor(request: pytest.FixtureRequest) -> ResizeProcessor:
@@ -59,3 +63,29 @@ def test(input_filename: str, processor: ResizeProcessor):
         input_img.size[0] * processor.scale,
         input_img.size[1] * processor.scale,
     )
+
+
+@pytest.mark.parametrize("backend", ["cv2", "pillow"])
+def test_premultiply_alpha(backend: str):
+    """Test that premultiplied alpha prevents color of transparent pixels bleeding.
+
+    Arguments:
+        backend: Library with which to resize
+    """
+    input_arr = np.zeros((8, 8, 4), np.uint8)
+    input_arr[:, :4] = (255, 0, 0, 255)
+    input_arr[:, 4:] = (0, 0, 255, 0)
+    input_img = Image.fromarray(input_arr)
+
+    straight_arr = np.array(ResizeProcessor(2, "bilinear", backend=backend)(input_img))
+    premultiplied_arr = np.array(
+        ResizeProcessor(2, "bilinear", premultiply_alpha=True, backend=backend)(
+            input_img
+        )
+    )
+
+    opaque = premultiplied_arr[:, :, 3] > 0
+    assert np.any(straight_arr[:, :, 2][straight_arr[:, :, 3] > 0] > 0)
+    assert np.all(premultiplied_arr[:, :, 0][opaque] == 255)
+    assert np.all(premultiplied_arr[:, :, 2][opaque] == 0)
+    assert np.array_equal(straight_arr[:, :, 3], premultiplied_arr[:, :, 3])
@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
+from scipy.signal import convolve2d
 
 from pipescaler.image.operators.processors import SharpenProcessor
 from pipescaler.image.testing import (
@@ -20,6 +22,8 @@ from pipescaler.testing.fixture import parametrized_fixture
     cls=SharpenProcessor,
     params=[
         {},
+        {"strength": 0.5, "channels": "luminance"},
+        {"strength": 1.5, "radius": 2.0, "channels": "rgb"},
     ],
 )
 def processor(request: pytest.FixtureRequest) -> SharpenProcessor:
@@ -60,3 +64,27 @@ def test(input_filename: str, processor: SharpenProcessor):
 
     assert output_img.mode == get_expected_output_mode(input_img)
     assert output_img.size == input_img.size
+
+
+@pytest.mark.parametrize("input_filename", ["L", "RGB"])
+def test_convolve2d(input_filename: str):
+    """Test that default SharpenProcessor matches convolution of value channel.
+
+    Arguments:
+        input_filename: Input image filename
+    """
+    input_path = get_test_input_path(input_filename)
+    input_img = Image.open(input_path)
+    kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], float)
+
+    if input_img.mode == "L":
+        expected_arr = convolve2d(np.array(input_img).astype(float), kernel, "same")
+        expected_arr = np.clip(expected_arr, 0, 255).astype(np.uint8)
+    else:
+        hsv_arr = np.array(input_img.convert("HSV"))
+        v_arr = convolve2d(hsv_arr[:, :, 2].astype(float), kernel, "same")
+        hsv_arr[:, :, 2] = np.clip(v_arr, 0, 255).astype(np.uint8)
+        expected_arr = np.array(Image.fromarray(hsv_arr, mode="HSV").convert("RGB"))
+    output_img = SharpenProcessor()(input_img)
+
+    assert np.array_equal(np.array(output_img), expected_arr)
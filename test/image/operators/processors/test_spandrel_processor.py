@@ -72,7 +72,7 @@ class _FakeModel:
 def test_repr_round_trip(monkeypatch: pytest.MonkeyPatch):
     """Test SpandrelProcessor repr round-trip recreation."""
     monkeypatch.setattr(
-        "pipescaler.image.operators.processors.spandrel_processor.ModelLoader.load_from_file",
+        "spandrel.ModelLoader.load_from_file",
         lambda *_args, **_kwargs: _FakeModel(),
     )
 
@@ -0,0 +1,96 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for TiledImageProcessor."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipescaler.image.operators.processors import (
+    ModeProcessor,
+    TiledImageProcessor,
+    XbrzProcessor,
+)
+from pipescaler.image.testing import get_expected_output_mode
+from pipescaler.testing.file import get_test_input_path
+from pipescaler.testing.fixture import parametrized_fixture
+
+
+@parametrized_fixture(
+    cls=TiledImageProcessor,
+    params=[
+        {"size": 64, "overlap": 8},
+        {"size": 64, "overlap": 8, "max_workers": 1},
+        {"size": 96, "overlap": 16, "pool": "process", "max_workers": 2},
+    ],
+)
+def processor(request: pytest.FixtureRequest) -> TiledImageProcessor:
+    """Pytest fixture that provides a TiledImageProcessor instance.
+
+    Arguments:
+        request: Pytest request fixture containing parameters
+    Returns:
+        Configured TiledImageProcessor instance
+    """
+    return TiledImageProcessor(XbrzProcessor(scale=2), **request.param)
+
+
+@pytest.mark.parametrize(
+    "input_filename",
+    [
+        "L",
+        "LA",
+        "RGB",
+        "RGBA",
+        "PRGB",
+    ],
+)
+def test(input_filename: str, processor: TiledImageProcessor):
+    """Test TiledImageProcessor with various image modes.
+
+    Arguments:
+        input_filename: Input image filename
+        processor: TiledImageProcessor fixture instance
+    """
+    input_path = get_test_input_path(input_filename)
+    input_img = Image.open(input_path)
+    output_img = processor(input_img)
+
+    assert output_img.mode == get_expected_output_mode(input_img)
+    assert output_img.size == (input_img.size[0] * 2, input_img.size[1] * 2)
+
+
+@pytest.mark.parametrize("input_filename", ["L", "RGB", "RGBA"])
+def test_unchanged(input_filename: str):
+    """Test that tiles processed without change recompose to the input image.
+
+    Arguments:
+        input_filename: Input image filename
+    """
+    input_path = get_test_input_path(input_filename)
+    input_img = Image.open(input_path)
+    processor = TiledImageProcessor(ModeProcessor(mode=input_img.mode), 48, 8)
+    output_img = processor(input_img)
+
+    assert np.array_equal(np.array(output_img), np.array(input_img))
+
+
+def test_1():
+    """Test TiledImageProcessor with a processor that yields 1-bit tiles."""
+    input_path = get_test_input_path("L")
+    input_img = Image.open(input_path)
+    processor = TiledImageProcessor(ModeProcessor(mode="1"), 48, 8)
+    output_img = processor(input_img)
+
+    assert output_img.mode == "1"
+    assert output_img.size == input_img.size
+
+
+def test_inputs_outputs():
+    """Test TiledImageProcessor accepting and yielding modes of its processor."""
+    processor = TiledImageProcessor(ModeProcessor(mode="L"), 48, 8)
+
+    assert processor.inputs() == ModeProcessor.inputs()
+    assert processor.outputs() == ModeProcessor.outputs()
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
+import xbrz
 from PIL import Image
 
 from pipescaler.image.operators.processors import XbrzProcessor
@@ -60,3 +62,32 @@ def test(input_filename: str, processor: XbrzProcessor):
         input_img.size[0] * processor.scale,
         input_img.size[1] * processor.scale,
     )
+
+
+@pytest.mark.parametrize(
+    "input_filename",
+    [
+        "L",
+        "LA",
+        "RGB",
+        "RGBA",
+    ],
+)
+@pytest.mark.parametrize("band_height", [1, 5, 16, 1024])
+def test_bands(input_filename: str, band_height: int):
+    """Test XbrzProcessor output is identical to that of xbrz's Pillow interface.
+
+    Arguments:
+        input_filename: Input image filename
+        band_height: Height of horizontal bands into which to split input image
+    """
+    input_img = Image.open(get_test_input_path(input_filename))
+    expected_output_img = xbrz.scale_pillow(input_img.convert("RGBA"), 3).convert(
+        input_img.mode
+    )
+    output_img = XbrzProcessor(scale=3, band_height=band_height, max_workers=4)(
+        input_img
+    )
+
+    assert output_img.mode == expected_output_img.mode
+    assert np.array_equal(np.array(output_img), np.array(expected_output_img))
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -59,3 +60,30 @@ def test(input_filename: str, splitter: NormalSplitter):
     assert y_img.size == input_img.size
     assert z_img.mode == "L"
     assert z_img.size == input_img.size
+
+
+def test_batch(splitter: NormalSplitter):
+    """Test NormalSplitter with a batch of same-sized normal map arrays.
+
+    Arguments:
+        splitter: NormalSplitter fixture instance
+    """
+    rng = np.random.default_rng(0)
+    input_arr = rng.integers(0, 256, (4, 32, 16, 3), dtype=np.uint8)
+
+    output_arrs = splitter.split_array(input_arr)
+
+    # Expected outputs, as calculated in float64 NumPy
+    expected_z_arr = (input_arr[..., 2].astype(float) - 128) * 2
+    expected_arrs = (
+        input_arr[..., 0],
+        input_arr[..., 1],
+        np.clip(expected_z_arr, 0, 255).astype(np.uint8),
+    )
+    for output_arr, expected_arr in zip(output_arrs, expected_arrs, strict=True):
+        assert np.array_equal(output_arr, expected_arr)
+    for i in range(4):
+        output_imgs = splitter(Image.fromarray(input_arr[i]))
+        for output_arr, output_img in zip(output_arrs, output_imgs, strict=True):
+            assert output_arr.shape == (4, 32, 16)
+            assert np.array_equal(output_arr[i], np.array(output_img))
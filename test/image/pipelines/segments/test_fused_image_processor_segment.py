@@ -0,0 +1,51 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for FusedImageProcessorSegment."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from pipescaler.image.core.pipelines import PipeImage
+from pipescaler.image.operators.processors import (
+    ModeProcessor,
+    ResizeProcessor,
+    ThresholdProcessor,
+)
+from pipescaler.image.pipelines.segments import (
+    FusedImageProcessorSegment,
+    ImageProcessorSegment,
+)
+from pipescaler.testing.file import get_test_input_path
+
+
+def test():
+    """Test FusedImageProcessorSegment matching segments applied one at a time."""
+    processors = [
+        ModeProcessor(mode="L"),
+        ResizeProcessor(scale=2),
+        ThresholdProcessor(),
+    ]
+    segment = FusedImageProcessorSegment(processors)
+    input_obj = PipeImage(
+        image=Image.open(get_test_input_path("RGB")),
+        name="RGB",
+        location_path=Path("images"),
+    )
+
+    outputs = segment(input_obj)
+
+    expected_outputs: tuple[PipeImage, ...] = (input_obj,)
+    for processor in processors:
+        expected_outputs = ImageProcessorSegment(processor)(*expected_outputs)
+    assert len(outputs) == 1
+    assert outputs[0].location_name == input_obj.location_name
+    assert outputs[0].parents == [input_obj]
+    assert outputs[0].image.mode == expected_outputs[0].image.mode
+    assert np.array_equal(
+        np.array(outputs[0].image), np.array(expected_outputs[0].image)
+    )
+    assert repr(segment) == (f"FusedImageProcessorSegment(processors={processors!r})")
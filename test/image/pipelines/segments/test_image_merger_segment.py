@@ -0,0 +1,45 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for ImageMergerSegment."""
+
+from __future__ import annotations
+
+import pytest
+from PIL import Image
+
+from pipescaler.image.core.pipelines import PipeImage
+from pipescaler.image.operators.mergers import AlphaMerger
+from pipescaler.image.pipelines.segments import ImageMergerSegment
+from pipescaler.testing.file import get_test_input_path
+
+
+def get_input(
+    input_filename: str, name: str, duplicate_of: PipeImage | None = None
+) -> PipeImage:
+    """Get input image under a given name.
+
+    Arguments:
+        input_filename: Input image filename
+        name: Name of input image
+        duplicate_of: Image that input image duplicates, if any
+    Returns:
+        Input image
+    """
+    return PipeImage(
+        image=Image.open(get_test_input_path(input_filename)),
+        name=name,
+        duplicate_of=duplicate_of,
+    )
+
+
+def test_duplicates():
+    """Test ImageMergerSegment passing through inputs only if all are duplicates."""
+    segment = ImageMergerSegment(AlphaMerger())
+    rgb = get_input("RGB", "rgb")
+    alpha = get_input("L", "alpha")
+    rgb_duplicate = get_input("RGB", "rgb_duplicate", duplicate_of=rgb)
+    alpha_duplicate = get_input("L", "alpha_duplicate", duplicate_of=alpha)
+
+    assert segment(rgb_duplicate, alpha_duplicate) == (rgb_duplicate,)
+    with pytest.raises(ValueError, match="rgb_duplicate"):
+        segment(rgb_duplicate, alpha)
@@ -0,0 +1,125 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for ImageRunnerSegment and PostCheckpointedImageRunnerSegment."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from shutil import copyfile
+
+import numpy as np
+from PIL import Image
+
+from pipescaler.common.file import get_temp_directory_path
+from pipescaler.core import Runner
+from pipescaler.image.core.pipelines import PipeImage
+from pipescaler.image.pipelines import ImageCheckpointManager
+from pipescaler.image.pipelines.segments import ImageRunnerSegment
+from pipescaler.testing.file import get_test_input_path
+
+
+class PipedCopyRunner(Runner):
+    """Copies input file to output file, or standard input to standard output."""
+
+    @property
+    def command_template(self) -> str:
+        """String template with which to generate command."""
+        return "cp {input_path} {output_path}"
+
+    @property
+    def piped_command(self) -> str:
+        """Command reading input from standard input and writing output to stdout."""
+        return str(self.executable_path)
+
+    @classmethod
+    def executable(cls) -> str:
+        """Name of executable."""
+        return "cat"
+
+    @classmethod
+    def supported_platforms(cls) -> set[str]:
+        """Platforms on which runner is supported."""
+        return {"Darwin", "Linux"}
+
+
+def copy_runner(input_path: Path, output_path: Path):
+    """Copy input file to output file.
+
+    Arguments:
+        input_path: Input file path
+        output_path: Output file path
+    """
+    copyfile(input_path, output_path)
+
+
+def get_inputs() -> list[PipeImage]:
+    """Get input images, both with and without paths.
+
+    Returns:
+        Input images
+    """
+    inputs = [PipeImage(path=get_test_input_path(name)) for name in ("L", "RGB")]
+    inputs.append(PipeImage(image=Image.open(get_test_input_path("RGBA")), name="A"))
+    return inputs
+
+
+def test():
+    """Test ImageRunnerSegment with individual images and batches."""
+    segment = ImageRunnerSegment(copy_runner)
+    inputs = get_inputs()
+
+    outputs = [segment(input_obj)[0] for input_obj in inputs]
+    batch_outputs = segment.process_batch(inputs, max_workers=2)
+
+    for input_obj, output, batch_output in zip(inputs, outputs, batch_outputs):
+        assert output.path is None
+        assert batch_output.path is None
+        assert np.array_equal(np.array(output.image), np.array(input_obj.image))
+        assert np.array_equal(np.array(batch_output.image), np.array(input_obj.image))
+
+
+def test_piped():
+    """Test ImageRunnerSegment and PostCheckpointedImageRunnerSegment with pipes."""
+    segment = ImageRunnerSegment(PipedCopyRunner())
+    inputs = get_inputs()
+    assert segment.piped
+
+    for input_obj in inputs:
+        output = segment(input_obj)[0]
+        assert output.path is None
+        assert np.array_equal(np.array(output.image), np.array(input_obj.image))
+
+    with get_temp_directory_path() as cp_dir_path:
+        cp_manager = ImageCheckpointManager(cp_dir_path)
+        segment = cp_manager.post_runner("copy.png")(PipedCopyRunner())
+        for input_obj in inputs:
+            output = segment(input_obj)[0]
+            assert output.path == cp_dir_path / input_obj.location_name / "copy.png"
+            assert np.array_equal(np.array(output.image), np.array(input_obj.image))
+
+
+def test_post_checkpointed():
+    """Test PostCheckpointedImageRunnerSegment with batches."""
+    with get_temp_directory_path() as cp_dir_path:
+        cp_manager = ImageCheckpointManager(cp_dir_path)
+        segment = cp_manager.post_runner("copy.png")(copy_runner)
+        inputs = get_inputs()
+
+        outputs = segment.process_batch(inputs, max_workers=2)
+        for input_obj, output in zip(inputs, outputs):
+            assert output.path == cp_dir_path / input_obj.location_name / "copy.png"
+            assert np.array_equal(np.array(output.image), np.array(input_obj.image))
+
+        # Checkpoints are current, so are loaded rather than run again
+        def failing_runner(input_path: Path, output_path: Path):
+            """Fail if run.
+
+            Arguments:
+                input_path: Input file path
+                output_path: Output file path
+            """
+            raise AssertionError(f"Runner run on '{input_path}'")
+
+        segment.segment.runner = failing_runner
+        outputs = segment.process_batch(inputs, max_workers=2)
+        assert len(outputs) == len(inputs)
@@ -0,0 +1,130 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for MemoizedImageSegment."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Any, cast
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipescaler.common.file import get_temp_directory_path
+from pipescaler.image.core.pipelines import PipeImage
+from pipescaler.image.operators.mergers import AlphaMerger
+from pipescaler.image.operators.processors import ResizeProcessor
+from pipescaler.image.operators.splitters import AlphaSplitter
+from pipescaler.image.pipelines.segments import (
+    ImageMergerSegment,
+    ImageProcessorSegment,
+    ImageRunnerSegment,
+    ImageSplitterSegment,
+    MemoizedImageSegment,
+)
+from pipescaler.testing.file import get_test_input_path
+
+
+def get_input(input_filename: str, name: str) -> PipeImage:
+    """Get input image under a given name.
+
+    Arguments:
+        input_filename: Input image filename
+        name: Name of input image
+    Returns:
+        Input image
+    """
+    return PipeImage(image=Image.open(get_test_input_path(input_filename)), name=name)
+
+
+def test():
+    """Test MemoizedImageSegment reusing outputs of images with the same pixels."""
+    segment = MemoizedImageSegment(ImageProcessorSegment(ResizeProcessor(scale=2)))
+
+    first = segment(get_input("RGB", "first"))[0]
+    second = segment(get_input("RGB", "second"))[0]
+    other = segment(get_input("L", "other"))[0]
+
+    assert segment.stats == {"hits": 1, "disk_hits": 0, "misses": 2}
+    assert second.name == "second"
+    assert np.array_equal(np.array(first.image), np.array(second.image))
+    assert other.image.mode == "L"
+
+    # Operators with different configuration are memoized separately
+    segment = MemoizedImageSegment(ImageProcessorSegment(ResizeProcessor(scale=3)))
+    segment(get_input("RGB", "first"))
+    assert segment.stats == {"hits": 0, "disk_hits": 0, "misses": 1}
+
+
+def test_disk():
+    """Test MemoizedImageSegment loading outputs saved by an earlier session."""
+    with get_temp_directory_path() as dir_path:
+        segment = MemoizedImageSegment(
+            ImageSplitterSegment(AlphaSplitter()), dir_path=dir_path
+        )
+        outputs = segment(get_input("RGBA", "first"))
+
+        segment = MemoizedImageSegment(
+            ImageSplitterSegment(AlphaSplitter()), dir_path=dir_path
+        )
+        disk_outputs = segment(get_input("RGBA", "second"))
+        memory_outputs = segment(get_input("RGBA", "third"))
+
+        assert segment.stats == {"hits": 1, "disk_hits": 1, "misses": 0}
+        assert len(outputs) == len(disk_outputs) == len(memory_outputs) == 2
+        for output, disk_output in zip(outputs, disk_outputs):
+            assert disk_output.image.mode == output.image.mode
+            assert np.array_equal(np.array(output.image), np.array(disk_output.image))
+
+
+def test_disk_concurrent():
+    """Test MemoizedImageSegment saving outputs another session saves first."""
+    with get_temp_directory_path() as dir_path:
+        segment = MemoizedImageSegment(
+            ImageProcessorSegment(ResizeProcessor(scale=2)), dir_path=dir_path
+        )
+        input_obj = get_input("RGB", "first")
+        key = segment.get_key((input_obj,))
+        output_images = (segment.segment(input_obj)[0].image,)
+
+        # Stale partial directory left by an interrupted session is not reused
+        (dir_path / f".{key}").mkdir()
+        (dir_path / f".{key}" / "000.png").touch()
+
+        # Other session finishes saving while this session is still writing
+        def mkdtemp_racing(prefix: str, dir: Path) -> str:  # noqa: A002
+            partial_dir_path = mkdtemp(prefix=prefix, dir=dir)
+            (dir_path / key).mkdir()
+            output_images[0].save(dir_path / key / "000.png")
+            return partial_dir_path
+
+        with patch(f"{MemoizedImageSegment.__module__}.mkdtemp", mkdtemp_racing):
+            segment.save(key, output_images)
+        segment.save(key, output_images)
+
+        assert sorted(path.name for path in dir_path.iterdir()) == [f".{key}", key]
+        loaded_images = segment.load(key)
+        assert loaded_images is not None
+        assert np.array_equal(np.array(loaded_images[0]), np.array(output_images[0]))
+
+
+def test_evict():
+    """Test MemoizedImageSegment discarding least recently used outputs."""
+    segment = MemoizedImageSegment(ImageMergerSegment(AlphaMerger()), max_size=1)
+    rgb = get_input("RGB", "rgb")
+    alpha = get_input("L", "alpha")
+
+    output = segment(rgb, alpha)[0]
+    assert output.parents == [rgb, alpha]
+    assert output.image.mode == "RGBA"
+    segment(rgb, alpha)
+    assert segment.stats == {"hits": 0, "disk_hits": 0, "misses": 2}
+
+
+def test_invalid():
+    """Test MemoizedImageSegment rejecting segments that do not apply an operator."""
+    with pytest.raises(TypeError):
+        MemoizedImageSegment(cast(Any, ImageRunnerSegment(lambda i, o: None)))
@@ -0,0 +1,120 @@
+#  Copyright 2020-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of ImageDeduplicatingSource."""
+
+from __future__ import annotations
+
+from filecmp import cmp
+from shutil import copyfile
+from unittest.mock import patch
+
+from PIL import Image
+
+from pipescaler.common.file import get_temp_directory_path
+from pipescaler.image.operators.processors import ResizeProcessor
+from pipescaler.image.pipelines.segments import ImageProcessorSegment
+from pipescaler.image.pipelines.sorters import SizeSorter
+from pipescaler.image.pipelines.sources import (
+    ImageDeduplicatingSource,
+    ImageDirectorySource,
+)
+from pipescaler.image.pipelines.termini import ImageDirectoryTerminus
+from pipescaler.pipelines import CheckpointManager
+from pipescaler.testing.file import get_test_input_path
+
+
+def test():
+    """Test ImageDeduplicatingSource identifying byte- and pixel-identical images."""
+    with get_temp_directory_path() as dir_path:
+        copyfile(get_test_input_path("RGB"), dir_path / "a.png")
+        copyfile(get_test_input_path("RGB"), dir_path / "b.png")
+        Image.open(get_test_input_path("RGB")).save(
+            dir_path / "c.png", compress_level=0
+        )
+        copyfile(get_test_input_path("L"), dir_path / "d.png")
+        source = ImageDeduplicatingSource(ImageDirectorySource(dir_path))
+
+        pipe_images = {pipe_image.name: pipe_image for pipe_image in source}
+
+        assert pipe_images["a"].duplicate_of is None
+        assert pipe_images["b"].duplicate_of is not None
+        assert pipe_images["b"].duplicate_of.name == "a"
+        assert pipe_images["c"].duplicate_of is not None
+        assert pipe_images["c"].duplicate_of.name == "a"
+        assert pipe_images["d"].duplicate_of is None
+        assert source.n_duplicates == 2
+
+
+def test_pipeline():
+    """Test pipeline processing and checkpointing each unique image once."""
+    with get_temp_directory_path() as dir_path:
+        input_dir_path = dir_path / "input"
+        input_dir_path.mkdir()
+        copyfile(get_test_input_path("RGB"), input_dir_path / "a.png")
+        copyfile(get_test_input_path("RGB"), input_dir_path / "b.png")
+        Image.open(get_test_input_path("RGB")).save(
+            input_dir_path / "c.png", compress_level=0
+        )
+        copyfile(get_test_input_path("L"), input_dir_path / "d.png")
+        source = ImageDeduplicatingSource(ImageDirectorySource(input_dir_path))
+        cp_manager = CheckpointManager(dir_path / "checkpoints")
+        segment = cp_manager.post_segment("resized.png")(
+            ImageProcessorSegment(ResizeProcessor(scale=2))
+        )
+        terminus = ImageDirectoryTerminus(dir_path / "output")
+
+        with patch.object(
+            ResizeProcessor,
+            "__call__",
+            autospec=True,
+            side_effect=ResizeProcessor.__call__,
+        ) as call:
+            for pipe_image in source:
+                terminus(*segment(pipe_image))
+
+        assert call.call_count == 2
+        for name in ("b", "c"):
+            assert cmp(
+                dir_path / "checkpoints" / "a" / "resized.png",
+                dir_path / "checkpoints" / name / "resized.png",
+                shallow=False,
+            )
+            assert cmp(
+                dir_path / "output" / "a.png",
+                dir_path / "output" / f"{name}.png",
+                shallow=False,
+            )
+            assert (name, "resized.png") in cp_manager.observed_checkpoints
+        assert (dir_path / "output" / "d.png").exists()
+
+
+def test_pipeline_sorter():
+    """Test pipeline sorting duplicate images with the images they duplicate.
+
+    Images are sorted after a resizing segment, through which duplicate images are
+    passed unresized.
+    """
+    with get_temp_directory_path() as dir_path:
+        input_dir_path = dir_path / "input"
+        input_dir_path.mkdir()
+        copyfile(get_test_input_path("RGB"), input_dir_path / "a.png")
+        copyfile(get_test_input_path("RGB"), input_dir_path / "b.png")
+        source = ImageDeduplicatingSource(ImageDirectorySource(input_dir_path))
+        segment = ImageProcessorSegment(ResizeProcessor(scale=2))
+        size = min(Image.open(get_test_input_path("RGB")).size)
+        sorter = SizeSorter(cutoff=size + 1)
+        termini = {
+            outlet: ImageDirectoryTerminus(dir_path / outlet)
+            for outlet in sorter.outlets
+        }
+
+        for pipe_image in source:
+            outputs = segment(pipe_image)
+            termini[sorter(outputs[0])](*outputs)
+
+        assert cmp(
+            dir_path / "greater_than_or_equal_to" / "a.png",
+            dir_path / "greater_than_or_equal_to" / "b.png",
+            shallow=False,
+        )
+        assert not any((dir_path / "less_than").iterdir())
@@ -5,9 +5,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
-from pipescaler.common.file import get_temp_file_path
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from pipescaler.common.file import get_temp_directory_path, get_temp_file_path
+from pipescaler.image.operators.processors import ResizeProcessor
+from pipescaler.image.pipelines.segments import ImageProcessorSegment
+from pipescaler.image.pipelines.sorters import SizeSorter
 from pipescaler.image.pipelines.sources import ImageVideoFrameSource
+from pipescaler.image.pipelines.termini import ImageDirectoryTerminus
 
 
 def test_repr_round_trip():
@@ -17,7 +27,228 @@ def test_repr_round_trip():
         source = ImageVideoFrameSource(
             input_path=input_path,
             location_path=Path("videos"),
+            dedup=True,
+            dedup_tolerance=4,
+            dedup_window=16,
         )
         recreated = eval(repr(source))
         assert recreated.input_path == source.input_path
         assert recreated.location_path == source.location_path
+        assert recreated.dedup == source.dedup
+        assert recreated.dedup_tolerance == source.dedup_tolerance
+        assert recreated.dedup_window == source.dedup_window
+
+
+def write_test_video(video_path: Path, frames: list[np.ndarray]):
+    """Write a video.
+
+    Arguments:
+        video_path: Path to which to write video
+        frames: Frames to write
+    """
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(
+        str(video_path), cv2.VideoWriter_fourcc(*"MJPG"), 24, (width, height)
+    )
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+
+def get_gradient_frame(direction: int, noise: int = 0) -> np.ndarray:
+    """Get a frame containing a gradient, optionally with added noise.
+
+    Arguments:
+        direction: Direction of gradient; 0 for increasing left to right, 1 for
+          decreasing left to right, 2 for increasing toward center
+        noise: Seed of noise to add, or 0 for no noise
+    Returns:
+        Frame
+    """
+    ramp = np.linspace(0, 255, 64)
+    if direction == 0:
+        gray = np.tile(ramp, (64, 1))
+    elif direction == 1:
+        gray = np.tile(ramp[::-1], (64, 1))
+    else:
+        gray = np.tile(255 - np.abs(ramp - 127.5) * 2, (64, 1))
+    if noise:
+        gray = gray + np.random.default_rng(noise).integers(-3, 4, gray.shape)
+    gray = np.clip(gray, 0, 255).astype(np.uint8)
+    return np.stack([gray, gray, gray], axis=-1)
+
+
+@pytest.mark.parametrize(
+    ("frames", "dedup_tolerance", "expected_duplicates"),
+    [
+        (
+            [get_gradient_frame(d) for d in (0, 0, 1, 1, 1, 2, 0)],
+            None,
+            [None, 0, None, 2, 2, None, 0],
+        ),
+        (
+            [get_gradient_frame(d, n) for n, d in enumerate((0, 0, 1, 1, 2, 0), 1)],
+            None,
+            [None, None, None, None, None, None],
+        ),
+        (
+            [get_gradient_frame(d, n) for n, d in enumerate((0, 0, 1, 1, 2, 0), 1)],
+            4,
+            [None, 0, None, 2, None, 0],
+        ),
+    ],
+)
+def test_dedup(
+    frames: list[np.ndarray],
+    dedup_tolerance: int | None,
+    expected_duplicates: list[int | None],
+):
+    """Test ImageVideoFrameSource identification of duplicate frames."""
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "video.avi"
+        write_test_video(input_path, frames)
+        source = ImageVideoFrameSource(
+            input_path=input_path, dedup=True, dedup_tolerance=dedup_tolerance
+        )
+        pipe_images = list(source)
+
+        assert len(pipe_images) == len(expected_duplicates)
+        for index, (pipe_image, expected_duplicate) in enumerate(
+            zip(pipe_images, expected_duplicates, strict=True)
+        ):
+            assert pipe_image.name == f"{index + 1:06d}"
+            if expected_duplicate is None:
+                assert pipe_image.duplicate_of is None
+            else:
+                assert pipe_image.duplicate_of is not None
+                assert pipe_image.duplicate_of is pipe_images[expected_duplicate]
+
+
+@pytest.mark.parametrize(
+    ("dedup_window", "expected_duplicates"),
+    [
+        (1, [None, None, None, 2, None]),
+        (2, [None, None, 0, 0, 1]),
+    ],
+)
+@pytest.mark.parametrize("dedup_tolerance", [None, 4])
+def test_dedup_window(
+    dedup_window: int,
+    expected_duplicates: list[int | None],
+    dedup_tolerance: int | None,
+):
+    """Test ImageVideoFrameSource releasing unique frames beyond its window."""
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "video.avi"
+        write_test_video(input_path, [get_gradient_frame(d) for d in (0, 1, 0, 0, 1)])
+        source = ImageVideoFrameSource(
+            input_path=input_path,
+            dedup=True,
+            dedup_tolerance=dedup_tolerance,
+            dedup_window=dedup_window,
+        )
+        pipe_images = list(source)
+
+        for pipe_image, expected_duplicate in zip(
+            pipe_images, expected_duplicates, strict=True
+        ):
+            if expected_duplicate is None:
+                assert pipe_image.duplicate_of is None
+            else:
+                assert pipe_image.duplicate_of is pipe_images[expected_duplicate]
+
+        # Hashes of released unique frames are released with them
+        unique_indexes = set(source._unique_frames)
+        assert len(unique_indexes) == dedup_window
+        assert set(source._exact_hashes.values()) == unique_indexes
+        assert set(source._unique_exact_hashes) == unique_indexes
+        if dedup_tolerance is not None:
+            assert set(source._perceptual_indexes.tolist()) == unique_indexes
+
+
+def test_dedup_sorter():
+    """Test pipeline sorting duplicate frames with the frames they duplicate.
+
+    Frames are sorted after a resizing segment, through which duplicate frames are
+    passed unresized.
+    """
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "video.avi"
+        write_test_video(input_path, [get_gradient_frame(d) for d in (0, 0, 1)])
+        source = ImageVideoFrameSource(input_path=input_path, dedup=True)
+        segment = ImageProcessorSegment(ResizeProcessor(scale=2))
+        sorter = SizeSorter(cutoff=100)
+        termini = {
+            outlet: ImageDirectoryTerminus(dir_path / outlet)
+            for outlet in sorter.outlets
+        }
+
+        for pipe_image in source:
+            outputs = segment(pipe_image)
+            outlet = sorter(outputs[0])
+            termini[outlet](*outputs)
+
+        output_paths = sorted(
+            (dir_path / "greater_than_or_equal_to").glob("video_avi/*.png")
+        )
+        assert [p.stem for p in output_paths] == ["000001", "000002", "000003"]
+        assert not any((dir_path / "less_than").iterdir())
+
+
+def test_dedup_pipeline():
+    """Test pipeline processing each unique frame of ImageVideoFrameSource once."""
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "video.avi"
+        write_test_video(
+            input_path, [get_gradient_frame(d) for d in (0, 0, 1, 1, 1, 2, 0)]
+        )
+        source = ImageVideoFrameSource(input_path=input_path, dedup=True)
+        segment = ImageProcessorSegment(ResizeProcessor(scale=2))
+        terminus = ImageDirectoryTerminus(dir_path / "output")
+
+        with patch.object(
+            ResizeProcessor,
+            "__call__",
+            autospec=True,
+            side_effect=ResizeProcessor.__call__,
+        ) as call:
+            for pipe_image in source:
+                terminus(*segment(pipe_image))
+
+        assert call.call_count == 3
+        output_paths = sorted((dir_path / "output").glob("video_avi/*.png"))
+        assert [p.stem for p in output_paths] == [f"{i:06d}" for i in range(1, 8)]
+        for output_path in output_paths:
+            assert Image.open(output_path).size == (128, 128)
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "stride", "expected_indexes"),
+    [
+        (0, None, 1, list(range(10))),
+        (2, None, 1, list(range(2, 10))),
+        (0, 5, 1, list(range(5))),
+        (1, 9, 3, [1, 4, 7]),
+        (0, 100, 4, [0, 4, 8]),
+    ],
+)
+def test_frame_selection(
+    start: int, stop: int | None, stride: int, expected_indexes: list[int]
+):
+    """Test ImageVideoFrameSource start, stop, and stride frame selection."""
+    with get_temp_directory_path() as dir_path:
+        input_path = dir_path / "video.avi"
+        write_test_video(
+            input_path, [np.full((32, 32, 3), i * 10, np.uint8) for i in range(10)]
+        )
+        source = ImageVideoFrameSource(
+            input_path=input_path, start=start, stop=stop, stride=stride, queue_size=2
+        )
+        pipe_images = list(source)
+
+        assert [pipe_image.name for pipe_image in pipe_images] == [
+            f"{index + 1:06d}" for index in expected_indexes
+        ]
+        for pipe_image, index in zip(pipe_images, expected_indexes, strict=True):
+            assert pipe_image.image.mode == "RGB"
+            assert abs(int(np.array(pipe_image.image).mean()) - index * 10) <= 3
@@ -4,11 +4,20 @@
 
 from __future__ import annotations
 
+from filecmp import cmp
+from os import utime
+from pathlib import Path
+from shutil import copyfile
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
+import pytest
+from PIL import Image
+
+from pipescaler.common.file import LinkStrategy
 from pipescaler.image.core.pipelines import PipeImage
 from pipescaler.image.pipelines.termini import ImageDirectoryTerminus
-from pipescaler.testing.file import get_test_input_dir_path
+from pipescaler.testing.file import get_test_input_dir_path, get_test_input_path
 
 
 def test():
@@ -25,3 +34,110 @@ def test():
 
         terminus = ImageDirectoryTerminus(dir_path=output_dir_path)
         terminus.purge_unrecognized_files()
+
+
+def test_hardlink():
+    """Test ImageDirectoryTerminus hardlinking image files."""
+    with TemporaryDirectory() as output_dir_path:
+        terminus = ImageDirectoryTerminus(
+            dir_path=output_dir_path, link_strategy="hardlink"
+        )
+        input_path = get_test_input_path("RGB")
+
+        terminus(PipeImage(path=input_path))
+
+        assert (Path(output_dir_path) / "RGB.png").samefile(input_path)
+        assert "link_strategy='hardlink'" in repr(terminus)
+
+
+@pytest.mark.parametrize("link_strategy", ["hardlink", "symlink"])
+def test_unchanged_link(link_strategy: LinkStrategy):
+    """Test ImageDirectoryTerminus not touching inputs of unchanged linked outputs."""
+    with (
+        TemporaryDirectory() as input_dir_path,
+        TemporaryDirectory() as output_dir_path,
+    ):
+        input_path = Path(input_dir_path) / "RGB.png"
+        copyfile(get_test_input_path("RGB"), input_path)
+        utime(input_path, (0, 0))
+        terminus = ImageDirectoryTerminus(
+            dir_path=output_dir_path, link_strategy=link_strategy
+        )
+
+        terminus(PipeImage(path=input_path))
+        terminus(PipeImage(path=input_path))
+
+        assert input_path.stat().st_mtime == 0
+
+
+def test_duplicate():
+    """Test ImageDirectoryTerminus fulfilling duplicates from prior output."""
+    with TemporaryDirectory() as output_dir_path:
+        terminus = ImageDirectoryTerminus(dir_path=output_dir_path)
+        image = Image.open(get_test_input_path("RGB"))
+        original = PipeImage(image=image, name="000001", location_path=Path("video"))
+        duplicate = PipeImage(
+            image=image.convert("L"),
+            name="000002",
+            location_path=Path("video"),
+            duplicate_of=original,
+        )
+
+        terminus(original)
+        terminus(duplicate)
+
+        original_path = Path(output_dir_path) / "video" / "000001.png"
+        duplicate_path = Path(output_dir_path) / "video" / "000002.png"
+        assert cmp(original_path, duplicate_path, shallow=False)
+        assert {"video/000001.png", "video/000002.png"} <= terminus.observed_files
+
+
+def test_duplicate_not_output():
+    """Test ImageDirectoryTerminus refusing duplicates of images it has not output."""
+    with TemporaryDirectory() as output_dir_path:
+        terminus = ImageDirectoryTerminus(dir_path=output_dir_path)
+        image = Image.open(get_test_input_path("RGB"))
+        original = PipeImage(image=image, name="000001", location_path=Path("video"))
+        duplicate = PipeImage(
+            image=image,
+            name="000002",
+            location_path=Path("video"),
+            duplicate_of=original,
+        )
+
+        with pytest.raises(ValueError):
+            terminus(duplicate)
+
+        assert not (Path(output_dir_path) / "video" / "000002.png").exists()
+
+
+def test_unchanged_without_decoding():
+    """Test ImageDirectoryTerminus detecting unchanged output without decoding it."""
+    with (
+        TemporaryDirectory() as input_dir_path,
+        TemporaryDirectory() as output_dir_path,
+    ):
+        image = Image.open(get_test_input_path("RGB"))
+        ImageDirectoryTerminus(dir_path=output_dir_path)(
+            PipeImage(image=image, name="image")
+        )
+        input_path = Path(input_dir_path) / "input.png"
+        copyfile(get_test_input_path("L"), input_path)
+        ImageDirectoryTerminus(dir_path=output_dir_path)(PipeImage(path=input_path))
+        utime(input_path, (input_path.stat().st_atime, input_path.stat().st_mtime + 10))
+
+        terminus = ImageDirectoryTerminus(dir_path=output_dir_path)
+        assert "image.png" in terminus.digests
+        module = "pipescaler.image.pipelines.termini.image_directory_terminus"
+        with patch(f"{module}.np") as mock_np:
+            terminus(PipeImage(image=image, name="image"))
+            terminus(PipeImage(path=input_path))
+            mock_np.array_equal.assert_not_called()
+
+        # Digests are recorded against the touched output files
+        for name in ("image.png", "input.png"):
+            output_path = Path(output_dir_path) / name
+            assert terminus.digests[name]["mtime_ns"] == output_path.stat().st_mtime_ns
+
+        terminus.purge_unrecognized_files()
+        assert (Path(output_dir_path) / terminus.manifest_filename).exists()
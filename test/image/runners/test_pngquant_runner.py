@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 from os.path import getsize
 
 import pytest
@@ -59,6 +60,29 @@ def test(input_filename: str, runner: PngquantRunner):
                 assert getsize(output_path) <= getsize(input_path)
 
 
+@pytest.mark.parametrize(
+    "input_filename",
+    [
+        xfail_if_platform({"Windows"}, ExecutableNotFoundError)("RGB"),
+    ],
+)
+def test_piped(input_filename: str, runner: PngquantRunner):
+    """Test PngquantRunner compressing PNG images via stdin and stdout.
+
+    Arguments:
+        input_filename: Input image filename
+        runner: PngquantRunner fixture instance
+    """
+    input_bytes = get_test_input_path(input_filename).read_bytes()
+    output_bytes = runner.run_piped(input_bytes)
+
+    with Image.open(BytesIO(input_bytes)) as input_img:
+        with Image.open(BytesIO(output_bytes)) as output_img:
+            assert output_img.mode in (input_img.mode, "P")
+            assert output_img.size == input_img.size
+            assert len(output_bytes) <= len(input_bytes)
+
+
 def test_repr_round_trip():
     """Test PngquantRunner repr round-trip recreation."""
     runner = PngquantRunner(arguments="--quality 1-10", timeout=1)
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -75,3 +76,58 @@ def test_subdivider(
 
     output_scale = subdivided_img.image.width / input_img.width
     assert output_scale == scale
+
+
+@pytest.mark.parametrize("input_filename", ["L", "RGB", "RGBA"])
+def test_streaming(input_filename: str, xbrz_processor: XbrzProcessor):
+    """Test SubdividedImage processing subdivisions lazily, one at a time.
+
+    Arguments:
+        input_filename: Input image filename
+        xbrz_processor: XbrzProcessor fixture instance
+    """
+    input_path = get_test_input_path(input_filename)
+    input_img = Image.open(input_path)
+
+    listed_img = SubdividedImage(input_img, 100, 10)
+    listed_img.subs = [xbrz_processor(sub) for sub in listed_img.subs]
+    streamed_img = SubdividedImage(input_img, 100, 10)
+    streamed_img.recompose(xbrz_processor(sub) for sub in streamed_img.iter_subs())
+
+    assert streamed_img.image.mode == input_img.mode
+    assert streamed_img.size == listed_img.size == 600
+    assert streamed_img.overlap == listed_img.overlap == 60
+    assert np.array_equal(np.array(streamed_img.image), np.array(listed_img.image))
+    with pytest.raises(ValueError):
+        streamed_img.recompose(list(streamed_img.iter_subs())[:-1])
+
+
+def test_sub_edge_tapers():
+    """Test SubdividedImage tiling edge taper weights for compatibility."""
+    taper = SubdividedImage.get_sub_edge_taper(8)
+    left, top, right, bottom = SubdividedImage.get_sub_edge_tapers(4, 8)
+
+    expected = [1, 6, 29, 87, 168, 226, 249, 254]
+    assert np.round(taper * 255).astype(int).tolist() == expected
+    assert left.shape == right.shape == (4, 8)
+    assert top.shape == bottom.shape == (8, 4)
+    assert np.array_equal(left[0], taper)
+    assert np.array_equal(right[0], taper[::-1])
+    assert np.array_equal(top[:, 0], taper)
+    assert np.array_equal(bottom[:, 0], taper[::-1])
+
+
+def test_recomposed_image():
+    """Test SubdividedImage recomposing subdivisions with positional arguments."""
+    input_img = Image.open(get_test_input_path("RGB"))
+    subdivided_img = SubdividedImage(input_img, 100, 10)
+
+    recomposed_img = SubdividedImage.get_recomposed_image(
+        subdivided_img.subs, subdivided_img.boxes, 100, 10
+    )
+    weights = SubdividedImage.get_sub_weights(subdivided_img.boxes, 100, 10)
+
+    assert np.array_equal(np.array(recomposed_img), np.array(input_img))
+    assert len(weights) == len(subdivided_img.boxes)
+    for weight, box in zip(weights, subdivided_img.boxes):
+        assert weight.shape == (box[3] - box[1], box[2] - box[0])
@@ -68,8 +68,12 @@ def test():
         mock_segment = Mock(spec=Segment)
         mock_cp_manager = Mock(spec=CheckpointManager)
         mock_cp_manager.dir_path = cp_dir_path
+        mock_cp_manager.checkpoints_available.side_effect = lambda _, cpt_paths: all(
+            p.exists() for p in cpt_paths
+        )
         mock_pipe_object_input = Mock(spec=PipeObject)
         mock_pipe_object_input.location_name = "test"
+        mock_pipe_object_input.duplicate_of = None
         mock_pipe_object_output = Mock(spec=PipeObject)
         mock_pipe_object_output.location_name = "test"
         mock_pipe_object_output.save.side_effect = mock_pipe_object_save
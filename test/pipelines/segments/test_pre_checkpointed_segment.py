@@ -57,6 +57,7 @@ def test():
         mock_cp_manager.dir_path = cp_dir_path
         mock_pipe_object = Mock(spec=PipeObject)
         mock_pipe_object.location_name = "test"
+        mock_pipe_object.duplicate_of = None
         mock_pipe_object.save.side_effect = mock_pipe_object_save
 
         # Initialize
@@ -55,6 +55,7 @@ def test_load_save():
 
         # Mocks
         mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
         mock_pipe_object_input.location_name = "test"
         mock_pipe_object_input.save.side_effect = mock_pipe_object_save
 
@@ -68,6 +69,7 @@ def test_load_save():
 
         # Attempt to load invalid number of checkpoints
         mock_pipe_object_input_2 = Mock(spec=PipeObject)
+        mock_pipe_object_input_2.duplicate_of = None
         mock_pipe_object_input_2.location_name = "test2"
         try:
             cp_manager.load(
@@ -113,6 +115,83 @@ def test_load_save():
         cp_manager.purge_unrecognized_files()
 
 
+@patch.object(PipeObject, "save", mock_pipe_object_save_2)
+@patch.object(PipeObject, "__abstractmethods__", set())
+def test_stats():
+    """Test CheckpointManager counting checkpoints loaded, computed, and written."""
+    with get_temp_directory_path() as cp_dir_path:
+        input_path = cp_dir_path / "input.txt"
+        input_path.touch()
+        mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
+        mock_pipe_object_input.location_name = "test"
+        mock_pipe_object_input.path = input_path
+        mock_pipe_object_input.save.side_effect = lambda p: Path(p).write_text("abc")
+
+        # Compute checkpoint
+        cp_manager = CheckpointManager(cp_dir_path, validate_input_mtime=True)
+        assert cp_manager.load((mock_pipe_object_input,), ("cpt.txt",)) is None
+        cp_manager.save((mock_pipe_object_input,), ("cpt.txt",))
+        counts = cp_manager.counts["cpt.txt"]
+        assert counts["missing"] == 1
+        assert counts["computed"] == 1
+        assert counts["bytes"] == 3
+        assert cp_manager.get_time_saved("cpt.txt") == 0
+        cp_manager.save_timings()
+        cp_manager.save_timings()
+
+        # Load checkpoint, estimating time saved from that spent computing it
+        cp_manager = CheckpointManager(cp_dir_path, validate_input_mtime=True)
+        assert cp_manager.historical_timings["cpt.txt"][0] == 1
+        assert cp_manager.load((mock_pipe_object_input,), ("cpt.txt",))
+        assert cp_manager.counts["cpt.txt"]["loaded"] == 1
+        assert cp_manager.get_time_saved("cpt.txt") == pytest.approx(
+            cp_manager.historical_timings["cpt.txt"][1]
+        )
+
+        # Attempt to load stale checkpoint
+        cpt_path = cp_dir_path / "test" / "cpt.txt"
+        newer_mtime_ns = cpt_path.stat().st_mtime_ns + 1_000_000_000
+        utime(input_path, ns=(newer_mtime_ns, newer_mtime_ns))
+        assert cp_manager.load((mock_pipe_object_input,), ("cpt.txt",)) is None
+        assert cp_manager.counts["cpt.txt"]["stale"] == 1
+
+        report = cp_manager.get_report()
+        assert "cpt.txt" in report
+        assert "Total" in report
+
+        # Timings are not purged, and are saved on purging at the end of a run
+        cp_manager.timings_path.unlink()
+        with patch("pipescaler.core.pipelines.checkpoint_manager_base.info") as info:
+            cp_manager.purge_unrecognized_files()
+        assert cp_manager.timings_path.exists()
+        assert any(report in call.args[0] for call in info.call_args_list)
+
+
+@patch.object(PipeObject, "__abstractmethods__", set())
+def test_close():
+    """Test CheckpointManager discarding starts of checkpoints never saved."""
+    with get_temp_directory_path() as cp_dir_path:
+        mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
+        mock_pipe_object_input.location_name = "test"
+        mock_pipe_object_input.path = None
+        mock_pipe_object_input.save.side_effect = OSError()
+
+        with CheckpointManager(cp_dir_path) as cp_manager:
+            # Start is discarded when saving fails
+            assert cp_manager.load((mock_pipe_object_input,), ("cpt.txt",)) is None
+            with pytest.raises(OSError):
+                cp_manager.save((mock_pipe_object_input,), ("cpt.txt",))
+            assert not cp_manager._load_starts
+
+            # Start is discarded when closing without saving
+            assert cp_manager.load((mock_pipe_object_input,), ("cpt.txt",)) is None
+            assert cp_manager._load_starts
+        assert not cp_manager._load_starts
+        assert cp_manager.timings_path.exists()
+
+
 def test_pre_segment():
     """Test CheckpointManager wrapping segments with pre-checkpointing."""
     with get_temp_directory_path() as cp_dir_path:
@@ -130,6 +209,7 @@ def test_load_respects_input_mtime():
         input_path = cp_dir_path / "input.txt"
         input_path.touch()
         mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
         mock_pipe_object_input.location_name = "test"
         mock_pipe_object_input.path = input_path
         mock_pipe_object_input.save.side_effect = mock_pipe_object_save
@@ -154,6 +234,7 @@ def test_load_respects_input_mtime_missing_input_path_is_stale():
         cp_manager = CheckpointManager(cp_dir_path, validate_input_mtime=True)
 
         mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
         mock_pipe_object_input.location_name = "test"
         mock_pipe_object_input.path = None
         mock_pipe_object_input.save.side_effect = mock_pipe_object_save
@@ -173,6 +254,7 @@ def test_load_respects_input_mtime_missing_input_file_is_stale():
         input_path = cp_dir_path / "input.txt"
         input_path.touch()
         mock_pipe_object_input = Mock(spec=PipeObject)
+        mock_pipe_object_input.duplicate_of = None
         mock_pipe_object_input.location_name = "test"
         mock_pipe_object_input.path = input_path
         mock_pipe_object_input.save.side_effect = mock_pipe_object_save
@@ -198,6 +280,7 @@ def test_load_respects_input_mtime_unsupported_os():
             input_path = cp_dir_path / "input.txt"
             input_path.touch()
             mock_pipe_object_input = Mock(spec=PipeObject)
+            mock_pipe_object_input.duplicate_of = None
             mock_pipe_object_input.location_name = "test"
             mock_pipe_object_input.path = input_path
             mock_pipe_object_input.save.side_effect = mock_pipe_object_save
@@ -217,6 +300,45 @@ def test_checkpoints_current_requires_inputs():
             cp_manager.checkpoints_current((), [cp_dir_path / "cpt.txt"])
 
 
+@patch.object(PipeObject, "__abstractmethods__", set())
+def test_save_duplicate():
+    """Test CheckpointManager saving checkpoints of a duplicate object."""
+    with get_temp_directory_path() as cp_dir_path:
+        cp_manager = CheckpointManager(cp_dir_path)
+        canonical = PipeObject(name="canonical")
+        duplicate = PipeObject(name="duplicate", duplicate_of=canonical)
+        (cp_dir_path / "canonical").mkdir()
+        (cp_dir_path / "canonical" / "cpt.txt").write_text("contents")
+        cp_manager.observe("canonical", "cpt.txt")
+
+        cp_manager.save_duplicate(duplicate)
+
+        assert (cp_dir_path / "duplicate" / "cpt.txt").read_text() == "contents"
+        assert ("duplicate", "cpt.txt") in cp_manager.observed_checkpoints
+
+        with pytest.raises(ValueError):
+            cp_manager.save_duplicate(canonical)
+
+
+@patch.object(PipeObject, "__abstractmethods__", set())
+def test_load_duplicate():
+    """Test CheckpointManager loading checkpoints of a duplicate object."""
+    with get_temp_directory_path() as cp_dir_path:
+        cp_manager = CheckpointManager(cp_dir_path)
+        canonical = PipeObject(name="canonical")
+        duplicate = PipeObject(name="duplicate", duplicate_of=canonical)
+        (cp_dir_path / "canonical").mkdir()
+        (cp_dir_path / "canonical" / "cpt.txt").write_text("contents")
+        cp_manager.observe("canonical", "cpt.txt")
+
+        outputs = cp_manager.load((duplicate,), ["cpt.txt"])
+
+        assert outputs is not None
+        assert outputs[0].path == cp_dir_path / "duplicate" / "cpt.txt"
+        assert outputs[0].path.read_text() == "contents"
+        assert cp_manager.counts["cpt.txt"]["loaded"] == 1
+
+
 def test_post_segment():
     """Test CheckpointManager wrapping segments with post-checkpointing."""
     with get_temp_directory_path() as cp_dir_path: